@@ -1,2 +1,32 @@
-from .initial_solution_finder import InitialSolutionFinder
-from .gap_branch_and_price import GAPBranchAndPrice
+import importlib
+
+# exported names are imported from their modules on first access, so that modules
+# which do not depend on Gurobi (e.g. `tree_event_log` used by `render_tree.py`) can be used without it
+_NAME_TO_MODULE = {
+    'InitialSolutionFinder': 'initial_solution_finder',
+    'GAPBranchAndPrice': 'gap_branch_and_price',
+    'Checkpoint': 'checkpoint',
+    'SearchCallback': 'search_progress',
+    'SearchProgress': 'search_progress',
+    'SolveResult': 'search_progress',
+    'SolveStatus': 'search_progress',
+    'TreeEventLog': 'tree_event_log',
+    'TreeEventType': 'tree_event_log',
+    'read_tree_events': 'tree_event_log',
+    'ColumnGenerationSettings': 'settings',
+    'PricingMethod': 'settings',
+    'MachineOrdering': 'settings',
+    'DualStabilizationMethod': 'settings',
+    'NodeDerivation': 'settings',
+    'NodeSelection': 'settings',
+    'BranchingSelection': 'settings',
+}
+
+__all__ = list(_NAME_TO_MODULE)
+
+
+def __getattr__(name: str):
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f'{__name__}.{module_name}'), name)
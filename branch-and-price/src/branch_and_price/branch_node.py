@@ -1,93 +1,229 @@
-import copy
+import collections
 import itertools
 import logging
 import math
-from collections import defaultdict
-from typing import List, Dict, Optional, Collection
+from typing import List, Dict, Optional, Tuple, Iterable, Callable
 
 import gurobipy.gurobipy as grb
-from bidict import bidict
+import numpy as np
 
 from branch_and_price.branching_rule import BranchingRule
-from branch_and_price.subproblem_builder import SubproblemBuilder
-from common import TMachineSchedule, is_integer, TAssignment, is_non_zero, has_solution
+from branch_and_price.column_pool import ColumnPool
+from branch_and_price.dual_stabilization import Duals, DualStabilization, create_dual_stabilization
+from branch_and_price.incumbent import Incumbent
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from branch_and_price.master_problem_view import MasterProblemView
+from branch_and_price.open_node import OpenNode
+from branch_and_price.pricing_result import PricingRound
+from branch_and_price.reduced_cost_fixing import ReducedCostFixing
+from branch_and_price.settings import ColumnGenerationSettings, NodeDerivation
+from common import TMachineSchedule, is_non_zero, has_solution, is_positive, is_integer_array
+from common.debug_artifact_recorder import DebugArtifactRecorder
 from input_data import GeneralAssignmentProblem
 
 
+# id of nodes which are only evaluated and never added to Branch-And-Price tree
+PROBE_NODE_ID = -1
+# column generation tails off if RMP objective value improved by less than
+# relative tolerance over given number of iterations
+TAIL_OFF_ITERATIONS = 10
+TAIL_OFF_TOLERANCE = 1e-3
+
+
 class BranchNode:
 
     next_node_id = itertools.count(start=0)
 
     def __init__(self,
                  gap_instance: GeneralAssignmentProblem,
-                 branching_rules: List[BranchingRule],
-                 machine_schedules: List[TMachineSchedule]):
+                 open_node: OpenNode,
+                 column_pool: ColumnPool,
+                 pricer: KnapsackPricer,
+                 settings: ColumnGenerationSettings,
+                 debug_artifact_recorder: DebugArtifactRecorder):
+        """
+        Builds RMP of `open_node` from columns of `column_pool` it inherited.
+        If the record contains basis of parent's RMP, columns violating branching rules
+        are kept with upper bound 0 and RMP is warm started from the basis,
+        otherwise only columns satisfying branching rules are added.
+        """
 
-        self.id = next(self.next_node_id)
+        self.id = open_node.id
 
-        self.branching_rules = branching_rules
+        self.branching_rules = list(open_node.branching_rules)
         self.gap_instance = gap_instance
-
-        self.next_machine_schedule_index = itertools.count(start=0)
-        self.machine_schedule_index = dict()
-        self.machine_schedule_index_to_variable = dict()
+        self.column_pool = column_pool
+        self.pricer = pricer
+        self.settings = settings
+        self.debug_artifact_recorder = debug_artifact_recorder
+        # dual bound of parent node is an upper bound on objective value of this node
+        self.parent_bound = open_node.parent_bound
+        self.depth = open_node.depth
+
+        # the best (the lowest) upper bound on LP relaxation of node's problem
+        # obtained from Lagrangian relaxation during column generation
+        self.lagrangian_bound = math.inf
+        # duals and bounds of subproblems for which Lagrangian bound was obtained
+        self._lagrangian_duals: Optional[Duals] = None
+        self._subproblem_bounds: Optional[np.ndarray] = None
+        self._column_generation_converged = False
+        self.tailed_off = False
+        # column generation was stopped as Lagrangian bound proved that node cannot contain
+        # integer solution better than the best one found so far
+        self.dominated = False
+
+        self.column_generation_iterations = 0
+        # number of times pricing with stabilized duals found no column with positive reduced cost
+        self.mispricings = 0
+        # number of columns not added to RMP as they were already in it
+        self.duplicate_columns = 0
+
+        # ids of columns of pool in RMP in order in which they were added, also as bitmap
+        self.column_id_to_variable: Dict[int, grb.Var] = dict()
+        self._columns = 0
+        self._view = MasterProblemView(num_machines=gap_instance.num_machines, num_tasks=gap_instance.num_tasks)
         self.machine_to_assignment_constraint: Dict = dict()
         self.task_to_assignment_constraint: Dict = dict()
+        # artificial columns added once RMP is infeasible, see `_add_artificial_columns`
+        self._artificial_variables: List[grb.Var] = []
 
         self._rmp = grb.Model(f'GAP_RMP_{self.id}')
-        self._init_model(machine_schedules)
+        self._init_model(open_node)
 
-    def _init_model(self, machine_schedules: List[TMachineSchedule]):
+    @classmethod
+    def open_root(cls, column_ids: Iterable[int]) -> OpenNode:
+        return OpenNode(id=next(cls.next_node_id),
+                        branching_rules=(),
+                        column_ids=ColumnPool.to_bitmap(column_ids),
+                        parent_bound=math.inf,
+                        depth=0)
+
+    def open_child(self, branching_rule: BranchingRule, branching_value: Optional[float] = None) -> OpenNode:
+        """
+        Creates record of child node with branching rules of this node and `branching_rule`
+        which inherits all columns of this node. If nodes are derived from parent (see `NodeDerivation`),
+        record contains basis of RMP of this node.
+        :param branching_value: value of branched on assignment in RMP solution of this node
+        """
+        return self._child_record(next(self.next_node_id), branching_rule, branching_value)
+
+    def probe_child(self, branching_rule: BranchingRule) -> OpenNode:
+        """Creates record of child node which is only evaluated (e.g. by strong branching) and never added to tree."""
+        return self._child_record(PROBE_NODE_ID, branching_rule, None)
+
+    def _child_record(self,
+                      node_id: int,
+                      branching_rule: BranchingRule,
+                      branching_value: Optional[float]) -> OpenNode:
+        variable_basis = None
+        constraint_basis = None
+        # basis of RMP with artificial columns is not a basis of RMP of child
+        if self.settings.node_derivation == NodeDerivation.DERIVE \
+                and self._rmp.status == grb.GRB.Status.OPTIMAL \
+                and not self._artificial_variables:
+            column_ids = np.array(self.get_column_ids())
+            variable_basis = np.array(self._rmp.getAttr(grb.GRB.Attr.VBasis, list(self.column_id_to_variable.values())),
+                                      dtype=np.int8)[np.argsort(column_ids)]
+            constraint_basis = np.array(self._rmp.getAttr(grb.GRB.Attr.CBasis, self._constraints()), dtype=np.int8)
+
+        return OpenNode(id=node_id,
+                        branching_rules=tuple(self.branching_rules) + (branching_rule,),
+                        column_ids=self._columns,
+                        parent_bound=self.dual_bound(),
+                        depth=self.depth + 1,
+                        branching_value=branching_value,
+                        variable_basis=variable_basis,
+                        constraint_basis=constraint_basis)
+
+    def dispose(self):
+        """Frees Gurobi model of RMP, node cannot be queried afterwards."""
+        self._rmp.dispose()
+
+    def _init_model(self, open_node: OpenNode):
         self._rmp.Params.LogToConsole = 0
         self._rmp.Params.DualReductions = 0
         self._build_constraints()
-        self._add_feasible_initial_columns(machine_schedules)
+
+        if open_node.variable_basis is None:
+            self._add_feasible_initial_columns(open_node.column_ids)
+            return
+
+        self._add_pool_columns_to_rmp(list(self.column_pool.column_ids(open_node.column_ids)))
+        self._disable_columns_violating_branching_rules()
+        self._warm_start(open_node.variable_basis, open_node.constraint_basis)
+
+    def _warm_start(self, variable_basis: np.ndarray, constraint_basis: np.ndarray):
+        self._rmp.update()
+        self._rmp.setAttr(grb.GRB.Attr.VBasis, list(self.column_id_to_variable.values()), variable_basis.tolist())
+        self._rmp.setAttr(grb.GRB.Attr.CBasis, self._constraints(), constraint_basis.tolist())
+
+    def _constraints(self) -> List[grb.Constr]:
+        return list(self.task_to_assignment_constraint.values()) \
+            + list(self.machine_to_assignment_constraint.values())
+
+    def _disable_columns_violating_branching_rules(self):
+        violating_columns = self._columns & ~self.column_pool.allowed_columns(self._columns, self.branching_rules)
+        variables = [
+            self.column_id_to_variable[column_id]
+            for column_id in self.column_pool.column_ids(violating_columns)
+        ]
+        self._rmp.setAttr(grb.GRB.Attr.UB, variables, [0.0] * len(variables))
 
     def is_feasible(self) -> bool:
-        """Returns true is solution is optimal"""
+        """
+        Returns false if node is proved infeasible, i.e. RMP has no solution or column generation
+        converged with artificial columns in RMP solution. Before convergence, RMP solution
+        with artificial columns does not prove anything, its Lagrangian bound is still valid.
+        """
         status = self._rmp.getAttr(grb.GRB.Attr.Status)
         feasible_statuses = {grb.GRB.Status.OPTIMAL, grb.GRB.Status.SUBOPTIMAL}
-        return status in feasible_statuses
+        if status not in feasible_statuses:
+            return False
+        return not (self._column_generation_converged and self._uses_artificial_columns())
 
     def has_integer_solution(self) -> bool:
         """
-        Return true if RMP solution is integer.
+        Return true if RMP solution is integer and it is a solution of GAP (no artificial column is used).
         """
-        ret = all(is_integer(var.x) for var in self._rmp.getVars())
-        return ret
+        return not self._uses_artificial_columns() and bool(np.all(is_integer_array(self._column_values())))
+
+    def _uses_artificial_columns(self) -> bool:
+        if not self._artificial_variables or not has_solution(self._rmp.status):
+            return False
+        return any(is_non_zero(value) for value in self._rmp.getAttr(grb.GRB.Attr.X, self._artificial_variables))
 
-    def machine_task_to_branch_on(self) -> Optional[TAssignment]:
+    def fractional_assignments(self) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Identifies machine and task that algorithm can further branch on.
-        To do so it checks all base columns and identifies assignment
-        of task to machine that is non-integer. However one needs to be careful
+        Identifies assignments of tasks to machines that algorithm can further branch on.
+        To do so it sums values of columns assigning task to machine and identifies
+        assignments that are non-integer. However one needs to be careful
         as columns represents different solutions to knapsack problem. So there
         could be two columns each with value 0.5 that assign task `t` to machine `m`.
-        In this case assignment of `t` to `m` would be integer and such tuple
-        will not be returned.
-        :return: Return machine_id, task_id
+        In this case assignment of `t` to `m` would be integer and it will not be returned.
+        :return: array of (machine_id, task_id) rows and array of values of the assignments
         """
-        machine_task_to_value = defaultdict(lambda: 0)
-        # improve
-        machine_schedule_index_to_variable = bidict(self.machine_schedule_index_to_variable)
-
-        for var in self._rmp.getVars():
-            if is_non_zero(var.x):
-                assignment_idx = machine_schedule_index_to_variable.inverse.get(var)
-                machine_schedule = self.machine_schedule_index[assignment_idx]
-                machine = machine_schedule[0]
-                tasks = machine_schedule[1]
-                for task in tasks:
-                    machine_task_to_value[(machine, task)] += var.x
-
-        for (machine, task), val in machine_task_to_value.items():
-            if not is_integer(val):
-                return machine, task
-
-        return None
+        assignment_values = self._view.assignment_values(self._column_values())
+        fractional_assignments = np.argwhere(~is_integer_array(assignment_values))
+        return fractional_assignments, assignment_values[fractional_assignments[:, 0], fractional_assignments[:, 1]]
+
+    def solve(self,
+              max_iterations: Optional[int] = None,
+              mip_lb: Optional[Callable[[], Optional[float]]] = None,
+              use_gap_tolerance: bool = True):
+        """
+        :param max_iterations: column generation stops after this many iterations,
+                               then only Lagrangian bound is a valid bound of node
+        :param mip_lb: returns objective value of the best integer solution found so far (None if there is none),
+                       it is called in each iteration so that solutions found meanwhile are taken into account.
+                       Column generation stops as soon as Lagrangian bound is not better than the solution.
+        :param use_gap_tolerance: column generation stops on `gap_tolerance` of settings,
+                                  solve can be called again without it to continue until convergence
+        """
+        self._solve_using_column_generation(max_iterations, mip_lb, use_gap_tolerance)
 
-    def solve(self):
-        self._solve_using_column_generation()
+    def is_converged(self) -> bool:
+        """Returns true if column generation found no column with positive reduced cost."""
+        return self._column_generation_converged
 
     def objective_value(self) -> float:
         return \
@@ -95,8 +231,88 @@ class BranchNode:
             if has_solution(self._rmp.status) \
             else float('nan')
 
-    def get_machine_schedules(self):
-        return list(self.machine_schedule_index.values())
+    def dual_bound(self) -> float:
+        """
+        Returns upper bound on objective value of any integer solution in the subtree rooted at node.
+        If column generation has not converged, RMP objective value is not a valid bound,
+        but Lagrangian bound is.
+        """
+        return min(self.lagrangian_bound, self.objective_value()) \
+            if self._column_generation_converged \
+            else self.lagrangian_bound
+
+    def relative_gap(self) -> float:
+        """Returns relative gap between RMP objective value and Lagrangian bound."""
+        if math.isinf(self.lagrangian_bound) or not has_solution(self._rmp.status):
+            return math.inf
+        return (self.lagrangian_bound - self.objective_value()) / max(abs(self.lagrangian_bound), 1e-10)
+
+    def fix_assignments_by_reduced_cost(self, mip_lb: float) -> List[BranchingRule]:
+        """
+        Forbids assignments of tasks to machines which cannot be part of integer solution
+        better than `mip_lb` by Lagrangian bound (see `ReducedCostFixing`). Implied branching
+        rules are added to rules of node, so they are inherited by its children.
+        :return: implied branching rules
+        """
+        if self._lagrangian_duals is None:
+            return []
+
+        implied_rules = ReducedCostFixing(self.gap_instance).implied_rules(lagrangian_bound=self.lagrangian_bound,
+                                                                           duals=self._lagrangian_duals,
+                                                                           subproblem_bounds=self._subproblem_bounds,
+                                                                           branching_rules=self.branching_rules,
+                                                                           mip_lb=mip_lb)
+        self.branching_rules.extend(implied_rules)
+        return implied_rules
+
+    def is_forbidden(self, machine: int, task: int) -> bool:
+        """Returns true if branching rules of node forbid assigning task to machine."""
+        return any(br.task == task and (br.machine == machine) != br.assigned for br in self.branching_rules)
+
+    def restricted_master_mip(self, time_limit: float, mip_lb: Optional[float]) -> Optional[Incumbent]:
+        """
+        Solves copy of RMP with binary columns under time limit, columns disabled
+        by branching rules and artificial columns are disabled. Solution is also a solution of GAP.
+        :param mip_lb: only solutions with better objective value are looked for
+        :return: the best solution found or None
+        """
+        mip = self._rmp.copy()
+        try:
+            mip.Params.LogToConsole = 0
+            mip.Params.TimeLimit = time_limit
+            if mip_lb is not None:
+                mip.Params.Cutoff = mip_lb
+
+            mip_variables = mip.getVars()
+            artificial_variables = [mip_variables[variable.index] for variable in self._artificial_variables]
+            mip.setAttr(grb.GRB.Attr.UB, artificial_variables, [0.0] * len(artificial_variables))
+            variables = [mip_variables[variable.index] for variable in self.column_id_to_variable.values()]
+            mip.setAttr(grb.GRB.Attr.VType, variables, [grb.GRB.BINARY] * len(variables))
+            mip.optimize()
+
+            if mip.SolCount == 0:
+                return None
+
+            column_ids = self.get_column_ids()
+            values = np.array(mip.getAttr(grb.GRB.Attr.X, variables))
+            machine_schedules = tuple(self.column_pool.column(column_ids[position])
+                                      for position in np.flatnonzero(values > 0.5))
+            return Incumbent(node_id=self.id, objective_value=mip.ObjVal, machine_schedules=machine_schedules)
+        finally:
+            mip.dispose()
+
+    def _column_values(self) -> np.ndarray:
+        """Returns values of columns in RMP solution in order in which columns were added."""
+        variables = list(self.column_id_to_variable.values())
+        if not variables:
+            return np.zeros(0)
+        return np.array(self._rmp.getAttr(grb.GRB.Attr.X, variables))
+
+    def get_column_ids(self) -> List[int]:
+        return list(self.column_id_to_variable.keys())
+
+    def get_machine_schedules(self) -> List[TMachineSchedule]:
+        return [self.column_pool.column(column_id) for column_id in self.column_id_to_variable]
 
     def report_solution(self):
         obj_val = self.objective_value()
@@ -104,48 +320,53 @@ class BranchNode:
         logging.info(f"** Solution to RMP on node {self.id}! **")
         logging.info("Objective value: %f", obj_val)
 
-        for var in self._rmp.getVars():
-            if is_non_zero(var.x):
-                logging.info(f'{var.VarName} \t:{var.X}')
+        variables = self._rmp.getVars()
+        values = self._rmp.getAttr(grb.GRB.Attr.X, variables)
+        names = self._rmp.getAttr(grb.GRB.Attr.VarName, variables)
+        for name, value in zip(names, values):
+            if is_non_zero(value):
+                logging.info(f'{name} \t:{value}')
 
         logging.info('')
 
-    def report_integer_solution(self):
-        obj_val = self.objective_value()
-
-        logging.info(f"** Integral solution to RMP on node {self.id}! **")
-        logging.info("Objective value: %f", obj_val)
-
-        machine_schedule_index_to_variable = bidict(self.machine_schedule_index_to_variable)
-        machine_to_tasks: Dict[int, Collection[int]] = defaultdict(set)
-        for var in self._rmp.getVars():
-            if is_non_zero(var.x):
-                assignment_idx = machine_schedule_index_to_variable.inverse.get(var)
-                machine_schedule = self.machine_schedule_index[assignment_idx]
-                machine_id = machine_schedule[0]
-                tasks = machine_schedule[1]
-                machine_to_tasks[machine_id] = tasks
-
-        logging.info("Machine -> Set of tasks")
-
-        for machine in sorted(machine_to_tasks):
-            tasks = machine_to_tasks[machine]
-            logging.info(f'{machine}\t{" ".join([str(task) for task in tasks])}')
-
-        logging.info('')
+    def incumbent(self) -> Incumbent:
+        """Returns RMP solution as solution of GAP, RMP solution must be integer."""
+        column_ids = self.get_column_ids()
+        machine_schedules = tuple(
+            self.column_pool.column(column_ids[position])
+            for position in np.flatnonzero(is_non_zero(self._column_values()))
+        )
+        return Incumbent(node_id=self.id, objective_value=self.objective_value(), machine_schedules=machine_schedules)
 
-    def _solve_using_column_generation(self):
+    def _solve_using_column_generation(self,
+                                       max_iterations: Optional[int],
+                                       mip_lb: Optional[Callable[[], Optional[float]]],
+                                       use_gap_tolerance: bool):
         logging.info("[CG] Solving GAP using column generation")
 
         self._rmp.setAttr(grb.GRB.Attr.ModelSense, grb.GRB.MAXIMIZE)
 
-        itr_cnt = itertools.count(start=1)
+        stabilization = create_dual_stabilization(settings=self.settings,
+                                                  num_tasks=self.gap_instance.num_tasks,
+                                                  rmp=self._rmp,
+                                                  task_to_assignment_constraint=self.task_to_assignment_constraint)
+
+        # iterations continue numbering of previous solve of node
+        itr_cnt = itertools.count(start=self.column_generation_iterations + 1)
         itr_with_no_progress_cnt = 0
 
         previous_itr_objective_value = math.nan
+        self._column_generation_converged = False
+        # under partial pricing only complete pricing rounds count as iterations with no progress
+        pricing_round_complete = True
+        # all machines are priced exactly if previous round added no column to RMP, e.g. heuristic
+        # or partial pricing returned only columns already in RMP, otherwise the same round repeats
+        complete_pricing = False
+        objective_values = collections.deque(maxlen=TAIL_OFF_ITERATIONS + 1)
 
         while True:
             col_gen_itr = next(itr_cnt)
+            self.column_generation_iterations = col_gen_itr
             logging.debug("[CG] Column generation iteration ... {}".format(col_gen_itr))
             if col_gen_itr % 200 == 0:
                 logging.info("[CG] Column generation iteration %d on node %d", col_gen_itr, self.id)
@@ -153,11 +374,14 @@ class BranchNode:
 
             # solve RMP
             self._rmp.update()
-            self._rmp.write(self._rmp.ModelName + '.lp')
+            self.debug_artifact_recorder.record(self._rmp,
+                                                f'{self._rmp.ModelName}_{col_gen_itr}',
+                                                node_id=self.id,
+                                                itr_cnt=col_gen_itr)
             self._rmp.optimize()
 
             # early stop due to no progress
-            if math.isclose(previous_itr_objective_value, self.objective_value()):
+            if pricing_round_complete and math.isclose(previous_itr_objective_value, self.objective_value()):
                 itr_with_no_progress_cnt += 1
                 if itr_with_no_progress_cnt > 50:
                     logging.info("[CG] Stopping due to no progress."
@@ -168,19 +392,68 @@ class BranchNode:
 
             if has_solution(self._rmp.status):
                 previous_itr_objective_value = self.objective_value()
+                objective_values.append(previous_itr_objective_value)
+                if len(objective_values) == objective_values.maxlen \
+                        and objective_values[-1] - objective_values[0] \
+                        <= TAIL_OFF_TOLERANCE * max(abs(objective_values[-1]), 1.0):
+                    self.tailed_off = True
+
+            if self._rmp.status == grb.GRB.Status.INFEASIBLE and not self._artificial_variables:
+                # inherited columns might not cover any solution satisfying branching rules,
+                # pricing continues with duals of RMP with artificial columns
+                logging.info("[CG] RMP of node %d is infeasible, artificial columns are added.", self.id)
+                self._add_artificial_columns()
+                continue
 
-            columns_added = self._solve_knapsack_subproblems(col_gen_itr)
-            if not columns_added:
+            rmp_duals = self._rmp_duals()
+            if rmp_duals is None:
                 break
 
-    def _solve_knapsack_subproblems(self, itr_cnt) -> bool:
-        """
-        Solves sub-problems (knapsack) in order to find columns
-        with positive reduced cost or determine
-        that existing solution is optimal.
-        :return: True if at least one column was added.
-        """
+            stabilization.start_iteration()
+            machine_schedules, pricing_round_complete = self._solve_knapsack_subproblems(col_gen_itr,
+                                                                                         rmp_duals,
+                                                                                         stabilization,
+                                                                                         complete_pricing)
+
+            # heuristic columns might have no positive reduced cost with respect to duals of RMP
+            if not machine_schedules and not pricing_round_complete:
+                complete_pricing = True
+                continue
+
+            # pricing round stops early only after finding improving columns,
+            # so no such columns means that all machines were priced
+            if not machine_schedules:
+                if stabilization.is_converged():
+                    self._column_generation_converged = True
+                    break
+                continue
+
+            best_objective_value = mip_lb() if mip_lb is not None else None
+            if best_objective_value is not None and self.lagrangian_bound <= best_objective_value:
+                logging.info("[CG] Stopping as Lagrangian bound %.1f is not better than the best integer solution %.1f. "
+                             "Iteration %d on node %d.",
+                             self.lagrangian_bound, best_objective_value, col_gen_itr, self.id)
+                self.dominated = True
+                break
+
+            gap_tolerance = self.settings.gap_tolerance
+            if use_gap_tolerance \
+                    and gap_tolerance is not None \
+                    and not stabilization.modifies_rmp() \
+                    and self.relative_gap() <= gap_tolerance:
+                logging.info("[CG] Stopping as relative gap %.2e to Lagrangian bound %.1f is below tolerance. "
+                             "Iteration %d on node %d.",
+                             self.relative_gap(), self.lagrangian_bound, col_gen_itr, self.id)
+                break
+
+            if max_iterations is not None and col_gen_itr >= max_iterations:
+                break
 
+            complete_pricing = self._add_columns_to_rmp(machine_schedules) == 0
+
+        stabilization.finish()
+
+    def _rmp_duals(self) -> Optional[Duals]:
         try:
             # obtain duals associated with tasks, solution might be infeasible
             # but duals will be returned
@@ -188,36 +461,78 @@ class BranchNode:
             machine_duals = [row.Pi for _, row in self.machine_to_assignment_constraint.items()]
         except AttributeError:
             # no dual information
-            return False
+            return None
 
-        subproblem_builder = SubproblemBuilder(gap_instance=self.gap_instance)
+        return Duals(task_duals=np.array(task_duals), machine_duals=np.array(machine_duals))
 
-        columns_added = False
-        for machine_id in range(self.gap_instance.num_machines):
-            logging.debug("[CG]  * Solving subproblem for machine {}".format(machine_id))
-
-            machine_dual = machine_duals[machine_id]
-
-            # building knapsack subproblem using dual information
-            subproblem = subproblem_builder.build(machine_id=machine_id,
-                                                  machine_dual=machine_dual,
-                                                  task_duals=task_duals,
-                                                  branching_rules=self.branching_rules)
-            subproblem._model.write(f'subproblem_{self.id}_{itr_cnt}_{machine_id}.lp')
-            subproblem.solve()
-            subproblem_objective_value = subproblem.objective_value()
-
-            # are there any columns with positive reduced cost?
-            # only those can improve RMP solution
-            if subproblem_objective_value is None or subproblem_objective_value <= 0:
-                continue
+    def _solve_knapsack_subproblems(self,
+                                    itr_cnt: int,
+                                    rmp_duals: Duals,
+                                    stabilization: DualStabilization,
+                                    complete: bool) -> Tuple[List[TMachineSchedule], bool]:
+        """
+        Solves sub-problems (knapsack) in order to find columns
+        with positive reduced cost or determine
+        that existing solution is optimal.
+        Sub-problems are solved using duals given by dual stabilization, if resulting
+        columns do not have positive reduced cost with respect to duals of RMP (mispricing),
+        sub-problems are solved again with duals moved towards duals of RMP.
+        :param complete: sub-problems of all machines are solved exactly (see `KnapsackPricer.price`)
+        :return: columns with positive reduced cost and True if sub-problems of all machines were solved.
+        """
+        while True:
+            separation_duals = stabilization.separation_duals(rmp_duals)
+            pricing_round = self.pricer.price(node_id=self.id,
+                                              itr_cnt=itr_cnt,
+                                              machine_duals=separation_duals.machine_duals,
+                                              task_duals=separation_duals.task_duals,
+                                              branching_rules=self.branching_rules,
+                                              complete=complete)
+
+            lagrangian_value = self._lagrangian_value(pricing_round, separation_duals)
+            if lagrangian_value is not None and lagrangian_value < self.lagrangian_bound:
+                self.lagrangian_bound = lagrangian_value
+                self._lagrangian_duals = separation_duals
+                self._subproblem_bounds = np.zeros(self.gap_instance.num_machines)
+                for result in pricing_round.results:
+                    self._subproblem_bounds[result.machine_id] = result.objective_bound
+
+            stabilization.update(separation_duals, rmp_duals, pricing_round, lagrangian_value)
+
+            machine_schedules = self._columns_with_positive_reduced_cost(pricing_round, rmp_duals)
+            if machine_schedules or not stabilization.on_mispricing():
+                return machine_schedules, pricing_round.complete
+
+            self.mispricings += 1
+
+    def _columns_with_positive_reduced_cost(self, pricing_round: PricingRound, duals: Duals) -> List[TMachineSchedule]:
+        machine_schedules = []
+        for pricing_result in pricing_round.results:
+            for machine_schedule in pricing_result.machine_schedules:
+                reduced_cost = machine_schedule.profit \
+                    - duals.task_duals[machine_schedule.tasks].sum() \
+                    - duals.machine_duals[machine_schedule.machine_id]
+                if is_positive(reduced_cost):
+                    machine_schedules.append(machine_schedule)
+        return machine_schedules
 
-            columns_added = True
+    @classmethod
+    def _lagrangian_value(cls, pricing_round: PricingRound, duals: Duals) -> Optional[float]:
+        """
+        For any duals, sum of duals plus sum of objective values of all subproblems
+        is an upper bound on LP relaxation of node's problem. For duals of RMP,
+        it is equal to objective value of RMP plus sum of objective values of subproblems.
+        It is valid only if all subproblems were solved to optimality.
+        """
+        if not pricing_round.complete:
+            return None
 
-            for machine_schedule in subproblem.all_solutions():
-                self._add_column_to_rmp(machine_schedule)
+        if any(result.objective_bound is None for result in pricing_round.results):
+            return None
 
-        return columns_added
+        return duals.task_duals.sum() \
+            + duals.machine_duals.sum() \
+            + sum(result.objective_bound for result in pricing_round.results)
 
     def _build_constraints(self):
         self._build_task_binding_constraints()
@@ -240,92 +555,84 @@ class BranchNode:
             c = self._rmp.addConstr(lhs == rhs, name=name)
             self.machine_to_assignment_constraint[machine_id] = c
 
-    def _add_feasible_initial_columns(self, machine_schedules: List[TMachineSchedule]):
+    def _add_artificial_columns(self):
+        """
+        Adds artificial column to each task assignment and convexity constraint, so that RMP is feasible
+        for any columns (big-M method). Objective coefficient of artificial columns is lower than
+        negated profit of any solution, so they are not used in RMP solution once columns
+        of a solution of node's problem are added. If column generation converges and artificial
+        columns are still used, node is infeasible.
+        """
+        penalty = 1.0 + float(np.abs(self.gap_instance.profits).sum())
+        for constr in self._constraints():
+            self._artificial_variables.append(self._rmp.addVar(lb=0.0,
+                                                               obj=-penalty,
+                                                               vtype=grb.GRB.CONTINUOUS,
+                                                               name=f'artificial_{constr.ConstrName}',
+                                                               column=grb.Column([1.0], [constr])))
+
+    def _add_feasible_initial_columns(self, column_ids: int):
         """
         Filters out columns violating branching rules.
         Then, adds initial columns which are base columns of all parent nodes.
+        :param column_ids: bitmap of ids of columns
         """
-        machine_schedules = self._filter_machine_schedule_based_on_branching_rule(
-            self.branching_rules,
-            machine_schedules
-        )
+        allowed_columns = self.column_pool.allowed_columns(column_ids, self.branching_rules)
 
-        for machine_schedule in machine_schedules:
-            self._add_column_to_rmp(machine_schedule)
+        self._add_pool_columns_to_rmp(list(self.column_pool.column_ids(allowed_columns)))
 
-    def _add_column_to_rmp(self, machine_schedule: TMachineSchedule):
+    def _add_columns_to_rmp(self, machine_schedules: Iterable[TMachineSchedule]) -> int:
         """
-        Adds a column that represents assigning `tasks` to `machine_id` to RMP.
-        It does so by performing two steps:
-        (1) creating variable and adding to Gurobi problem/model.
-        (2) storing information about what kind of assignment a column represents.
+        Adds columns that represent assigning `tasks` to `machine_id` to column pool and RMP.
+        Column already present in RMP (e.g. returned by pricing due to degenerate duals) is rejected.
 
-        :param machine_schedule: machine schedule
+        :param machine_schedules: machine schedules
+        :return: number of columns added to RMP
         """
-        machine_schedule_index = next(self.next_machine_schedule_index)
-        self.machine_schedule_index[machine_schedule_index] = copy.deepcopy(machine_schedule)
-
-        machine_id = machine_schedule[0]
-        tasks = machine_schedule[1]
-
-        profit = self.gap_instance.machine_schedule_profit(machine_schedule)
-        name = f"machine_{machine_id}_tasks_{'_'.join(str(task_id) for task_id in tasks)}"
-
-        c = grb.Column()
-        coeff = 1.0
-        for task in tasks:
-            constr = self.task_to_assignment_constraint[task]
-            c.addTerms(coeff, constr)
-
-        machine_constr = self.machine_to_assignment_constraint[machine_id]
-        c.addTerms(coeff, machine_constr)
-
-        var = self._rmp.addVar(
-            lb=0.0,
-            # ub=1.0,
-            obj=profit,
-            vtype=grb.GRB.CONTINUOUS,
-            name=name,
-            column=c
-        )
+        new_columns = 0
+        for machine_schedule in machine_schedules:
+            column_id = self.column_pool.add(machine_schedule)
+            if ((self._columns | new_columns) >> column_id) & 1:
+                self.duplicate_columns += 1
+                continue
+            new_columns |= 1 << column_id
 
-        self.machine_schedule_index_to_variable[machine_schedule_index] = var
+        column_ids = list(self.column_pool.column_ids(new_columns))
+        self._add_pool_columns_to_rmp(column_ids)
+        return len(column_ids)
 
-    @classmethod
-    def _filter_machine_schedule_based_on_branching_rule(cls,
-                                                         branching_rules: List[BranchingRule],
-                                                         machine_schedules: List[TMachineSchedule])\
-            -> List[TMachineSchedule]:
-        """
-        Filters machine schedules passed from parent nodes according to
-        defined branching rules where each each schedule represents assignments of
-        tasks to a machine. Column is filtered out:
-        (1) If branching rule forces task to be assigned to a machine:
-            (i) if column represents assignments of tasks to a different machine
-                and task is in the list of assigned task.
-            (ii) if column represents assignments of tasks to a machine
-                but task is missing in the list of assigned tasks.
-        (2) If branching rule forbids assigning a task to machine, and column
-            represents assignment such that a task is assigned to a machine.
+    def _add_pool_columns_to_rmp(self, column_ids: List[int]):
         """
-        if len(branching_rules) == 0:
-            return machine_schedules
-
-        tmp_cols = []
-        for machine, tasks in machine_schedules:
-            legal = True
-            for br in branching_rules:
-                if br.assigned is True and br.machine == machine and br.task not in tasks:
-                    legal = False
-                    break
-                if br.assigned is True and br.machine != machine and br.task in tasks:
-                    legal = False
-                    break
-                if br.assigned is False and br.machine == machine and br.task in tasks:
-                    legal = False
-                    break
-
-            if legal is True:
-                tmp_cols.append((machine, tasks))
+        Adds columns of column pool to RMP in a batch.
+        It does so by performing two steps:
+        (1) building coefficients of all columns, then creating variables and adding them to Gurobi problem/model.
+        (2) storing ids of columns the variables represent.
+        Variables are named only if `column_names` setting is on.
 
-        return tmp_cols
+        :param column_ids: ids of columns in column pool
+        """
+        machine_schedules = [self.column_pool.column(column_id) for column_id in column_ids]
+
+        columns = [
+            grb.Column(
+                [1.0] * (len(machine_schedule) + 1),
+                [self.task_to_assignment_constraint[task] for task in machine_schedule.tasks]
+                + [self.machine_to_assignment_constraint[machine_schedule.machine_id]]
+            )
+            for machine_schedule in machine_schedules
+        ]
+        names = [machine_schedule.name for machine_schedule in machine_schedules] \
+            if self.settings.column_names \
+            else [''] * len(machine_schedules)
+
+        for column_id, machine_schedule, column, name in zip(column_ids, machine_schedules, columns, names):
+            self.column_id_to_variable[column_id] = self._rmp.addVar(
+                lb=0.0,
+                obj=machine_schedule.profit,
+                vtype=grb.GRB.CONTINUOUS,
+                name=name,
+                column=column
+            )
+
+        self._view.add_columns(machine_schedules)
+        self._columns |= self.column_pool.to_bitmap(column_ids)
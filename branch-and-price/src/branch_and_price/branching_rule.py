@@ -1,4 +1,7 @@
 import dataclasses
+from typing import Iterable, Tuple
+
+import numpy as np
 
 
 @dataclasses.dataclass(frozen=True)
@@ -16,3 +19,24 @@ class BranchingRule:
     #  * task must be assigned to machine `machine` or whether
     #  * task must *not* be assigned to machine `machine`
     assigned: bool
+
+
+def forced_and_allowed_assignments(branching_rules: Iterable[BranchingRule],
+                                   num_machines: int,
+                                   num_tasks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns two boolean arrays of shape num_machines x num_tasks specifying
+    which assignments are forced and which are allowed by branching rules.
+    """
+    forced = np.full((num_machines, num_tasks), False)
+    allowed = np.full((num_machines, num_tasks), True)
+
+    for br in branching_rules:
+        if br.assigned is True:
+            forced[br.machine, br.task] = True
+            allowed[:, br.task] = False
+            allowed[br.machine, br.task] = True
+        else:
+            allowed[br.machine, br.task] = False
+
+    return forced, allowed
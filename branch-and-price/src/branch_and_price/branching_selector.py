@@ -0,0 +1,185 @@
+import dataclasses
+import math
+from collections import defaultdict
+from typing import Optional, Callable, Dict
+
+import numpy as np
+
+from branch_and_price.branch_node import BranchNode
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.open_node import OpenNode
+from branch_and_price.settings import ColumnGenerationSettings, BranchingSelection
+from common import TAssignment
+
+# scores of candidates are products of degradations of both children,
+# degradation is never considered lower than this so that zero degradation of one child does not hide the other
+MIN_DEGRADATION = 1e-6
+
+
+@dataclasses.dataclass(frozen=True)
+class BranchingCandidate:
+    machine: int
+    task: int
+    # value of assignment of task to machine in RMP solution
+    value: float
+
+
+class BranchingSelector:
+    """Chooses fractional assignment of task to machine which node is branched on."""
+
+    def __init__(self):
+        # number of child nodes evaluated in order to choose assignment
+        self.probes = 0
+
+    def select(self, node: BranchNode) -> Optional[BranchingCandidate]:
+        """Returns assignment to branch on or None if all assignments in RMP solution of `node` are integer."""
+        assignments, values = node.fractional_assignments()
+        if len(assignments) == 0:
+            return None
+
+        index = self._select(node, assignments, values)
+        machine, task = assignments[index]
+        return BranchingCandidate(machine=int(machine), task=int(task), value=float(values[index]))
+
+    def on_node_solved(self, open_node: OpenNode, node: BranchNode):
+        """Called once node created from `open_node` has been solved."""
+        pass
+
+    def _select(self, node: BranchNode, assignments: np.ndarray, values: np.ndarray) -> int:
+        """
+        :param assignments: array of (machine_id, task_id) rows of fractional assignments
+        :param values: values of fractional assignments
+        :return: index of selected assignment
+        """
+        raise NotImplementedError
+
+
+class FirstFractionalBranchingSelector(BranchingSelector):
+
+    def _select(self, node: BranchNode, assignments: np.ndarray, values: np.ndarray) -> int:
+        # fractional assignments are ordered by machine and task
+        return 0
+
+
+class MostFractionalBranchingSelector(BranchingSelector):
+
+    def _select(self, node: BranchNode, assignments: np.ndarray, values: np.ndarray) -> int:
+        return int(np.argmin(np.abs(values - 0.5)))
+
+
+class PseudoCostBranchingSelector(BranchingSelector):
+    """
+    Pseudo cost of assignment is the average degradation of bound of a child per unit
+    of change of value of the assignment, separately for children forbidding and forcing
+    the assignment. Degradations are observed in all nodes of the tree. Assignment
+    without observations uses average pseudo cost of all assignments.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # branching direction (assigned) -> assignment -> sum of degradations per unit and number of observations
+        self._degradation_sums: Dict[bool, Dict[TAssignment, float]] = {False: defaultdict(float),
+                                                                        True: defaultdict(float)}
+        self._observations: Dict[bool, Dict[TAssignment, int]] = {False: defaultdict(int), True: defaultdict(int)}
+
+    def on_node_solved(self, open_node: OpenNode, node: BranchNode):
+        if open_node.branching_value is None or not node.is_feasible():
+            return
+
+        branching_rule = open_node.branching_rules[-1]
+        self._observe(branching_rule, open_node.branching_value, open_node.parent_bound, node.dual_bound())
+
+    def _observe(self, branching_rule: BranchingRule, value: float, parent_bound: float, child_bound: float):
+        if math.isinf(parent_bound) or math.isinf(child_bound):
+            return
+
+        change = 1.0 - value if branching_rule.assigned else value
+        assignment = (branching_rule.machine, branching_rule.task)
+        self._degradation_sums[branching_rule.assigned][assignment] += max(parent_bound - child_bound, 0.0) / change
+        self._observations[branching_rule.assigned][assignment] += 1
+
+    def _pseudo_cost(self, assignment: TAssignment, assigned: bool) -> float:
+        observations = self._observations[assigned].get(assignment, 0)
+        if observations > 0:
+            return self._degradation_sums[assigned][assignment] / observations
+
+        total_observations = sum(self._observations[assigned].values())
+        if total_observations == 0:
+            return 1.0
+        return sum(self._degradation_sums[assigned].values()) / total_observations
+
+    def _scores(self, assignments: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Returns products of estimated degradations of children of fractional assignments."""
+        keys = [(int(machine), int(task)) for machine, task in assignments]
+        exclude_pseudo_costs = np.array([self._pseudo_cost(key, assigned=False) for key in keys])
+        include_pseudo_costs = np.array([self._pseudo_cost(key, assigned=True) for key in keys])
+        return np.maximum(exclude_pseudo_costs * values, MIN_DEGRADATION) \
+            * np.maximum(include_pseudo_costs * (1.0 - values), MIN_DEGRADATION)
+
+    def _select(self, node: BranchNode, assignments: np.ndarray, values: np.ndarray) -> int:
+        return int(np.argmax(self._scores(assignments, values)))
+
+
+class StrongBranchingSelector(PseudoCostBranchingSelector):
+    """
+    Evaluates the best candidates according to pseudo costs by solving both children
+    with few iterations of column generation and selects the candidate with the best
+    product of degradations of bounds of children. Evaluated children are temporary,
+    their RMPs are disposed right after, but degradations update pseudo costs.
+    """
+
+    def __init__(self, candidates: int, iterations: int, node_factory: Callable[[OpenNode], BranchNode]):
+        """
+        :param node_factory: builds RMP of temporary child node from its record
+        """
+        super().__init__()
+        self.candidates = candidates
+        self.iterations = iterations
+        self.node_factory = node_factory
+
+    def _select(self, node: BranchNode, assignments: np.ndarray, values: np.ndarray) -> int:
+        candidates = np.argsort(-self._scores(assignments, values), kind='stable')[:max(self.candidates, 1)]
+        if len(candidates) == 1:
+            return int(candidates[0])
+
+        parent_bound = node.dual_bound()
+        best_candidate, best_score = int(candidates[0]), -math.inf
+        for candidate in candidates:
+            machine, task = (int(index) for index in assignments[candidate])
+            exclude_degradation = self._probe(node, BranchingRule(task, machine, assigned=False),
+                                              values[candidate], parent_bound)
+            include_degradation = self._probe(node, BranchingRule(task, machine, assigned=True),
+                                              values[candidate], parent_bound)
+            score = max(exclude_degradation, MIN_DEGRADATION) * max(include_degradation, MIN_DEGRADATION)
+            if score > best_score:
+                best_candidate, best_score = int(candidate), score
+
+        return best_candidate
+
+    def _probe(self, node: BranchNode, branching_rule: BranchingRule, value: float, parent_bound: float) -> float:
+        """Returns degradation of bound of child created by `branching_rule`, infinity if child is infeasible."""
+        child = self.node_factory(node.probe_child(branching_rule))
+        try:
+            child.solve(max_iterations=self.iterations)
+            self.probes += 1
+            if not child.is_feasible():
+                return math.inf
+            child_bound = child.dual_bound()
+        finally:
+            child.dispose()
+
+        self._observe(branching_rule, value, parent_bound, child_bound)
+        return max(parent_bound - child_bound, 0.0)
+
+
+def create_branching_selector(settings: ColumnGenerationSettings,
+                              node_factory: Callable[[OpenNode], BranchNode]) -> BranchingSelector:
+    if settings.branching_selection == BranchingSelection.FIRST_FRACTIONAL:
+        return FirstFractionalBranchingSelector()
+    if settings.branching_selection == BranchingSelection.MOST_FRACTIONAL:
+        return MostFractionalBranchingSelector()
+    if settings.branching_selection == BranchingSelection.STRONG:
+        return StrongBranchingSelector(candidates=settings.strong_branching_candidates,
+                                       iterations=settings.strong_branching_iterations,
+                                       node_factory=node_factory)
+    return PseudoCostBranchingSelector()
@@ -0,0 +1,54 @@
+import dataclasses
+import gzip
+import os
+import pickle
+from typing import Tuple, Optional, Dict
+
+from branch_and_price.incumbent import Incumbent
+from branch_and_price.node_processor import PruneReason
+from branch_and_price.open_node import OpenNode
+from common import TMachineSchedule
+from input_data import GeneralAssignmentProblem
+
+
+@dataclasses.dataclass(frozen=True)
+class Checkpoint:
+    """
+    State of Branch-And-Price search from which it can be resumed. Columns are stored
+    in order of their ids in column pool, so that column ids in open nodes stay valid
+    once columns are added to an empty pool.
+    """
+
+    num_machines: int
+    num_tasks: int
+    open_nodes: Tuple[OpenNode, ...]
+    columns: Tuple[TMachineSchedule, ...]
+    incumbent: Optional[Incumbent]
+    next_node_id: int
+    processed_nodes: int
+    column_generation_iterations: int
+    mispricings: int
+    duplicate_columns: int
+    rmp_heuristic_runs: int
+    fixed_assignments: int
+    pruned_nodes: Dict[PruneReason, int]
+
+    def write(self, path: str):
+        """Writes compressed checkpoint, file is replaced atomically so that it is never left incomplete."""
+        temporary_path = f'{path}.tmp'
+        with open(temporary_path, 'wb') as file:
+            with gzip.GzipFile(fileobj=file, mode='wb') as compressed_file:
+                pickle.dump(self, compressed_file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def read(cls, path: str, gap_instance: GeneralAssignmentProblem) -> 'Checkpoint':
+        with gzip.open(path, 'rb') as compressed_file:
+            checkpoint = pickle.load(compressed_file)
+
+        if (checkpoint.num_machines, checkpoint.num_tasks) != (gap_instance.num_machines, gap_instance.num_tasks):
+            raise ValueError(f'Checkpoint {path} was written for instance with {checkpoint.num_machines} machines '
+                             f'and {checkpoint.num_tasks} tasks.')
+        return checkpoint
@@ -0,0 +1,88 @@
+from collections import defaultdict
+from typing import List, Dict, Iterable, Iterator, Tuple
+
+from branch_and_price.branching_rule import BranchingRule
+from common import TMachineSchedule
+
+
+class ColumnPool:
+    """
+    Stores columns (machine schedules) generated anywhere in Branch-And-Price tree,
+    each column is stored once and nodes refer to columns by their ids.
+    Columns are registered by hash, so adding a column that is already in pool returns its id.
+    Sets of column ids are represented as bitmaps (Python integers where bit `i` is set
+    if column with id `i` belongs to the set). Inverted indexes map machine, task and
+    assignment of task to machine to bitmaps of columns, so columns violating
+    branching rules are found using bitwise operations.
+    """
+
+    def __init__(self):
+        self._columns: List[TMachineSchedule] = []
+        self._column_to_id: Dict[TMachineSchedule, int] = dict()
+        self._machine_to_columns: Dict[int, int] = defaultdict(int)
+        self._task_to_columns: Dict[int, int] = defaultdict(int)
+        self._assignment_to_columns: Dict[Tuple[int, int], int] = defaultdict(int)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def add(self, machine_schedule: TMachineSchedule) -> int:
+        """
+        Adds column to pool and updates inverted indexes, unless the column is already in pool.
+        :return: id of column
+        """
+        column_id = self._column_to_id.get(machine_schedule)
+        if column_id is not None:
+            return column_id
+
+        column_id = len(self._columns)
+        self._column_to_id[machine_schedule] = column_id
+        machine_id = machine_schedule.machine_id
+        self._columns.append(machine_schedule)
+
+        column_bit = 1 << column_id
+        self._machine_to_columns[machine_id] |= column_bit
+        for task in machine_schedule.tasks:
+            self._task_to_columns[task] |= column_bit
+            self._assignment_to_columns[(machine_id, task)] |= column_bit
+
+        return column_id
+
+    def column(self, column_id: int) -> TMachineSchedule:
+        return self._columns[column_id]
+
+    def violating_columns(self, branching_rule: BranchingRule) -> int:
+        """
+        Returns bitmap of columns violating branching rule.
+        (1) If branching rule forces task to be assigned to a machine, columns of the machine
+            without the task and columns of other machines with the task violate it.
+        (2) If branching rule forbids assigning task to machine, columns of the machine
+            with the task violate it.
+        """
+        assignment_columns = self._assignment_to_columns.get((branching_rule.machine, branching_rule.task), 0)
+        if branching_rule.assigned is True:
+            machine_columns = self._machine_to_columns.get(branching_rule.machine, 0)
+            task_columns = self._task_to_columns.get(branching_rule.task, 0)
+            return (machine_columns | task_columns) & ~assignment_columns
+        return assignment_columns
+
+    def allowed_columns(self, columns: int, branching_rules: Iterable[BranchingRule]) -> int:
+        """Returns bitmap of columns from `columns` bitmap satisfying all branching rules."""
+        for branching_rule in branching_rules:
+            columns &= ~self.violating_columns(branching_rule)
+        return columns
+
+    @classmethod
+    def to_bitmap(cls, column_ids: Iterable[int]) -> int:
+        bitmap = 0
+        for column_id in column_ids:
+            bitmap |= 1 << column_id
+        return bitmap
+
+    @classmethod
+    def column_ids(cls, columns: int) -> Iterator[int]:
+        """Returns ids of columns in bitmap in increasing order."""
+        while columns:
+            lowest_bit = columns & -columns
+            yield lowest_bit.bit_length() - 1
+            columns ^= lowest_bit
@@ -0,0 +1,286 @@
+import dataclasses
+import logging
+import math
+from typing import Dict, List, Optional
+
+import gurobipy.gurobipy as grb
+import numpy as np
+
+from branch_and_price.pricing_result import PricingRound
+from branch_and_price.settings import ColumnGenerationSettings, DualStabilizationMethod
+from common import is_non_zero
+
+
+@dataclasses.dataclass(frozen=True)
+class Duals:
+    """Dual values of task assignment and machine convexity constraints of RMP."""
+
+    task_duals: np.ndarray
+    machine_duals: np.ndarray
+
+
+class DualStabilization:
+    """
+    Column generation without dual stabilization - subproblems are
+    always priced using duals of RMP. Base class of stabilization methods.
+    """
+
+    def start_iteration(self):
+        """Called once RMP has been solved in a new column generation iteration."""
+        pass
+
+    def separation_duals(self, rmp_duals: Duals) -> Duals:
+        """Returns duals used to price subproblems."""
+        return rmp_duals
+
+    def update(self, separation_duals: Duals, rmp_duals: Duals, pricing_round: PricingRound,
+               lagrangian_value: Optional[float]):
+        """
+        Called after subproblems were priced using `separation_duals`.
+        :param lagrangian_value: value of Lagrangian relaxation for `separation_duals`,
+                                 None if it is unknown
+        """
+        pass
+
+    def on_mispricing(self) -> bool:
+        """
+        Called if pricing found no column with positive reduced cost with respect to duals of RMP.
+        :return: True if separation duals differed from duals of RMP and pricing should be repeated
+                 with separation duals moved towards duals of RMP.
+        """
+        return False
+
+    def is_converged(self) -> bool:
+        """
+        Called if there is no column with positive reduced cost with respect to duals of RMP.
+        :return: True if RMP solution is optimal for LP relaxation of node's problem,
+                 otherwise RMP has to be re-solved.
+        """
+        return True
+
+    def modifies_rmp(self) -> bool:
+        """Returns true if RMP contains stabilization variables and its objective value is perturbed."""
+        return False
+
+    def finish(self):
+        """Called once column generation is finished. Restores RMP to its original form."""
+        pass
+
+
+class WentgesSmoothing(DualStabilization):
+    """
+    Subproblems are priced using convex combination of stability center (duals with
+    the best Lagrangian bound so far) and duals of RMP: alpha * center + (1 - alpha) * rmp duals.
+    Weight alpha is adapted using direction of subgradient of Lagrangian function at separation point.
+    In case of mispricing, separation point is moved towards duals of RMP until they are equal.
+    """
+
+    ALPHA_STEP = 0.1
+
+    def __init__(self, alpha: float, num_tasks: int):
+        self.alpha = alpha
+        self.num_tasks = num_tasks
+
+        self._center: Optional[Duals] = None
+        self._center_lagrangian_value = math.inf
+        self._mispricings_in_iteration = 0
+
+    def start_iteration(self):
+        self._mispricings_in_iteration = 0
+
+    def separation_duals(self, rmp_duals: Duals) -> Duals:
+        alpha = self._current_alpha()
+        if self._center is None or alpha <= 0.0:
+            return rmp_duals
+
+        return Duals(
+            task_duals=alpha * self._center.task_duals + (1.0 - alpha) * rmp_duals.task_duals,
+            machine_duals=alpha * self._center.machine_duals + (1.0 - alpha) * rmp_duals.machine_duals
+        )
+
+    def update(self, separation_duals: Duals, rmp_duals: Duals, pricing_round: PricingRound,
+               lagrangian_value: Optional[float]):
+        if lagrangian_value is None:
+            return
+
+        if self._center is not None and self._mispricings_in_iteration == 0:
+            self._adapt_alpha(separation_duals, rmp_duals, pricing_round)
+
+        if lagrangian_value < self._center_lagrangian_value:
+            self._center = separation_duals
+            self._center_lagrangian_value = lagrangian_value
+
+    def on_mispricing(self) -> bool:
+        if self._center is None or self._current_alpha() <= 0.0:
+            return False
+
+        self._mispricings_in_iteration += 1
+        return True
+
+    def _current_alpha(self) -> float:
+        """
+        Weight of stability center decreased with each mispricing
+        in current iteration, it reaches 0 after finite number of mispricings.
+        """
+        return max(0.0, 1.0 - (self._mispricings_in_iteration + 1) * (1.0 - self.alpha))
+
+    def _adapt_alpha(self, separation_duals: Duals, rmp_duals: Duals, pricing_round: PricingRound):
+        """
+        Lagrangian function is minimized over duals. If its subgradient at separation point
+        shows that function increases in direction from stability center to duals of RMP,
+        separation point is too close to duals of RMP and alpha is increased,
+        otherwise alpha is decreased. Subproblems that returned no column are assumed
+        to assign no task.
+        """
+        assigned_cnt = np.zeros(self.num_tasks)
+        for result in pricing_round.results:
+            if result.machine_schedules:
+                assigned_cnt[result.machine_schedules[0].tasks] += 1
+
+        subgradient = 1.0 - assigned_cnt
+        direction = rmp_duals.task_duals - self._center.task_duals
+
+        if np.dot(subgradient, direction) > 0:
+            self.alpha = self.alpha + (1.0 - self.alpha) * self.ALPHA_STEP
+        else:
+            self.alpha = max(0.0, self.alpha - self.ALPHA_STEP)
+
+
+class PenaltyDualStabilization(DualStabilization):
+    """
+    du Merle stabilization. For each task assignment constraint two variables are added to RMP,
+    they penalize duals outside of box [center - width, center + width] around stability center.
+    Penalty variables are bounded by `penalty_bound`, with infinite bound it becomes boxstep method.
+    Stability center is moved to duals of RMP whenever they improve Lagrangian bound.
+    If no column with positive reduced cost exists but penalty variables are non-zero,
+    box and penalty bound are shrunk. After `max_updates` such updates penalty variables are fixed to 0.
+    """
+
+    SHRINK_FACTOR = 0.5
+
+    def __init__(self,
+                 rmp: grb.Model,
+                 task_to_assignment_constraint: Dict,
+                 box_width: float,
+                 penalty_bound: float,
+                 max_updates: int):
+        self._rmp = rmp
+        self._task_to_assignment_constraint = task_to_assignment_constraint
+        self.box_width = box_width
+        self.penalty_bound = penalty_bound
+        self.max_updates = max_updates
+
+        self._center: Optional[Duals] = None
+        self._center_lagrangian_value = math.inf
+        self._updates = 0
+        # whether any penalty variable is non-zero in current RMP solution
+        self._penalized = False
+
+        # surplus variables bound duals from below and slack variables from above
+        self._surplus_variables: List[grb.Var] = []
+        self._slack_variables: List[grb.Var] = []
+
+    def start_iteration(self):
+        if not self._surplus_variables:
+            self._penalized = False
+            return
+
+        values = self._rmp.getAttr(grb.GRB.Attr.X, self._surplus_variables + self._slack_variables)
+        self._penalized = any(is_non_zero(value) for value in values)
+
+    def update(self, separation_duals: Duals, rmp_duals: Duals, pricing_round: PricingRound,
+               lagrangian_value: Optional[float]):
+        if lagrangian_value is None or lagrangian_value >= self._center_lagrangian_value:
+            return
+
+        self._center_lagrangian_value = lagrangian_value
+        self._move_center(rmp_duals)
+
+    def is_converged(self) -> bool:
+        if not self._penalized:
+            return True
+
+        self._updates += 1
+        if self._updates > self.max_updates:
+            logging.debug("[CG] Disabling penalty stabilization after %d updates", self._updates)
+            self._set_penalty_bound(0.0)
+            return False
+
+        self.box_width *= self.SHRINK_FACTOR
+        self.penalty_bound *= self.SHRINK_FACTOR
+        self._set_penalty_bound(self.penalty_bound)
+        return False
+
+    def modifies_rmp(self) -> bool:
+        return bool(self._surplus_variables)
+
+    def finish(self):
+        if not self._surplus_variables:
+            return
+
+        self._rmp.remove(self._surplus_variables + self._slack_variables)
+        self._surplus_variables = []
+        self._slack_variables = []
+        self._rmp.update()
+        self._rmp.optimize()
+
+    def _move_center(self, duals: Duals):
+        self._center = duals
+
+        if not self._surplus_variables:
+            self._add_penalty_variables()
+            return
+
+        self._update_box()
+
+    def _box(self):
+        lower = self._center.task_duals - self.box_width
+        upper = self._center.task_duals + self.box_width
+        # in maximization problem variable with coefficient 1 in a row and objective c
+        # can be positive only if dual of a row is below c and the other way round
+        return list(lower), list(-upper)
+
+    def _add_penalty_variables(self):
+        surplus_objective, slack_objective = self._box()
+        for task_id, constr in self._task_to_assignment_constraint.items():
+            surplus = self._rmp.addVar(lb=0.0,
+                                       ub=self.penalty_bound,
+                                       obj=surplus_objective[task_id],
+                                       vtype=grb.GRB.CONTINUOUS,
+                                       name=f'stabilization_surplus_{task_id}',
+                                       column=grb.Column([1.0], [constr]))
+            slack = self._rmp.addVar(lb=0.0,
+                                     ub=self.penalty_bound,
+                                     obj=slack_objective[task_id],
+                                     vtype=grb.GRB.CONTINUOUS,
+                                     name=f'stabilization_slack_{task_id}',
+                                     column=grb.Column([-1.0], [constr]))
+            self._surplus_variables.append(surplus)
+            self._slack_variables.append(slack)
+
+    def _update_box(self):
+        surplus_objective, slack_objective = self._box()
+        self._rmp.setAttr(grb.GRB.Attr.Obj, self._surplus_variables, surplus_objective)
+        self._rmp.setAttr(grb.GRB.Attr.Obj, self._slack_variables, slack_objective)
+
+    def _set_penalty_bound(self, penalty_bound: float):
+        variables = self._surplus_variables + self._slack_variables
+        self._rmp.setAttr(grb.GRB.Attr.UB, variables, [penalty_bound] * len(variables))
+        self._update_box()
+
+
+def create_dual_stabilization(settings: ColumnGenerationSettings,
+                              num_tasks: int,
+                              rmp: grb.Model,
+                              task_to_assignment_constraint: Dict) -> DualStabilization:
+    if settings.dual_stabilization == DualStabilizationMethod.WENTGES:
+        return WentgesSmoothing(alpha=settings.smoothing_alpha, num_tasks=num_tasks)
+
+    if settings.dual_stabilization == DualStabilizationMethod.PENALTY:
+        return PenaltyDualStabilization(rmp=rmp,
+                                        task_to_assignment_constraint=task_to_assignment_constraint,
+                                        box_width=settings.penalty_box_width,
+                                        penalty_bound=settings.penalty_bound,
+                                        max_updates=settings.max_penalty_updates)
+
+    return DualStabilization()
@@ -0,0 +1,147 @@
+from typing import Optional, List
+
+import numpy as np
+
+from common import TMachineSchedule, is_positive, select_diverse_machine_schedules
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from input_data import GeneralAssignmentProblem
+
+
+class DynamicProgrammingSubproblem:
+    """
+    Knapsack problem with integer weights solved using dynamic programming.
+    Table of best values is indexed by capacity and it is updated
+    for all capacities at once for each item. For each capacity
+    the table keeps values of `num_solutions` best distinct sets of items,
+    so apart from optimal solution it provides also next best solutions.
+    """
+
+    def __init__(self,
+                 gap_instance: GeneralAssignmentProblem,
+                 machine_id: int,
+                 task_profits: np.ndarray,
+                 task_weights: np.ndarray,
+                 capacity: int,
+                 objective_constant: float,
+                 forced_tasks: np.ndarray,
+                 free_tasks: np.ndarray,
+                 num_solutions: int = 1):
+        """
+        :param gap_instance: instance machine schedules are created for
+        :param machine_id: machine id
+        :param task_profits: profit of assigning each task to machine (reduced by task duals)
+        :param task_weights: integer weight of each task
+        :param capacity: integer capacity of machine
+        :param objective_constant: constant added to objective value
+        :param forced_tasks: ids of tasks that must be assigned to machine
+        :param free_tasks: ids of tasks that might be assigned to machine
+        :param num_solutions: number of best solutions to find
+        """
+        self.gap_instance = gap_instance
+        self.machine_id = machine_id
+        self._task_profits = task_profits
+        self._task_weights = task_weights
+        self._capacity = capacity
+        self._objective_constant = objective_constant
+        self._forced_tasks = forced_tasks
+        self._free_tasks = free_tasks
+        self._num_solutions = num_solutions
+
+        self._objective_value = None
+        # solutions sorted by decreasing objective value
+        self._solutions: List[TMachineSchedule] = []
+        self._solution_objective_values: List[float] = []
+
+    def solve(self):
+        self._objective_value = None
+        self._solutions = []
+        self._solution_objective_values = []
+
+        remaining_capacity = self._capacity - self._task_weights[self._forced_tasks].sum()
+        if remaining_capacity < 0:
+            # tasks forced by branching rules do not fit into machine
+            return
+
+        # tasks with non-positive profit never improve objective value
+        items = self._free_tasks[self._task_profits[self._free_tasks] > 0]
+        item_profits = self._task_profits[items]
+        item_weights = self._task_weights[items]
+
+        num_solutions = self._num_solutions
+        # best_values[c, r] - value of r-th best set of items with weight at most `c`,
+        # initially the only set is the empty one
+        best_values = np.full((remaining_capacity + 1, num_solutions), -np.inf)
+        best_values[:, 0] = 0.0
+        # take[i, c, r] - whether item `i` belongs to r-th best set for capacity `c` using items up to `i`
+        # source_rank[i, c, r] - rank of the set it was built from before considering item `i`
+        take = np.full((len(items), remaining_capacity + 1, num_solutions), False)
+        source_rank = np.tile(np.arange(num_solutions, dtype=np.uint16), (len(items), remaining_capacity + 1, 1))
+
+        for i, (profit, weight) in enumerate(zip(item_profits, item_weights)):
+            if weight > remaining_capacity:
+                continue
+
+            # sets without item followed by sets with item
+            candidates = np.concatenate([
+                best_values[weight:],
+                best_values[:remaining_capacity + 1 - weight] + profit
+            ], axis=1)
+            order = np.argsort(-candidates, axis=1, kind='stable')[:, :num_solutions]
+
+            take[i, weight:] = order >= num_solutions
+            source_rank[i, weight:] = order % num_solutions
+            best_values[weight:] = np.take_along_axis(candidates, order, axis=1)
+
+        forced_profit = self._task_profits[self._forced_tasks].sum()
+        for rank in range(num_solutions):
+            value = best_values[remaining_capacity, rank]
+            if value == -np.inf:
+                break
+
+            tasks = list(self._forced_tasks)
+            capacity = remaining_capacity
+            set_rank = rank
+            for i in reversed(range(len(items))):
+                taken = take[i, capacity, set_rank]
+                set_rank = source_rank[i, capacity, set_rank]
+                if taken:
+                    tasks.append(items[i])
+                    capacity -= item_weights[i]
+
+            self._solutions.append(self.gap_instance.machine_schedule(self.machine_id, tasks))
+            self._solution_objective_values.append(value + forced_profit + self._objective_constant)
+
+        self._objective_value = self._solution_objective_values[0]
+
+    def objective_value(self) -> Optional[float]:
+        return self._objective_value
+
+    def objective_bound(self) -> Optional[float]:
+        """Dynamic programming solves subproblem exactly, so bound is equal to objective value."""
+        return self._objective_value
+
+    def solution(self) -> Optional[TMachineSchedule]:
+        if not self._solutions:
+            return None
+        return self._solutions[0]
+
+    def all_solutions(self) -> List[TMachineSchedule]:
+        machine_schedule = self.solution()
+        return [machine_schedule] if machine_schedule is not None else []
+
+    def best_solutions(self, max_count: int, min_hamming_distance: int) -> List[TMachineSchedule]:
+        """
+        Returns at most `max_count` solutions with positive objective value
+        (columns with positive reduced cost) which differ pairwise in at least `min_hamming_distance` tasks.
+        Solutions are considered from the best one.
+        """
+        improving_solutions = (
+            machine_schedule
+            for machine_schedule, objective_value in zip(self._solutions, self._solution_objective_values)
+            if is_positive(objective_value)
+        )
+        return select_diverse_machine_schedules(improving_solutions, max_count, min_hamming_distance)
+
+    def write(self, recorder: DebugArtifactRecorder, name: str, node_id: int, itr_cnt: int):
+        """There is no model behind dynamic programming, so nothing is recorded."""
+        pass
@@ -0,0 +1,67 @@
+from typing import List, Union, Optional
+
+import numpy as np
+
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.dynamic_programming_subproblem import DynamicProgrammingSubproblem
+from branch_and_price.subproblem import Subproblem
+from branch_and_price.subproblem_builder import SubproblemBuilder
+from input_data import GeneralAssignmentProblem
+
+
+class DynamicProgrammingSubproblemBuilder:
+    """
+    Builds knapsack subproblems solved using dynamic programming.
+    Dynamic programming requires integer weights, hence for machines
+    with non-integer weights it falls back to subproblems solved by Gurobi.
+    """
+
+    def __init__(self,
+                 gap_instance: GeneralAssignmentProblem,
+                 isolated_environments: bool = False,
+                 solution_pool_size: Optional[int] = None):
+        """
+        :param solution_pool_size: if given, this many best solutions of each subproblem are searched for
+        """
+        self._gap_instance = gap_instance
+        self._fallback_builder = SubproblemBuilder(gap_instance=gap_instance,
+                                                   isolated_environments=isolated_environments,
+                                                   solution_pool_size=solution_pool_size)
+        self._solution_pool_size = solution_pool_size
+        self._has_integer_weights = np.all(np.mod(gap_instance.weights, 1) == 0, axis=1)
+        self._task_ids = np.arange(gap_instance.num_tasks)
+
+    def build(self,
+              machine_id: int,
+              machine_dual: float,
+              task_duals: List[float],
+              branching_rules: List[BranchingRule]) -> Union[DynamicProgrammingSubproblem, Subproblem]:
+
+        if not self._has_integer_weights[machine_id]:
+            return self._fallback_builder.build(machine_id=machine_id,
+                                                machine_dual=machine_dual,
+                                                task_duals=task_duals,
+                                                branching_rules=branching_rules)
+
+        bounds = np.array([
+            SubproblemBuilder._lower_and_upper_bound(machine_id, task_id, branching_rules)
+            for task_id in range(self._gap_instance.num_tasks)
+        ]).reshape(-1, 2)
+        lb = bounds[:, 0]
+        ub = bounds[:, 1]
+
+        return DynamicProgrammingSubproblem(
+            gap_instance=self._gap_instance,
+            machine_id=machine_id,
+            task_profits=self._gap_instance.profits[machine_id] - np.asarray(task_duals),
+            task_weights=self._gap_instance.weights[machine_id].astype(int),
+            capacity=int(np.floor(self._gap_instance.machine_capacity(machine_id))),
+            objective_constant=-machine_dual,
+            forced_tasks=self._task_ids[lb == 1],
+            free_tasks=self._task_ids[(lb == 0) & (ub == 1)],
+            num_solutions=self._solution_pool_size or 1
+        )
+
+    def close(self):
+        """Disposes models of machines with non-integer weights, see `SubproblemBuilder.close`."""
+        self._fallback_builder.close()
@@ -1,123 +1,330 @@
-import copy
+import collections
+import dataclasses
+import itertools
 import logging
 import math
-from typing import Optional, Tuple
-import networkx as nx
-from matplotlib import pyplot
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED, Future
+from typing import Optional, Dict, Counter, List, Sequence, Collection
 
 from branch_and_price.branch_node import BranchNode
-from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.checkpoint import Checkpoint
+from branch_and_price.column_pool import ColumnPool
+from branch_and_price.incumbent import Incumbent
 from branch_and_price.initial_solution_finder import InitialSolutionFinder
-from common.queue import Queue
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from branch_and_price.node_processor import NodeProcessor, NodeOutcome, PruneReason
+from branch_and_price.node_selector import create_node_selector, NodeSelector
+from branch_and_price.open_node import OpenNode
+from branch_and_price.parallel_tree_search import NodeTask, init_tree_search_worker, solve_node
+from branch_and_price.search_progress import SearchCallback, SearchProgress, SolveResult, SolveStatus
+from branch_and_price.settings import ColumnGenerationSettings
+from branch_and_price.tree_event_log import TreeEventLog
+from common.debug_artifact_recorder import DebugArtifactRecorder
 from input_data import GeneralAssignmentProblem
 
 
 class GAPBranchAndPrice:
 
-    def __init__(self, gap_instance: GeneralAssignmentProblem):
+    def __init__(self,
+                 gap_instance: GeneralAssignmentProblem,
+                 settings: Optional[ColumnGenerationSettings] = None,
+                 debug_artifact_recorder: Optional[DebugArtifactRecorder] = None,
+                 callbacks: Sequence[SearchCallback] = ()):
+        """
+        :param settings: default settings are used if it is None
+        :param debug_artifact_recorder: models are not recorded if it is None
+        """
+        if settings is None:
+            settings = ColumnGenerationSettings()
+        if debug_artifact_recorder is None:
+            debug_artifact_recorder = DebugArtifactRecorder()
         self.gap_instance = gap_instance
-        self.tree = nx.DiGraph()
+        self.settings = settings
+        self.debug_artifact_recorder = debug_artifact_recorder
+        self.pricer = KnapsackPricer(gap_instance=gap_instance,
+                                     settings=settings,
+                                     debug_artifact_recorder=debug_artifact_recorder)
+        self.column_pool = ColumnPool()
+        self.node_processor = NodeProcessor(gap_instance=gap_instance,
+                                            column_pool=self.column_pool,
+                                            pricer=self.pricer,
+                                            settings=settings,
+                                            debug_artifact_recorder=debug_artifact_recorder)
+        self.event_log = TreeEventLog()
+        self.callbacks = list(callbacks)
 
-    def solve(self):
-        queue: Queue[BranchNode] = Queue([
-            self._create_root_node()
-        ])
+        self.incumbent: Optional[Incumbent] = None
+        self.processed_nodes = 0
+        self.column_generation_iterations = 0
+        self.mispricings = 0
+        self.duplicate_columns = 0
+        self.rmp_heuristic_runs = 0
+        self.fixed_assignments = 0
+        self.pruned_nodes: Counter[PruneReason] = collections.Counter()
+        self._last_checkpoint_time = time.monotonic()
+        self._start_time = time.monotonic()
+        # the best dual bound reported to callbacks
+        self._reported_dual_bound = math.inf
 
-        best_solution_node = None
-        mip_lb = None
+    def solve(self, checkpoint: Optional[Checkpoint] = None) -> SolveResult:
+        """
+        Searches Branch-And-Price tree until all open nodes are processed or pruned
+        or one of limits in settings is reached.
+        :param checkpoint: search is resumed from checkpoint if it is given
+        """
+        self._start_time = time.monotonic()
+        # events of resumed search are appended to log of the interrupted one
+        self.event_log = TreeEventLog(self.settings.tree_event_log_path, append=checkpoint is not None)
+        node_selector = create_node_selector(self.settings.node_selection)
+        if checkpoint is None:
+            node_selector.push([self._open_root_node()])
+        else:
+            self._resume(checkpoint, node_selector)
 
-        while not queue.is_empty():
+        try:
+            if self.settings.tree_search_workers > 1:
+                self._search_in_parallel(node_selector)
+            else:
+                self._search(node_selector)
+        finally:
+            self.pricer.close()
+            self.event_log.close()
 
-            current_node = queue.pop()
+        status = self._limit_status(node_selector)
+        if status is None:
+            status = SolveStatus.INFEASIBLE if self.incumbent is None else SolveStatus.OPTIMAL
+        result = SolveResult(status=status, **vars(self._progress(node_selector)))
 
-            logging.info("[BAP] Processing node {}.".format(current_node.id))
+        logging.info("[BAP] Column generation iterations: %d, mispricings: %d, dual stabilization: %s",
+                     self.column_generation_iterations, self.mispricings, self.settings.dual_stabilization.value)
+        logging.info("[BAP] Columns in pool: %d, duplicate columns rejected: %d",
+                     len(self.column_pool), self.duplicate_columns)
+        logging.info("[BAP] Node selection: %s, open nodes pruned by bound of parent: %d",
+                     self.settings.node_selection.value, node_selector.pruned_nodes)
+        logging.info("[BAP] Branching selection: %s, child nodes evaluated by strong branching: %d",
+                     self.settings.branching_selection.value, self.node_processor.branching_selector.probes)
+        logging.info("[BAP] RMP heuristic runs: %d", self.rmp_heuristic_runs)
+        logging.info("[BAP] Assignments forbidden by reduced cost fixing: %d", self.fixed_assignments)
+        logging.info("[BAP] Processed nodes not branched on: %s",
+                     ", ".join(f"{reason.value}: {count}" for reason, count in self.pruned_nodes.items()))
+        logging.info("[BAP] Status: %s, processed nodes: %d, open nodes: %d, time: %.2fs",
+                     result.status.value, result.processed_nodes, result.open_nodes, result.elapsed_time)
+        logging.info("[BAP] Primal bound: %s, dual bound: %f, relative gap: %f",
+                     result.primal_bound, result.dual_bound, result.relative_gap)
+        if self.event_log.is_enabled():
+            logging.info("[BAP] Tree events written to %s", self.event_log.path)
 
-            current_node.solve()
+        if self.incumbent is not None:
+            self.incumbent.report()
+        return result
 
-            if not current_node.is_feasible():
-                logging.info("[BAP] Solution at node {} is infeasible.".format(current_node.id))
-                continue
+    def _search(self, node_selector: NodeSelector):
+        while self._limit_status(node_selector) is None \
+                and (open_node := node_selector.pop(self._mip_lb())) is not None:
+            improved = self._record_outcome(self.node_processor.process(open_node, self._mip_lb), node_selector)
+            self._report_progress(node_selector, improved)
+            if self._is_checkpoint_due():
+                self._write_checkpoint(node_selector.open_nodes())
 
-            if current_node.has_integer_solution():
-                logging.info("[B&P] Solution at node {} has integer solution.".format(current_node.id))
-                obj = current_node.objective_value()
-                current_node.report_solution()
-                if mip_lb is None or obj > mip_lb:
-                    best_solution_node = current_node
-                    mip_lb = obj
-            else:
-                obj = current_node.objective_value()
-                logging.info("[B&P] Solution at node %d has non integer solution. Obj %.1f", current_node.id, obj)
-                if nodes := self._branch(current_node, mip_lb):
-                    include_nd, exclude_nd = nodes
-                    queue.push(include_nd)
-                    queue.push(exclude_nd)
+    def _search_in_parallel(self, node_selector: NodeSelector):
+        """
+        Nodes are solved by pool of worker processes (see `TreeSearchWorker`), this process
+        keeps open nodes and the best integer solution. Objective value of the solution
+        is shared with workers, so that they can prune nodes dominated by it.
+        Strong branching is performed by workers and its statistics are not collected.
+        Once a limit is reached, no node is submitted and nodes being solved are finished.
+        """
+        num_workers = self.settings.tree_search_workers
+        # spawned workers do not inherit Gurobi environment of this process
+        context = multiprocessing.get_context('spawn')
+        shared_mip_lb = context.Value('d', -math.inf)
 
-                    self.tree.add_edge(current_node.id, include_nd.id)
-                    self.tree.add_edge(current_node.id, exclude_nd.id)
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 mp_context=context,
+                                 initializer=init_tree_search_worker,
+                                 initargs=(self.gap_instance,
+                                           self.settings,
+                                           shared_mip_lb,
+                                           logging.getLogger().getEffectiveLevel())) as executor:
+            running: Dict[Future, OpenNode] = dict()
+            while True:
+                while len(running) < num_workers \
+                        and self._limit_status(node_selector, running.values()) is None \
+                        and (open_node := node_selector.pop(self._mip_lb())) is not None:
+                    future = executor.submit(solve_node, NodeTask.pack(open_node, self.column_pool))
+                    running[future] = open_node
 
-        from networkx.drawing.nx_agraph import graphviz_layout
+                if not running:
+                    break
 
-        pos = graphviz_layout(self.tree, prog='dot')
-        nx.draw(self.tree, pos, with_labels=True, arrows=True)
-        pyplot.show()
-        best_solution_node.report_integer_solution()
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                # children of each finished node are pushed separately, selectors keep nodes of all pushes
+                for future in finished:
+                    del running[future]
+                    result = future.result()
+                    children = None \
+                        if result.children is None \
+                        else tuple(task.unpack(self.column_pool, node_id=next(BranchNode.next_node_id))
+                                   for task in result.children)
+                    improved = self._record_outcome(dataclasses.replace(result.outcome, children=children),
+                                                    node_selector)
+                    self._report_progress(node_selector, improved, running.values())
 
-    def _create_root_node(self):
-        self.tree.add_node(0)
-        initial_solution = InitialSolutionFinder(self.gap_instance).find()
-        branching_rules = []
-        return BranchNode(
-            gap_instance=self.gap_instance,
-            branching_rules=branching_rules,
-            machine_schedules=initial_solution
-        )
+                    if self.incumbent is not None:
+                        # broadcast objective value of the best integer solution to workers
+                        shared_mip_lb.value = self.incumbent.objective_value
 
-    @classmethod
-    def _branch(cls, node: BranchNode, mip_lb: float) -> Optional[Tuple[BranchNode, BranchNode]]:
+                if self._is_checkpoint_due():
+                    # nodes being solved by workers are open as well
+                    self._write_checkpoint(list(running.values()) + node_selector.open_nodes())
+
+    def _record_outcome(self, outcome: NodeOutcome, node_selector: NodeSelector) -> bool:
         """
-        Branches based on results from `node`. It obtains non-integers
-        variable from solution to `node` and associated machine and task.
-        Then it creates two new nodes:
-        (1) Forbidding assigning task to machine.
-        (2) Forcing assigning task to machine.
-        Two new nodes created based on those branching strategies are added to queue.
+        Updates statistics and the best integer solution, children of processed node are added to queue.
+        :return: True if the best integer solution was improved
         """
+        self.processed_nodes += 1
+        self.column_generation_iterations += outcome.column_generation_iterations
+        self.mispricings += outcome.mispricings
+        self.duplicate_columns += outcome.duplicate_columns
+        self.rmp_heuristic_runs += outcome.rmp_heuristic_runs
+        self.fixed_assignments += outcome.fixed_assignments
+        if outcome.dual_bound is not None:
+            self.event_log.node_solved(outcome.node_id, outcome.dual_bound, outcome.column_generation_iterations)
+        if outcome.prune_reason is not None:
+            self.pruned_nodes[outcome.prune_reason] += 1
+            self.event_log.node_pruned(outcome.node_id, outcome.prune_reason.value)
+
+        mip_lb = self._mip_lb()
+        improved = outcome.incumbent is not None and (mip_lb is None or outcome.incumbent.objective_value > mip_lb)
+        if improved:
+            self.incumbent = outcome.incumbent
+            self.event_log.new_incumbent(outcome.incumbent.node_id, outcome.incumbent.objective_value)
+
+        if outcome.children is not None:
+            node_selector.push(list(outcome.children))
 
-        if mip_lb is not None and node.objective_value() <= mip_lb:
-            # in case node's LP value is lower than
-            # so far found MIP LB, then whole tree rooted at node
-            # can be discarded
+            self.event_log.node_branched(outcome.node_id, outcome.children)
+            for child in outcome.children:
+                self.event_log.node_created(child, parent_id=outcome.node_id)
+
+        return improved
+
+    def _progress(self, node_selector: NodeSelector, running_nodes: Collection[OpenNode] = ()) -> SearchProgress:
+        """:param running_nodes: open nodes being solved by workers"""
+        dual_bound = self._best_open_bound(node_selector, running_nodes)
+        if self.incumbent is not None:
+            dual_bound = max(dual_bound, self.incumbent.objective_value)
+        return SearchProgress(elapsed_time=time.monotonic() - self._start_time,
+                              processed_nodes=self.processed_nodes,
+                              open_nodes=len(node_selector) + len(running_nodes),
+                              incumbent=self.incumbent,
+                              dual_bound=dual_bound)
+
+    def _report_progress(self,
+                         node_selector: NodeSelector,
+                         improved_incumbent: bool,
+                         running_nodes: Collection[OpenNode] = ()):
+        if not self.callbacks:
+            return
+
+        progress = self._progress(node_selector, running_nodes)
+        if improved_incumbent:
+            for callback in self.callbacks:
+                callback.on_incumbent(progress)
+        if progress.dual_bound < self._reported_dual_bound:
+            self._reported_dual_bound = progress.dual_bound
+            for callback in self.callbacks:
+                callback.on_dual_bound(progress)
+
+    def _limit_status(self,
+                      node_selector: NodeSelector,
+                      running_nodes: Collection[OpenNode] = ()) -> Optional[SolveStatus]:
+        """
+        Returns status of search if one of limits is reached and some open node may
+        still improve the best integer solution, None otherwise.
+        """
+        settings = self.settings
+        if settings.time_limit is not None and time.monotonic() - self._start_time >= settings.time_limit:
+            status = SolveStatus.TIME_LIMIT
+        elif settings.node_limit is not None and self.processed_nodes + len(running_nodes) >= settings.node_limit:
+            status = SolveStatus.NODE_LIMIT
+        elif settings.mip_gap_limit is not None \
+                and self._progress(node_selector, running_nodes).relative_gap <= settings.mip_gap_limit:
+            status = SolveStatus.GAP_LIMIT
+        else:
             return None
 
-        if node.objective_value() == math.nan:
-            # Model after branching might become infeasible
+        mip_lb = self._mip_lb()
+        best_open_bound = self._best_open_bound(node_selector, running_nodes)
+        if best_open_bound == -math.inf or (mip_lb is not None and best_open_bound <= mip_lb):
+            # search is finished, remaining open nodes are pruned once selected
             return None
+        return status
 
-        # based on current solution obtain id of task and machine
-        machine, task = node.machine_task_to_branch_on()
-        logging.info("[BAP] Current node {}. Branching on machine {} and task {}".format(node.id, machine, task))
+    @classmethod
+    def _best_open_bound(cls, node_selector: NodeSelector, running_nodes: Collection[OpenNode]) -> float:
+        return max([node_selector.best_bound()] + [node.parent_bound for node in running_nodes])
+
+    def _is_checkpoint_due(self) -> bool:
+        return self.settings.checkpoint_path is not None \
+            and time.monotonic() - self._last_checkpoint_time >= self.settings.checkpoint_interval
+
+    def _write_checkpoint(self, open_nodes: List[OpenNode]):
+        # counter of node ids cannot be read without being advanced, so it is recreated
+        next_node_id = next(BranchNode.next_node_id)
+        BranchNode.next_node_id = itertools.count(start=next_node_id)
 
-        # create two branching rules
-        exclude_branching = BranchingRule(task, machine, assigned=False)
-        include_branching = BranchingRule(task, machine, assigned=True)
+        Checkpoint(
+            num_machines=self.gap_instance.num_machines,
+            num_tasks=self.gap_instance.num_tasks,
+            open_nodes=tuple(open_nodes),
+            columns=tuple(self.column_pool.column(column_id) for column_id in range(len(self.column_pool))),
+            incumbent=self.incumbent,
+            next_node_id=next_node_id,
+            processed_nodes=self.processed_nodes,
+            column_generation_iterations=self.column_generation_iterations,
+            mispricings=self.mispricings,
+            duplicate_columns=self.duplicate_columns,
+            rmp_heuristic_runs=self.rmp_heuristic_runs,
+            fixed_assignments=self.fixed_assignments,
+            pruned_nodes=dict(self.pruned_nodes)
+        ).write(self.settings.checkpoint_path)
 
-        # current branching rules
-        br_rls = node.branching_rules
+        self._last_checkpoint_time = time.monotonic()
+        logging.info("[BAP] Checkpoint with %d open nodes written to %s.", len(open_nodes), self.settings.checkpoint_path)
 
-        exclude_nd = BranchNode(
-            node.gap_instance,
-            copy.deepcopy(br_rls) + [exclude_branching],
-            copy.deepcopy(node.get_machine_schedules()),
-        )
+    def _resume(self, checkpoint: Checkpoint, node_selector: NodeSelector):
+        """Restores state of search from checkpoint, pseudo costs of branching selection are not restored."""
+        # pool is empty, so columns get the same ids as before
+        for machine_schedule in checkpoint.columns:
+            self.column_pool.add(machine_schedule)
+        BranchNode.next_node_id = itertools.count(start=checkpoint.next_node_id)
 
-        include_nd = BranchNode(
-            node.gap_instance,
-            copy.deepcopy(br_rls) + [include_branching],
-            copy.deepcopy(node.get_machine_schedules()),
-        )
+        self.incumbent = checkpoint.incumbent
+        self.processed_nodes = checkpoint.processed_nodes
+        self.column_generation_iterations = checkpoint.column_generation_iterations
+        self.mispricings = checkpoint.mispricings
+        self.duplicate_columns = checkpoint.duplicate_columns
+        self.rmp_heuristic_runs = checkpoint.rmp_heuristic_runs
+        self.fixed_assignments = checkpoint.fixed_assignments
+        self.pruned_nodes.update(checkpoint.pruned_nodes)
 
-        logging.info("  Exclude node {}".format(exclude_nd.id))
-        logging.info("  Include node {}".format(include_nd.id))
+        self.event_log.primal_bound = self._mip_lb()
+        if checkpoint.open_nodes:
+            node_selector.push(list(checkpoint.open_nodes))
 
-        return exclude_nd, include_nd
+        logging.info("[BAP] Resuming search with %d open nodes and %d columns.",
+                     len(checkpoint.open_nodes), len(checkpoint.columns))
+
+    def _mip_lb(self) -> Optional[float]:
+        """Returns objective value of the best integer solution found so far."""
+        return None if self.incumbent is None else self.incumbent.objective_value
+
+    def _open_root_node(self) -> OpenNode:
+        initial_solution = InitialSolutionFinder(self.gap_instance).find()
+        root = BranchNode.open_root([self.column_pool.add(machine_schedule) for machine_schedule in initial_solution])
+        self.event_log.node_created(root, parent_id=None)
+        return root
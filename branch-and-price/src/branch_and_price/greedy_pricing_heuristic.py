@@ -0,0 +1,76 @@
+from typing import List
+
+import numpy as np
+
+from branch_and_price.branching_rule import BranchingRule, forced_and_allowed_assignments
+from branch_and_price.pricing_result import PricingResult, PricingRound
+from input_data import GeneralAssignmentProblem
+
+
+class GreedyPricingHeuristic:
+    """
+    Cheap pricing heuristic that looks for columns with positive reduced cost
+    for all machines at once. For each machine tasks forced by branching
+    rules are assigned first, then remaining allowed tasks are taken in order of
+    decreasing ratio of reduced profit to weight, a task which does not fit into
+    remaining capacity of the machine is skipped and smaller tasks after it are still tried.
+    """
+
+    def __init__(self,
+                 gap_instance: GeneralAssignmentProblem):
+        self.gap_instance = gap_instance
+
+    def price(self,
+              machine_duals: List[float],
+              task_duals: List[float],
+              branching_rules: List[BranchingRule]) -> PricingRound:
+        """
+        :return: for each machine reduced cost of column found by heuristic
+                 and the column if its reduced cost is positive.
+                 Round is never complete as subproblems are not solved to optimality.
+        """
+        weights = self.gap_instance.weights
+        reduced_profits = self.gap_instance.profits - np.asarray(task_duals)[np.newaxis, :]
+
+        forced, allowed = forced_and_allowed_assignments(branching_rules,
+                                                         num_machines=self.gap_instance.num_machines,
+                                                         num_tasks=self.gap_instance.num_tasks)
+        remaining_capacity = self.gap_instance.capacity - np.where(forced, weights, 0).sum(axis=1)
+
+        candidates = allowed & ~forced & (reduced_profits > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(candidates, reduced_profits / weights, -np.inf)
+
+        # sorting tasks of each machine by decreasing ratio
+        order = np.argsort(-ratio, axis=1, kind='stable')
+        sorted_candidates = np.take_along_axis(candidates, order, axis=1)
+        sorted_weights = np.take_along_axis(np.where(candidates, weights, 0), order, axis=1)
+        # tasks are taken one position at a time for all machines at once
+        sorted_assigned = np.full(candidates.shape, False)
+        capacity_left = remaining_capacity.astype(float)
+        for position in range(sorted_candidates.shape[1]):
+            position_weights = sorted_weights[:, position]
+            fits = sorted_candidates[:, position] & (position_weights <= capacity_left)
+            capacity_left -= np.where(fits, position_weights, 0)
+            sorted_assigned[:, position] = fits
+
+        assigned = np.full(candidates.shape, False)
+        np.put_along_axis(assigned, order, sorted_assigned, axis=1)
+        assigned |= forced
+
+        objective_values = np.where(assigned, reduced_profits, 0).sum(axis=1) - np.asarray(machine_duals)
+
+        results = []
+        for machine_id in range(self.gap_instance.num_machines):
+            if remaining_capacity[machine_id] < 0:
+                # tasks forced by branching rules do not fit into machine
+                results.append(PricingResult(machine_id, None, []))
+                continue
+
+            result = PricingResult(machine_id, float(objective_values[machine_id]), [])
+            if result.is_improving():
+                machine_schedule = self.gap_instance.machine_schedule(machine_id, np.flatnonzero(assigned[machine_id]))
+                result = PricingResult(machine_id, result.objective_value, [machine_schedule])
+            results.append(result)
+
+        return PricingRound(results=results, complete=False)
@@ -0,0 +1,27 @@
+import dataclasses
+import logging
+from typing import Tuple
+
+from common import TMachineSchedule
+
+
+@dataclasses.dataclass(frozen=True)
+class Incumbent:
+    """Integer solution of GAP found in Branch-And-Price tree."""
+
+    # id of node whose RMP solution is the integer solution
+    node_id: int
+    objective_value: float
+    # columns with value 1 in the solution, one for each machine
+    machine_schedules: Tuple[TMachineSchedule, ...]
+
+    def report(self):
+        logging.info(f"** Integral solution to RMP on node {self.node_id}! **")
+        logging.info("Objective value: %f", self.objective_value)
+
+        logging.info("Machine -> Set of tasks")
+
+        for machine_schedule in sorted(self.machine_schedules, key=lambda schedule: schedule.machine_id):
+            logging.info(f'{machine_schedule.machine_id}\t{" ".join([str(task) for task in machine_schedule.tasks])}')
+
+        logging.info('')
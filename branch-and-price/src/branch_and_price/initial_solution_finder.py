@@ -34,7 +34,7 @@ class InitialSolutionFinder:
         self._report()
 
         return [
-            (machine_id, list(tasks))
+            self.gap_instance.machine_schedule(machine_id, sorted(tasks))
             for machine_id, tasks in self.solution.items()
         ]
 
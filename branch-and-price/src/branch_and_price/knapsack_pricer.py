@@ -0,0 +1,170 @@
+import dataclasses
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union, Optional
+
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.dynamic_programming_subproblem_builder import DynamicProgrammingSubproblemBuilder
+from branch_and_price.greedy_pricing_heuristic import GreedyPricingHeuristic
+from branch_and_price.partial_pricing import PartialPricing
+from branch_and_price.pricing_result import PricingResult, PricingRound
+from branch_and_price.settings import ColumnGenerationSettings, PricingMethod
+from branch_and_price.subproblem_builder import SubproblemBuilder
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from input_data import GeneralAssignmentProblem
+
+
+class KnapsackPricer:
+    """
+    Solves knapsack subproblems (pricing problems) of machines for given duals.
+    Subproblems are independent, so if more than one pricing thread
+    is configured they are solved by a pool of threads.
+    Order of machines and early stop of a round are decided by `PartialPricing`.
+    If heuristic pricing is enabled, subproblems are solved exactly only
+    when the heuristic fails to find any column with positive reduced cost.
+    """
+
+    SOLUTION_POOL_SIZE_FACTOR = 4
+
+    def __init__(self,
+                 gap_instance: GeneralAssignmentProblem,
+                 settings: ColumnGenerationSettings,
+                 debug_artifact_recorder: Optional[DebugArtifactRecorder] = None):
+        """:param debug_artifact_recorder: models are not recorded if it is None"""
+        self.gap_instance = gap_instance
+        self.settings = settings
+        self.debug_artifact_recorder = debug_artifact_recorder \
+            if debug_artifact_recorder is not None \
+            else DebugArtifactRecorder()
+        self.subproblem_builder = self._create_subproblem_builder()
+        self.partial_pricing = PartialPricing(num_machines=gap_instance.num_machines, settings=settings)
+        self.heuristic = GreedyPricingHeuristic(gap_instance=gap_instance) \
+            if settings.heuristic_pricing \
+            else None
+        self._executor = ThreadPoolExecutor(max_workers=settings.pricing_threads) \
+            if self._is_parallel() \
+            else None
+
+    def price(self,
+              node_id: int,
+              itr_cnt: int,
+              machine_duals: List[float],
+              task_duals: List[float],
+              branching_rules: List[BranchingRule],
+              complete: bool = False) -> PricingRound:
+        """
+        Solves subproblems of machines in order given by partial pricing strategy.
+        Machines are priced in batches of size equal to number of pricing threads
+        and pricing stops after the batch in which enough machines returned
+        columns with positive reduced cost.
+        :param complete: subproblems of all machines are solved exactly, heuristic and partial pricing are skipped
+        :return: results in the order in which machines were priced
+        """
+        if self.heuristic is not None and not complete:
+            heuristic_round = self.heuristic.price(machine_duals, task_duals, branching_rules)
+            if any(result.is_improving() for result in heuristic_round.results):
+                return heuristic_round
+
+        machine_ids = self.partial_pricing.machine_order()
+        batch_size = len(machine_ids) \
+            if self.settings.max_improving_machines is None or complete \
+            else self.settings.pricing_threads
+
+        results: List[PricingResult] = []
+        num_improving_machines = 0
+        for batch_start in range(0, len(machine_ids), batch_size):
+            batch = machine_ids[batch_start:batch_start + batch_size]
+            for result in self._price_machines(node_id, itr_cnt, batch, machine_duals, task_duals, branching_rules):
+                self.partial_pricing.record(result.machine_id, result.objective_value)
+                results.append(result)
+                if result.is_improving():
+                    num_improving_machines += 1
+
+            if not complete and self.partial_pricing.is_round_finished(num_improving_machines):
+                break
+
+        return PricingRound(results=results, complete=len(results) == len(machine_ids))
+
+    def _price_machines(self,
+                        node_id: int,
+                        itr_cnt: int,
+                        machine_ids: List[int],
+                        machine_duals: List[float],
+                        task_duals: List[float],
+                        branching_rules: List[BranchingRule]) -> List[PricingResult]:
+        """
+        Solves subproblems of machines with given ids.
+        :return: results in the same order as `machine_ids`
+        """
+
+        def _price_machine(machine_id: int) -> PricingResult:
+            return self._price_machine(node_id, itr_cnt, machine_id, machine_duals[machine_id],
+                                       task_duals, branching_rules)
+
+        if self._executor is None:
+            return [_price_machine(machine_id) for machine_id in machine_ids]
+
+        return list(self._executor.map(_price_machine, machine_ids))
+
+    def close(self):
+        """Waits for pricing threads, then frees Gurobi models and environments of subproblems."""
+        if self._executor is not None:
+            self._executor.shutdown()
+        self.subproblem_builder.close()
+
+    def _price_machine(self,
+                       node_id: int,
+                       itr_cnt: int,
+                       machine_id: int,
+                       machine_dual: float,
+                       task_duals: List[float],
+                       branching_rules: List[BranchingRule]) -> PricingResult:
+        logging.debug("[CG]  * Solving subproblem for machine {}".format(machine_id))
+
+        # building knapsack subproblem using dual information
+        subproblem = self.subproblem_builder.build(machine_id=machine_id,
+                                                   machine_dual=machine_dual,
+                                                   task_duals=task_duals,
+                                                   branching_rules=branching_rules)
+        subproblem.write(self.debug_artifact_recorder,
+                         name=f'subproblem_{node_id}_{itr_cnt}_{machine_id}',
+                         node_id=node_id,
+                         itr_cnt=itr_cnt)
+        subproblem.solve()
+        objective_value = subproblem.objective_value()
+
+        result = PricingResult(machine_id, objective_value, [], subproblem.objective_bound())
+
+        # are there any columns with positive reduced cost?
+        # only those can improve RMP solution
+        if not result.is_improving():
+            return result
+
+        if self.settings.columns_per_machine > 1:
+            machine_schedules = subproblem.best_solutions(self.settings.columns_per_machine,
+                                                          self.settings.min_hamming_distance)
+        else:
+            machine_schedules = subproblem.all_solutions()
+
+        return dataclasses.replace(result, machine_schedules=machine_schedules)
+
+    def _is_parallel(self) -> bool:
+        return self.settings.pricing_threads > 1
+
+    def _solution_pool_size(self) -> Optional[int]:
+        """
+        Number of best solutions kept for each subproblem. More solutions
+        than requested columns are kept, so that diverse ones can be selected.
+        """
+        if self.settings.columns_per_machine <= 1:
+            return None
+        return self.SOLUTION_POOL_SIZE_FACTOR * self.settings.columns_per_machine
+
+    def _create_subproblem_builder(self) -> Union[SubproblemBuilder, DynamicProgrammingSubproblemBuilder]:
+        if self.settings.pricing_method == PricingMethod.DYNAMIC_PROGRAMMING:
+            return DynamicProgrammingSubproblemBuilder(gap_instance=self.gap_instance,
+                                                       isolated_environments=self._is_parallel(),
+                                                       solution_pool_size=self._solution_pool_size())
+        return SubproblemBuilder(gap_instance=self.gap_instance,
+                                 isolated_environments=self._is_parallel(),
+                                 solution_pool_size=self._solution_pool_size())
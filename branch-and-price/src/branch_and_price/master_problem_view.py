@@ -0,0 +1,58 @@
+from typing import List
+
+import numpy as np
+
+from common import TMachineSchedule
+
+
+class MasterProblemView:
+    """
+    NumPy view of columns of RMP - sparse incidence matrix of columns and
+    assignments of tasks to machines kept in coordinate format. Entry (i, m * num_tasks + t)
+    is 1 if i-th column of RMP assigns task `t` to machine `m`. Columns are indexed
+    in order in which they were added to RMP. Coordinates are stored in chunks,
+    one per batch of added columns, consolidated when the matrix is used.
+    """
+
+    def __init__(self, num_machines: int, num_tasks: int):
+        self.num_machines = num_machines
+        self.num_tasks = num_tasks
+        self.num_columns = 0
+
+        self._column_chunks: List[np.ndarray] = []
+        self._assignment_chunks: List[np.ndarray] = []
+
+    def add_columns(self, machine_schedules: List[TMachineSchedule]):
+        if not machine_schedules:
+            return
+
+        lengths = [len(machine_schedule) for machine_schedule in machine_schedules]
+        tasks = np.fromiter((task for machine_schedule in machine_schedules for task in machine_schedule.tasks),
+                            dtype=np.int64,
+                            count=sum(lengths))
+        machines = np.repeat([machine_schedule.machine_id for machine_schedule in machine_schedules], lengths)
+        columns = np.repeat(np.arange(self.num_columns, self.num_columns + len(machine_schedules)), lengths)
+
+        self._column_chunks.append(columns)
+        self._assignment_chunks.append(machines * self.num_tasks + tasks)
+        self.num_columns += len(machine_schedules)
+
+    def assignment_values(self, column_values: np.ndarray) -> np.ndarray:
+        """
+        Returns array of shape num_machines x num_tasks with sum of values
+        of columns assigning task to machine.
+        :param column_values: values of columns of RMP in order in which they were added
+        """
+        self._consolidate()
+        if not self._column_chunks:
+            return np.zeros((self.num_machines, self.num_tasks))
+
+        values = np.bincount(self._assignment_chunks[0],
+                             weights=column_values[self._column_chunks[0]],
+                             minlength=self.num_machines * self.num_tasks)
+        return values.reshape(self.num_machines, self.num_tasks)
+
+    def _consolidate(self):
+        if len(self._column_chunks) > 1:
+            self._column_chunks = [np.concatenate(self._column_chunks)]
+            self._assignment_chunks = [np.concatenate(self._assignment_chunks)]
@@ -0,0 +1,233 @@
+import dataclasses
+import enum
+import logging
+import math
+from typing import Optional, Tuple, Callable
+
+from branch_and_price.branch_node import BranchNode
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.branching_selector import create_branching_selector
+from branch_and_price.column_pool import ColumnPool
+from branch_and_price.incumbent import Incumbent
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from branch_and_price.open_node import OpenNode
+from branch_and_price.rmp_heuristic import RestrictedMasterHeuristic
+from branch_and_price.settings import ColumnGenerationSettings
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from input_data import GeneralAssignmentProblem
+
+
+class PruneReason(enum.Enum):
+    """Reason why a node of Branch-And-Price tree is not branched on."""
+
+    # bound of parent node is not better than the best integer solution, RMP of node is not built
+    PARENT_BOUND = 'parent_bound'
+    # Lagrangian bound computed during column generation is not better than the best integer solution,
+    # column generation is stopped early
+    LAGRANGIAN_BOUND = 'lagrangian_bound'
+    # bound of node after column generation is not better than the best integer solution
+    DUAL_BOUND = 'dual_bound'
+    INFEASIBLE = 'infeasible'
+    # RMP solution is integer
+    INTEGER = 'integer'
+
+
+@dataclasses.dataclass(frozen=True)
+class NodeOutcome:
+    """Result of processing a node of Branch-And-Price tree."""
+
+    node_id: int
+    # None if node was branched on
+    prune_reason: Optional[PruneReason]
+    # RMP solution if it is integer or solution found by RMP heuristic
+    incumbent: Optional[Incumbent]
+    # records of children, None if node was not branched on
+    children: Optional[Tuple[OpenNode, ...]]
+    # bound of node after column generation, None if node was pruned before it was solved
+    dual_bound: Optional[float] = None
+    column_generation_iterations: int = 0
+    mispricings: int = 0
+    duplicate_columns: int = 0
+    rmp_heuristic_runs: int = 0
+    # number of assignments forbidden by reduced cost fixing
+    fixed_assignments: int = 0
+
+
+class NodeProcessor:
+    """
+    Processes nodes of Branch-And-Price tree: builds RMP of a node from its record,
+    solves it using column generation and branches on fractional solution.
+    RMP of the node is disposed once the node is processed.
+    """
+
+    def __init__(self,
+                 gap_instance: GeneralAssignmentProblem,
+                 column_pool: ColumnPool,
+                 pricer: KnapsackPricer,
+                 settings: ColumnGenerationSettings,
+                 debug_artifact_recorder: DebugArtifactRecorder):
+        self.gap_instance = gap_instance
+        self.column_pool = column_pool
+        self.pricer = pricer
+        self.settings = settings
+        self.debug_artifact_recorder = debug_artifact_recorder
+        self.branching_selector = create_branching_selector(settings, self._materialize_probe)
+        self.rmp_heuristic = RestrictedMasterHeuristic(settings)
+
+    def process(self, open_node: OpenNode, mip_lb: Callable[[], Optional[float]]) -> NodeOutcome:
+        """
+        :param mip_lb: returns objective value of the best integer solution found so far,
+                       None if no solution was found
+        """
+        best_objective_value = mip_lb()
+        if best_objective_value is not None and open_node.parent_bound <= best_objective_value:
+            logging.info("[BAP] Node {} is pruned by bound of its parent.".format(open_node.id))
+            return NodeOutcome(node_id=open_node.id,
+                               prune_reason=PruneReason.PARENT_BOUND,
+                               incumbent=None,
+                               children=None)
+
+        # RMP of node is built only once it is processed
+        current_node = self._materialize(open_node)
+        try:
+            logging.info("[BAP] Processing node {}.".format(current_node.id))
+
+            current_node.solve(mip_lb=mip_lb)
+            incumbent = self._continue_unconverged_integer_solution(current_node, mip_lb)
+            self.branching_selector.on_node_solved(open_node, current_node)
+
+            prune_reason = None
+            children = None
+            rmp_heuristic_runs = self.rmp_heuristic.runs
+            fixed_assignments = 0
+            if current_node.dominated:
+                logging.info("[BAP] Node {} is pruned by Lagrangian bound.".format(current_node.id))
+                prune_reason = PruneReason.LAGRANGIAN_BOUND
+            elif not current_node.is_feasible():
+                logging.info("[BAP] Solution at node {} is infeasible.".format(current_node.id))
+                prune_reason = PruneReason.INFEASIBLE
+            elif current_node.has_integer_solution() and current_node.is_converged():
+                logging.info("[B&P] Solution at node {} has integer solution.".format(current_node.id))
+                current_node.report_solution()
+                prune_reason = PruneReason.INTEGER
+                incumbent = current_node.incumbent()
+            else:
+                obj = current_node.objective_value()
+                logging.info("[B&P] Solution at node %d has non integer solution. Obj %.1f", current_node.id, obj)
+                best_objective_value = _best_objective_value(mip_lb(), incumbent)
+                heuristic_incumbent = self.rmp_heuristic.run(current_node, best_objective_value)
+                if heuristic_incumbent is not None:
+                    incumbent = heuristic_incumbent
+                    best_objective_value = incumbent.objective_value
+
+                if best_objective_value is not None and current_node.dual_bound() <= best_objective_value:
+                    # in case node's bound is lower than
+                    # so far found MIP LB, then whole tree rooted at node
+                    # can be discarded
+                    prune_reason = PruneReason.DUAL_BOUND
+                else:
+                    if self.settings.reduced_cost_fixing and best_objective_value is not None:
+                        fixed_assignments = len(current_node.fix_assignments_by_reduced_cost(best_objective_value))
+                    children = self._branch(current_node)
+
+            return NodeOutcome(node_id=current_node.id,
+                               prune_reason=prune_reason,
+                               incumbent=incumbent,
+                               children=children,
+                               dual_bound=current_node.dual_bound(),
+                               column_generation_iterations=current_node.column_generation_iterations,
+                               mispricings=current_node.mispricings,
+                               duplicate_columns=current_node.duplicate_columns,
+                               rmp_heuristic_runs=self.rmp_heuristic.runs - rmp_heuristic_runs,
+                               fixed_assignments=fixed_assignments)
+        finally:
+            current_node.dispose()
+
+    @classmethod
+    def _continue_unconverged_integer_solution(cls,
+                                               node: BranchNode,
+                                               mip_lb: Callable[[], Optional[float]]) -> Optional[Incumbent]:
+        """
+        If column generation was stopped by gap tolerance and RMP solution is integer, the solution
+        is feasible, but not necessarily optimal for node, and node cannot be branched on it.
+        Unless dual bound of node proves the solution optimal, column generation continues
+        without gap tolerance.
+        :return: the integer solution or None if column generation converged or RMP solution is fractional
+        """
+        if node.dominated or node.is_converged() or not node.is_feasible() or not node.has_integer_solution():
+            return None
+
+        incumbent = node.incumbent()
+        logging.info("[B&P] Solution at node %d is integer before column generation converged. Obj %.1f",
+                     node.id, incumbent.objective_value)
+        if node.dual_bound() > _best_objective_value(mip_lb(), incumbent):
+            node.solve(mip_lb=lambda: _best_objective_value(mip_lb(), incumbent), use_gap_tolerance=False)
+        return incumbent
+
+    def _materialize(self, open_node: OpenNode) -> BranchNode:
+        return BranchNode(
+            gap_instance=self.gap_instance,
+            open_node=open_node,
+            column_pool=self.column_pool,
+            pricer=self.pricer,
+            settings=self.settings,
+            debug_artifact_recorder=self.debug_artifact_recorder
+        )
+
+    def _materialize_probe(self, open_node: OpenNode) -> BranchNode:
+        # models of temporary nodes are not recorded
+        return BranchNode(
+            gap_instance=self.gap_instance,
+            open_node=open_node,
+            column_pool=self.column_pool,
+            pricer=self.pricer,
+            settings=self.settings,
+            debug_artifact_recorder=DebugArtifactRecorder()
+        )
+
+    def _branch(self, node: BranchNode) -> Optional[Tuple[OpenNode, ...]]:
+        """
+        Branches based on results from `node`. It obtains non-integer assignment
+        of task to machine from solution to `node` chosen by branching selector.
+        Then it creates records of two new nodes:
+        (1) Forbidding assigning task to machine.
+        (2) Forcing assigning task to machine.
+        Two new nodes created based on those branching strategies are added to queue.
+        If the assignment was forbidden by reduced cost fixing, only the first node is created.
+        """
+
+        if math.isnan(node.objective_value()):
+            # Model after branching might become infeasible
+            return None
+
+        # based on current solution obtain id of task and machine
+        candidate = self.branching_selector.select(node)
+        if candidate is None:
+            # columns are fractional, but assignments of tasks to machines are integer
+            return None
+        machine, task = candidate.machine, candidate.task
+        logging.info("[BAP] Current node {}. Branching on machine {} and task {}".format(node.id, machine, task))
+
+        # create two branching rules
+        exclude_branching = BranchingRule(task, machine, assigned=False)
+        include_branching = BranchingRule(task, machine, assigned=True)
+
+        exclude_nd = node.open_child(exclude_branching, candidate.value)
+        logging.info("  Exclude node {}".format(exclude_nd.id))
+        if node.is_forbidden(machine, task):
+            # node forcing the assignment cannot contain better integer solution
+            return exclude_nd,
+
+        include_nd = node.open_child(include_branching, candidate.value)
+        logging.info("  Include node {}".format(include_nd.id))
+
+        return exclude_nd, include_nd
+
+
+def _best_objective_value(mip_lb: Optional[float], incumbent: Optional[Incumbent]) -> Optional[float]:
+    """Returns the better of objective value `mip_lb` and objective value of `incumbent`."""
+    if incumbent is None:
+        return mip_lb
+    if mip_lb is None:
+        return incumbent.objective_value
+    return max(mip_lb, incumbent.objective_value)
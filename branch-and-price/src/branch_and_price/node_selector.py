@@ -0,0 +1,180 @@
+import heapq
+import itertools
+import math
+from typing import List, Optional, Tuple
+
+from branch_and_price.open_node import OpenNode
+from branch_and_price.settings import NodeSelection
+from common.queue import Queue
+
+
+class NodeSelector:
+    """
+    Keeps open nodes of Branch-And-Price tree and decides which one is processed next.
+    Nodes are pruned lazily - a node whose parent bound is not better than
+    the best integer solution found so far is dropped once it is selected.
+    """
+
+    def __init__(self):
+        self.pruned_nodes = 0
+
+    def push(self, nodes: List[OpenNode]):
+        """
+        Adds children of a node, the first one should be processed first. Children of several nodes
+        may be pushed between two pops, e.g. when several workers finish at once.
+        """
+        raise NotImplementedError
+
+    def pop(self, mip_lb: Optional[float]) -> Optional[OpenNode]:
+        """Returns next node to process or None if there is no open node which can improve `mip_lb`."""
+        while not self.is_empty():
+            node = self._pop()
+            if mip_lb is not None and node.parent_bound <= mip_lb:
+                self.pruned_nodes += 1
+                continue
+            return node
+        return None
+
+    def is_empty(self) -> bool:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        """Returns number of open nodes, including nodes which are pruned once selected."""
+        raise NotImplementedError
+
+    def open_nodes(self) -> List[OpenNode]:
+        """Returns open nodes, pushing them to an empty selector restores the order in which they are processed."""
+        raise NotImplementedError
+
+    def best_bound(self) -> float:
+        """Returns the best (the highest) parent bound of open nodes, minus infinity if there is none."""
+        return max((node.parent_bound for node in self.open_nodes()), default=-math.inf)
+
+    def _pop(self) -> OpenNode:
+        raise NotImplementedError
+
+
+class BreadthFirstNodeSelector(NodeSelector):
+
+    def __init__(self):
+        super().__init__()
+        self._queue: Queue[OpenNode] = Queue()
+
+    def push(self, nodes: List[OpenNode]):
+        for node in nodes:
+            self._queue.push(node)
+
+    def is_empty(self) -> bool:
+        return self._queue.is_empty()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def open_nodes(self) -> List[OpenNode]:
+        return list(self._queue)
+
+    def _pop(self) -> OpenNode:
+        return self._queue.pop()
+
+
+class DepthFirstNodeSelector(NodeSelector):
+
+    def __init__(self):
+        super().__init__()
+        self._stack: List[OpenNode] = []
+
+    def push(self, nodes: List[OpenNode]):
+        self._stack.extend(reversed(nodes))
+
+    def is_empty(self) -> bool:
+        return not self._stack
+
+    def __len__(self) -> int:
+        return len(self._stack)
+
+    def open_nodes(self) -> List[OpenNode]:
+        return list(reversed(self._stack))
+
+    def _pop(self) -> OpenNode:
+        return self._stack.pop()
+
+
+class BestBoundNodeSelector(NodeSelector):
+    """
+    Selects node with the best (the highest) bound of its parent,
+    ties are broken in favour of deeper nodes and then in order of pushing.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._heap: List[Tuple[float, int, int, OpenNode]] = []
+        self._counter = itertools.count()
+
+    def push(self, nodes: List[OpenNode]):
+        for node in nodes:
+            heapq.heappush(self._heap, (-node.parent_bound, -node.depth, next(self._counter), node))
+
+    def is_empty(self) -> bool:
+        return not self._heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def open_nodes(self) -> List[OpenNode]:
+        return [node for *_, node in sorted(self._heap)]
+
+    def best_bound(self) -> float:
+        return -self._heap[0][0] if self._heap else -math.inf
+
+    def _pop(self) -> OpenNode:
+        return heapq.heappop(self._heap)[-1]
+
+
+class HybridNodeSelector(BestBoundNodeSelector):
+    """
+    Dives from the node with the best bound: as long as the last processed node
+    was branched on, its first child is selected next and the other children
+    are kept in best-bound queue. Once a dive ends (node is pruned, infeasible
+    or integer), node with the best bound is selected.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._dive: Optional[OpenNode] = None
+
+    def push(self, nodes: List[OpenNode]):
+        first, *others = nodes
+        if self._dive is not None:
+            # nodes may be pushed several times between pops, dive continues from the last pushed node
+            others.append(self._dive)
+        self._dive = first
+        super().push(others)
+
+    def is_empty(self) -> bool:
+        return self._dive is None and super().is_empty()
+
+    def __len__(self) -> int:
+        return (self._dive is not None) + super().__len__()
+
+    def open_nodes(self) -> List[OpenNode]:
+        # the first node is selected first once pushed
+        return ([self._dive] if self._dive is not None else []) + super().open_nodes()
+
+    def best_bound(self) -> float:
+        return max(self._dive.parent_bound if self._dive is not None else -math.inf, super().best_bound())
+
+    def _pop(self) -> OpenNode:
+        if self._dive is not None:
+            node, self._dive = self._dive, None
+            return node
+        return super()._pop()
+
+
+def create_node_selector(node_selection: NodeSelection) -> NodeSelector:
+    if node_selection == NodeSelection.BREADTH_FIRST:
+        return BreadthFirstNodeSelector()
+    if node_selection == NodeSelection.DEPTH_FIRST:
+        return DepthFirstNodeSelector()
+    if node_selection == NodeSelection.HYBRID:
+        return HybridNodeSelector()
+    return BestBoundNodeSelector()
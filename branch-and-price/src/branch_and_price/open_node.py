@@ -0,0 +1,28 @@
+import dataclasses
+from typing import Tuple, Optional
+
+import numpy as np
+
+from branch_and_price.branching_rule import BranchingRule
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class OpenNode:
+    """
+    Lightweight record of a node of Branch-And-Price tree waiting to be processed.
+    RMP of the node is built only once the node is selected (see `BranchNode`).
+    """
+
+    id: int
+    branching_rules: Tuple[BranchingRule, ...]
+    # bitmap of ids of columns of column pool inherited from parent node
+    column_ids: int
+    # dual bound of parent node is an upper bound on objective value of this node
+    parent_bound: float
+    depth: int
+    # value of branched on assignment of task to machine in RMP solution of parent node
+    branching_value: Optional[float] = None
+    # basis of RMP of parent node - statuses of inherited columns (by increasing column id)
+    # and of constraints, None if RMP is built without columns violating branching rules
+    variable_basis: Optional[np.ndarray] = None
+    constraint_basis: Optional[np.ndarray] = None
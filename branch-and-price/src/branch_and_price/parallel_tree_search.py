@@ -0,0 +1,115 @@
+import dataclasses
+import logging
+import math
+from typing import Optional, Tuple
+
+import gurobipy.gurobipy as grb
+import numpy as np
+
+from branch_and_price.column_pool import ColumnPool
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from branch_and_price.node_processor import NodeOutcome, NodeProcessor
+from branch_and_price.open_node import OpenNode
+from branch_and_price.settings import ColumnGenerationSettings
+from common import TMachineSchedule
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from input_data import GeneralAssignmentProblem
+
+
+@dataclasses.dataclass(frozen=True)
+class NodeTask:
+    """
+    Record of open node passed between processes. Each process has its own column pool,
+    so inherited columns are passed as machine schedules instead of ids.
+    """
+
+    # `column_ids` refer to column pool of sender
+    open_node: OpenNode
+    # inherited columns in order of increasing id in column pool of sender
+    machine_schedules: Tuple[TMachineSchedule, ...]
+
+    @classmethod
+    def pack(cls, open_node: OpenNode, column_pool: ColumnPool) -> 'NodeTask':
+        machine_schedules = tuple(column_pool.column(column_id)
+                                  for column_id in column_pool.column_ids(open_node.column_ids))
+        return NodeTask(open_node=open_node, machine_schedules=machine_schedules)
+
+    def unpack(self, column_pool: ColumnPool, node_id: Optional[int] = None) -> OpenNode:
+        """
+        Returns record of open node with columns added to `column_pool` of receiver.
+        Basis of parent's RMP is reordered by ids of columns in the pool.
+        :param node_id: new id of node, id is kept if it is None
+        """
+        column_ids = [column_pool.add(machine_schedule) for machine_schedule in self.machine_schedules]
+        variable_basis = self.open_node.variable_basis
+        if variable_basis is not None:
+            variable_basis = variable_basis[np.argsort(column_ids)]
+
+        return dataclasses.replace(self.open_node,
+                                   id=self.open_node.id if node_id is None else node_id,
+                                   column_ids=column_pool.to_bitmap(column_ids),
+                                   variable_basis=variable_basis)
+
+
+@dataclasses.dataclass(frozen=True)
+class NodeResult:
+    """Outcome of node processed by a worker, children are passed as tasks."""
+
+    # outcome without children
+    outcome: NodeOutcome
+    children: Optional[Tuple[NodeTask, ...]]
+
+
+class TreeSearchWorker:
+    """
+    Solves nodes of Branch-And-Price tree in a worker process. Worker keeps its own
+    column pool and pricer and, as the process is spawned, its own Gurobi environment.
+    Objective value of the best integer solution is shared by all processes,
+    it is read in each iteration of column generation, so nodes dominated by solutions
+    found by other workers are pruned as soon as possible.
+    """
+
+    def __init__(self, gap_instance: GeneralAssignmentProblem, settings: ColumnGenerationSettings, shared_mip_lb):
+        """
+        :param shared_mip_lb: `multiprocessing.Value` with objective value of the best integer solution,
+                              minus infinity if no solution was found yet
+        """
+        # nodes are solved in parallel by processes, so each Gurobi model uses single thread
+        grb.setParam(grb.GRB.Param.Threads, 1)
+
+        self.shared_mip_lb = shared_mip_lb
+        self.column_pool = ColumnPool()
+        self.pricer = KnapsackPricer(gap_instance=gap_instance, settings=settings)
+        self.node_processor = NodeProcessor(gap_instance=gap_instance,
+                                            column_pool=self.column_pool,
+                                            pricer=self.pricer,
+                                            settings=settings,
+                                            debug_artifact_recorder=DebugArtifactRecorder())
+
+    def solve(self, task: NodeTask) -> NodeResult:
+        outcome = self.node_processor.process(task.unpack(self.column_pool), self._mip_lb)
+        children = None \
+            if outcome.children is None \
+            else tuple(NodeTask.pack(child, self.column_pool) for child in outcome.children)
+        return NodeResult(outcome=dataclasses.replace(outcome, children=None), children=children)
+
+    def _mip_lb(self) -> Optional[float]:
+        mip_lb = self.shared_mip_lb.value
+        return None if math.isinf(mip_lb) else mip_lb
+
+
+_worker: Optional[TreeSearchWorker] = None
+
+
+def init_tree_search_worker(gap_instance: GeneralAssignmentProblem,
+                            settings: ColumnGenerationSettings,
+                            shared_mip_lb,
+                            log_level: int):
+    """Initializer of worker process."""
+    global _worker
+    logging.basicConfig(format='%(processName)s %(message)s', level=log_level)
+    _worker = TreeSearchWorker(gap_instance, settings, shared_mip_lb)
+
+
+def solve_node(task: NodeTask) -> NodeResult:
+    return _worker.solve(task)
@@ -0,0 +1,51 @@
+import math
+from typing import List, Dict
+
+from branch_and_price.settings import ColumnGenerationSettings, MachineOrdering
+
+
+class PartialPricing:
+    """
+    Decides in which order knapsack subproblems of machines are solved
+    and when a pricing round can stop before all machines are priced.
+    Round is stopped early only if some machines returned columns with
+    positive reduced cost, so a round that finds no such column always
+    prices all machines and optimality of RMP is never declared prematurely.
+    """
+
+    def __init__(self,
+                 num_machines: int,
+                 settings: ColumnGenerationSettings):
+        self.num_machines = num_machines
+        self.settings = settings
+
+        self._next_first_machine = 0
+        # objective value of machine's subproblem when it was priced last time
+        self._machine_to_last_objective_value: Dict[int, float] = dict()
+
+    def machine_order(self) -> List[int]:
+        machines = list(range(self.num_machines))
+
+        if self.settings.machine_ordering == MachineOrdering.ROUND_ROBIN:
+            first = self._next_first_machine
+            return machines[first:] + machines[:first]
+
+        if self.settings.machine_ordering == MachineOrdering.MOST_PROFITABLE:
+            # machines which have not been priced yet go first
+            return sorted(machines,
+                          key=lambda machine: -self._machine_to_last_objective_value.get(machine, math.inf))
+
+        return machines
+
+    def record(self, machine_id: int, objective_value: float):
+        """Records result of pricing a machine."""
+        self._machine_to_last_objective_value[machine_id] = \
+            objective_value \
+            if objective_value is not None \
+            else -math.inf
+        self._next_first_machine = (machine_id + 1) % self.num_machines
+
+    def is_round_finished(self, num_improving_machines: int) -> bool:
+        """Returns true if enough machines returned columns with positive reduced cost."""
+        max_improving_machines = self.settings.max_improving_machines
+        return max_improving_machines is not None and num_improving_machines >= max_improving_machines
@@ -0,0 +1,29 @@
+import dataclasses
+from typing import List, Optional
+
+from common import TMachineSchedule, is_positive
+
+
+@dataclasses.dataclass(frozen=True)
+class PricingResult:
+    """Result of solving knapsack subproblem for a machine."""
+
+    machine_id: int
+    # None if subproblem has no solution
+    objective_value: Optional[float]
+    machine_schedules: List[TMachineSchedule]
+    # upper bound on objective value of subproblem, None if subproblem was not solved exactly
+    objective_bound: Optional[float] = None
+
+    def is_improving(self) -> bool:
+        """Returns true if subproblem found columns with positive reduced cost."""
+        return self.objective_value is not None and is_positive(self.objective_value)
+
+
+@dataclasses.dataclass(frozen=True)
+class PricingRound:
+    """Results of pricing machines for given duals."""
+
+    results: List[PricingResult]
+    # true if subproblems of all machines were solved to optimality
+    complete: bool
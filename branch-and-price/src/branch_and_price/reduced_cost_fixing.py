@@ -0,0 +1,97 @@
+import math
+from typing import List
+
+import numpy as np
+
+from branch_and_price.branching_rule import BranchingRule, forced_and_allowed_assignments
+from branch_and_price.dual_stabilization import Duals
+from input_data import GeneralAssignmentProblem
+
+
+class ReducedCostFixing:
+    """
+    Forbids assignments of tasks to machines which cannot be part of an integer solution
+    better than the best one found so far. Lagrangian bound for duals (pi, mu) is
+    sum of duals plus sum of bounds of knapsack subproblems of machines. If task `t` were
+    forced to machine `m`, only subproblem of `m` would change, its bound is at most
+    reduced profit of `t` plus bound of LP relaxation (fractional knapsack) of remaining capacity.
+    If the resulting bound is not better than the best integer solution, assignment of `t` to `m`
+    is forbidden in whole subtree of node by implied branching rule.
+    """
+
+    def __init__(self, gap_instance: GeneralAssignmentProblem):
+        self.gap_instance = gap_instance
+
+    def implied_rules(self,
+                      lagrangian_bound: float,
+                      duals: Duals,
+                      subproblem_bounds: np.ndarray,
+                      branching_rules: List[BranchingRule],
+                      mip_lb: float) -> List[BranchingRule]:
+        """
+        :param lagrangian_bound: value of Lagrangian relaxation for `duals`
+        :param subproblem_bounds: bounds of subproblems of machines for `duals`, their sum is part of the bound
+        :param branching_rules: rules of node, including rules implied before
+        :param mip_lb: objective value of the best integer solution
+        :return: rules forbidding assignments which are allowed and not forced by `branching_rules`
+        """
+        forced, allowed = forced_and_allowed_assignments(branching_rules,
+                                                         num_machines=self.gap_instance.num_machines,
+                                                         num_tasks=self.gap_instance.num_tasks)
+        reduced_profits = self.gap_instance.profits - duals.task_duals[np.newaxis, :]
+        weights = self.gap_instance.weights
+
+        implied_rules = []
+        for machine_id in range(self.gap_instance.num_machines):
+            candidates = allowed[machine_id] & ~forced[machine_id]
+            if not candidates.any():
+                continue
+
+            # relaxation of subproblem with task forced - remaining tasks allowed on machine may be assigned
+            # fractionally, task itself stays available, so bound does not need to be computed for each task
+            remaining_capacities = self.gap_instance.capacity[machine_id] - weights[machine_id]
+            forced_bounds = reduced_profits[machine_id] \
+                + self._fractional_knapsack_bounds(np.where(allowed[machine_id], reduced_profits[machine_id], 0.0),
+                                                   weights[machine_id],
+                                                   remaining_capacities) \
+                - duals.machine_duals[machine_id]
+            bounds = lagrangian_bound - subproblem_bounds[machine_id] + forced_bounds
+
+            for task_id in np.flatnonzero(candidates & (bounds <= mip_lb)):
+                implied_rules.append(BranchingRule(task=int(task_id), machine=machine_id, assigned=False))
+
+        return implied_rules
+
+    @classmethod
+    def _fractional_knapsack_bounds(cls,
+                                    profits: np.ndarray,
+                                    weights: np.ndarray,
+                                    capacities: np.ndarray) -> np.ndarray:
+        """
+        Returns optimal objective values of LP relaxation of knapsack problem with given items,
+        one for each capacity, minus infinity for negative capacity.
+        """
+        items = profits > 0
+        weightless = items & (weights <= 0)
+        items &= ~weightless
+        weightless_profit = profits[weightless].sum()
+        if not items.any():
+            return np.where(capacities < 0, -math.inf, weightless_profit)
+
+        order = np.argsort(-(profits[items] / weights[items]), kind='stable')
+        sorted_profits = profits[items][order]
+        sorted_weights = weights[items][order]
+        cumulative_profits = np.concatenate(([0.0], np.cumsum(sorted_profits)))
+        cumulative_weights = np.concatenate(([0.0], np.cumsum(sorted_weights)))
+
+        # number of items which fit into capacity as a whole, the next item is added fractionally
+        whole_items = np.searchsorted(cumulative_weights, capacities, side='right') - 1
+        whole_items = np.clip(whole_items, 0, len(sorted_profits))
+        next_item = np.minimum(whole_items, len(sorted_profits) - 1)
+        fractional_profits = np.where(whole_items < len(sorted_profits),
+                                      (capacities - cumulative_weights[whole_items])
+                                      * sorted_profits[next_item] / sorted_weights[next_item],
+                                      0.0)
+
+        bounds = weightless_profit + cumulative_profits[whole_items] + fractional_profits
+        return np.where(capacities < 0, -math.inf, bounds)
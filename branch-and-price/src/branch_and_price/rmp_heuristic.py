@@ -0,0 +1,45 @@
+import logging
+from typing import Optional
+
+from branch_and_price.branch_node import BranchNode
+from branch_and_price.incumbent import Incumbent
+from branch_and_price.settings import ColumnGenerationSettings
+
+
+class RestrictedMasterHeuristic:
+    """
+    Primal heuristic which solves columns of RMP of a node with fractional solution
+    as binary MIP under time limit. It runs at root node, at every n-th node
+    with fractional solution and at nodes where column generation tailed off.
+    """
+
+    def __init__(self, settings: ColumnGenerationSettings):
+        self.settings = settings
+        self.runs = 0
+        self._fractional_nodes = 0
+
+    def run(self, node: BranchNode, mip_lb: Optional[float]) -> Optional[Incumbent]:
+        """
+        Called for each node with fractional solution.
+        :param mip_lb: objective value of the best integer solution found so far
+        :return: integer solution better than `mip_lb` if heuristic ran and found it, None otherwise
+        """
+        self._fractional_nodes += 1
+        if not self.settings.rmp_heuristic or not self._is_triggered(node):
+            return None
+
+        self.runs += 1
+        incumbent = node.restricted_master_mip(self.settings.rmp_heuristic_time_limit, mip_lb)
+        if incumbent is None or (mip_lb is not None and incumbent.objective_value <= mip_lb):
+            logging.info("[BAP] RMP heuristic found no improving solution at node %d.", node.id)
+            return None
+
+        logging.info("[BAP] RMP heuristic found solution with objective value %.1f at node %d.",
+                     incumbent.objective_value, node.id)
+        return incumbent
+
+    def _is_triggered(self, node: BranchNode) -> bool:
+        frequency = self.settings.rmp_heuristic_frequency
+        return node.depth == 0 \
+            or (frequency > 0 and self._fractional_nodes % frequency == 0) \
+            or (self.settings.rmp_heuristic_on_tail_off and node.tailed_off)
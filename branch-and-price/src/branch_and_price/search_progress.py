@@ -0,0 +1,68 @@
+import dataclasses
+import enum
+import math
+from typing import Optional
+
+from branch_and_price.incumbent import Incumbent
+
+# relative gap is computed with respect to at least this absolute value of the best integer solution
+GAP_EPSILON = 1e-10
+
+
+class SolveStatus(enum.Enum):
+    # all open nodes were processed or pruned and the best integer solution is optimal
+    OPTIMAL = 'optimal'
+    # all open nodes were processed or pruned and no integer solution was found
+    INFEASIBLE = 'infeasible'
+    TIME_LIMIT = 'time_limit'
+    NODE_LIMIT = 'node_limit'
+    # relative gap between the best integer solution and the best bound of open nodes reached its limit
+    GAP_LIMIT = 'gap_limit'
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchProgress:
+    """State of Branch-And-Price search passed to callbacks."""
+
+    # seconds since search started
+    elapsed_time: float
+    processed_nodes: int
+    open_nodes: int
+    # the best integer solution found so far
+    incumbent: Optional[Incumbent]
+    # upper bound on objective value of any integer solution, the best bound of open nodes
+    # or objective value of the best integer solution if it is better
+    dual_bound: float
+
+    @property
+    def primal_bound(self) -> Optional[float]:
+        return None if self.incumbent is None else self.incumbent.objective_value
+
+    @property
+    def relative_gap(self) -> float:
+        """Gap between bounds relative to the best integer solution, infinity if no solution was found."""
+        if self.incumbent is None or math.isinf(self.dual_bound):
+            return math.inf
+        return (self.dual_bound - self.primal_bound) / max(abs(self.primal_bound), GAP_EPSILON)
+
+
+@dataclasses.dataclass(frozen=True)
+class SolveResult(SearchProgress):
+    """Result of Branch-And-Price search returned by `GAPBranchAndPrice.solve`."""
+
+    status: SolveStatus
+
+
+class SearchCallback:
+    """
+    Receives progress of Branch-And-Price search. Callbacks are called by the process
+    which keeps open nodes, between processing of nodes.
+    """
+
+    def on_incumbent(self, progress: SearchProgress):
+        """Called once a better integer solution is found, it is `progress.incumbent`."""
+        pass
+
+    def on_dual_bound(self, progress: SearchProgress):
+        """Called once the best bound of open nodes improves (decreases)."""
+        pass
@@ -0,0 +1,138 @@
+import dataclasses
+import enum
+from typing import Optional
+
+
+class PricingMethod(enum.Enum):
+    """Method used to solve knapsack subproblems (pricing problems)."""
+
+    # knapsack is solved as MIP using Gurobi
+    GUROBI = 'gurobi'
+    # knapsack is solved using dynamic programming over integer capacities,
+    # Gurobi is used for machines with non-integer weights
+    DYNAMIC_PROGRAMMING = 'dynamic_programming'
+
+
+class MachineOrdering(enum.Enum):
+    """Order in which knapsack subproblems of machines are solved in a pricing round."""
+
+    # machines are priced by increasing id
+    NATURAL = 'natural'
+    # each round starts with the machine following the last machine priced in previous round
+    ROUND_ROBIN = 'round_robin'
+    # machines whose subproblem had the highest objective value in previous round go first
+    MOST_PROFITABLE = 'most_profitable'
+
+
+class DualStabilizationMethod(enum.Enum):
+    """Method used to stabilize duals of RMP in column generation."""
+
+    NONE = 'none'
+    # subproblems are priced using convex combination of stability center and duals of RMP
+    WENTGES = 'wentges'
+    # du Merle penalty variables keep duals close to stability center (boxstep with infinite penalty bound)
+    PENALTY = 'penalty'
+
+
+class NodeDerivation(enum.Enum):
+    """How RMP of a child node is created when branching."""
+
+    # RMP is built using columns of parent node satisfying branching rules
+    REBUILD = 'rebuild'
+    # RMP is built using all columns of parent node, columns violating branching rules
+    # are disabled and RMP is warm started from basis of parent node
+    DERIVE = 'derive'
+
+
+class NodeSelection(enum.Enum):
+    """Order in which open nodes of Branch-And-Price tree are processed."""
+
+    BREADTH_FIRST = 'breadth_first'
+    DEPTH_FIRST = 'depth_first'
+    # node with the best bound of its parent goes first
+    BEST_BOUND = 'best_bound'
+    # dives into the first child of the last processed node, best bound node is selected once a dive ends
+    HYBRID = 'hybrid'
+
+
+class BranchingSelection(enum.Enum):
+    """How assignment of task to machine which node is branched on is chosen."""
+
+    # the first assignment by machine and task
+    FIRST_FRACTIONAL = 'first_fractional'
+    # assignment whose value is the closest to 0.5
+    MOST_FRACTIONAL = 'most_fractional'
+    # assignment with the best product of estimated degradations of bounds of children,
+    # estimates are based on degradations per unit of change observed in whole tree
+    PSEUDO_COST = 'pseudo_cost'
+    # the best candidates by pseudo costs are evaluated by few iterations of column generation in children
+    STRONG = 'strong'
+
+
+@dataclasses.dataclass(frozen=True)
+class ColumnGenerationSettings:
+    """Settings of column generation performed at each node of Branch-And-Price tree."""
+
+    pricing_method: PricingMethod = PricingMethod.GUROBI
+    # number of threads solving knapsack subproblems of different machines in parallel
+    pricing_threads: int = 1
+    # order in which machines are priced
+    machine_ordering: MachineOrdering = MachineOrdering.NATURAL
+    # pricing round stops once this many machines returned columns with positive reduced cost,
+    # None means that all machines are priced in each round
+    max_improving_machines: Optional[int] = None
+    # greedy heuristic looks for columns with positive reduced cost before subproblems are solved exactly
+    heuristic_pricing: bool = False
+    # maximal number of columns with positive reduced cost added for each machine in a pricing round
+    columns_per_machine: int = 1
+    # minimal number of tasks in which any two columns added for a machine in a pricing round differ
+    min_hamming_distance: int = 1
+    # column generation stops once relative gap between RMP objective value and Lagrangian bound
+    # is below this tolerance, None means that it runs until no column with positive reduced cost exists
+    gap_tolerance: Optional[float] = None
+    dual_stabilization: DualStabilizationMethod = DualStabilizationMethod.NONE
+    # initial weight of stability center in Wentges smoothing, adapted during column generation
+    smoothing_alpha: float = 0.5
+    # half width of box around stability center in which duals are not penalized
+    penalty_box_width: float = 1.0
+    # upper bound of penalty variables, infinity turns penalty method into boxstep method
+    penalty_bound: float = 0.1
+    # number of times the box is shrunk before penalty variables are removed from RMP
+    max_penalty_updates: int = 10
+    node_derivation: NodeDerivation = NodeDerivation.REBUILD
+    # variables of RMP are named after machine schedules they represent, names make reports
+    # and debug artifacts readable but building them slows down adding columns
+    column_names: bool = True
+    # breadth-first selection processes nodes in order of their creation, as the original FIFO queue did
+    node_selection: NodeSelection = NodeSelection.BREADTH_FIRST
+    # number of processes solving nodes of Branch-And-Price tree in parallel,
+    # with 1 nodes are solved one by one by the main process
+    tree_search_workers: int = 1
+    branching_selection: BranchingSelection = BranchingSelection.FIRST_FRACTIONAL
+    # number of candidates for branching evaluated by strong branching
+    strong_branching_candidates: int = 8
+    # number of column generation iterations performed in each child evaluated by strong branching
+    strong_branching_iterations: int = 10
+    # RMP heuristic solves columns of RMP of a node as binary MIP, it runs at root node,
+    # at every n-th node with fractional solution (0 disables it) and at nodes where column generation tailed off
+    rmp_heuristic: bool = False
+    rmp_heuristic_frequency: int = 10
+    rmp_heuristic_on_tail_off: bool = True
+    # time limit in seconds of a single run of RMP heuristic
+    rmp_heuristic_time_limit: float = 1.0
+    # assignments of tasks to machines which cannot be part of better integer solution by Lagrangian bound
+    # are forbidden in subtree of node
+    reduced_cost_fixing: bool = False
+    # state of search is periodically written to this file so that it can be resumed, None disables checkpoints
+    checkpoint_path: Optional[str] = None
+    # minimal number of seconds between two checkpoints
+    checkpoint_interval: float = 300.0
+    # search stops once this many seconds elapsed, nodes being processed are finished first
+    time_limit: Optional[float] = None
+    # search stops once this many nodes were processed
+    node_limit: Optional[int] = None
+    # search stops once relative gap between the best integer solution and the best bound of open nodes
+    # is below this limit
+    mip_gap_limit: Optional[float] = None
+    # events of Branch-And-Price tree are appended to this JSONL file, None disables the log
+    tree_event_log_path: Optional[str] = None
@@ -3,7 +3,9 @@ from typing import Tuple, Optional, List
 import gurobipy.gurobipy as grb
 from bidict import bidict
 
-from common import TMachineSchedule, is_non_zero, has_solution
+from common import TMachineSchedule, is_non_zero, has_solution, is_positive, select_diverse_machine_schedules
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from input_data import GeneralAssignmentProblem
 
 
 class Subproblem:
@@ -12,24 +14,46 @@ class Subproblem:
     """
 
     def __init__(self,
+                 gap_instance: GeneralAssignmentProblem,
                  machine_id: int,
                  model: grb.Model,
                  task_to_variable: bidict[int, grb.Var]):
 
+        self.gap_instance = gap_instance
         self.machine_id = machine_id
         self._model = model
         self.task_to_variable = task_to_variable
         self._objective_value = None
+        self._objective_bound = None
+
+    def reset(self):
+        """Forgets objective value after model has been modified."""
+        self._objective_value = None
+        self._objective_bound = None
 
     def solve(self):
         self._model.optimize()
         self._objective_value = self._model.ObjVal \
             if has_solution(self._model.status) \
             else None
+        self._objective_bound = self._model.ObjBound \
+            if has_solution(self._model.status) \
+            else None
+
+    def dispose(self):
+        """Frees Gurobi model, subproblem cannot be solved afterwards."""
+        self._model.dispose()
 
     def objective_value(self) -> Optional[float]:
         return self._objective_value
 
+    def objective_bound(self) -> Optional[float]:
+        """Upper bound on optimal objective value, it differs from objective value by at most MIP gap."""
+        return self._objective_bound
+
+    def write(self, recorder: DebugArtifactRecorder, name: str, node_id: int, itr_cnt: int):
+        recorder.record(self._model, name, node_id=node_id, itr_cnt=itr_cnt)
+
     def solution(self) -> Optional[TMachineSchedule]:
         machine_schedule = None
         if self._model.status == grb.GRB.Status.OPTIMAL:
@@ -40,7 +64,7 @@ class Subproblem:
                 if is_non_zero(var.x)
             ]
 
-            machine_schedule = (self.machine_id, tasks)
+            machine_schedule = self.gap_instance.machine_schedule(self.machine_id, tasks)
         return machine_schedule
 
     def all_solutions(self) -> List[TMachineSchedule]:
@@ -56,6 +80,24 @@ class Subproblem:
             machine_schedules.append(self._get_solution())
         return machine_schedules
 
+    def best_solutions(self, max_count: int, min_hamming_distance: int) -> List[TMachineSchedule]:
+        """
+        Returns at most `max_count` solutions from solution pool with positive objective value
+        (columns with positive reduced cost) which differ pairwise in at least `min_hamming_distance` tasks.
+        Solutions are considered from the best one.
+        """
+        if self._model.status != grb.GRB.Status.OPTIMAL:
+            return []
+
+        def _improving_solutions():
+            for k in range(self._model.solCount):
+                self._model.Params.solutionNumber = k
+                if not is_positive(self._model.poolObjVal):
+                    break
+                yield self._get_solution()
+
+        return select_diverse_machine_schedules(_improving_solutions(), max_count, min_hamming_distance)
+
     def _get_solution(self) -> TMachineSchedule:
         machine_schedule = None
         if self._model.status == grb.GRB.Status.OPTIMAL:
@@ -66,5 +108,5 @@ class Subproblem:
                 if is_non_zero(var.xn)
             ]
 
-            machine_schedule = (self.machine_id, tasks)
+            machine_schedule = self.gap_instance.machine_schedule(self.machine_id, tasks)
         return machine_schedule
@@ -1,4 +1,4 @@
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 import gurobipy.gurobipy as grb
 from bidict import bidict
 
@@ -8,21 +8,99 @@ from input_data import GeneralAssignmentProblem
 
 
 class SubproblemBuilder:
+    """
+    Builds knapsack subproblems solved by Gurobi.
+    Model for each machine is built once and then it is reused
+    in all column generation iterations of all nodes - only objective
+    coefficients, objective constant and bounds of variables are updated.
+    Gurobi environments are not thread safe, so if subproblems of different
+    machines are solved in parallel, each model gets its own environment.
+    """
 
     def __init__(self,
-                 gap_instance: GeneralAssignmentProblem):
+                 gap_instance: GeneralAssignmentProblem,
+                 isolated_environments: bool = False,
+                 solution_pool_size: Optional[int] = None):
+        """
+        :param solution_pool_size: if given, Gurobi keeps this many best solutions of each subproblem
+                                   found while solving it, without searching for more
+        """
         self._gap_instance = gap_instance
+        self._isolated_environments = isolated_environments
+        self._solution_pool_size = solution_pool_size
+        self._machine_to_subproblem: Dict[int, Subproblem] = dict()
+        self._machine_to_environment: Dict[int, grb.Env] = dict()
 
     def build(self,
               machine_id: int,
               machine_dual: float,
               task_duals: List[float],
-              branching_rules: List[BranchingRule]):
+              branching_rules: List[BranchingRule]) -> Subproblem:
+
+        subproblem = self._machine_to_subproblem.get(machine_id)
+        if subproblem is None:
+            subproblem = self._build_model(machine_id, machine_dual, task_duals, branching_rules)
+            self._machine_to_subproblem[machine_id] = subproblem
+        else:
+            self._update_model(subproblem, machine_dual, task_duals, branching_rules)
+
+        return subproblem
+
+    def close(self):
+        """Disposes cached models, then their environments, subproblems cannot be built afterwards."""
+        for subproblem in self._machine_to_subproblem.values():
+            subproblem.dispose()
+        self._machine_to_subproblem.clear()
+        for env in self._machine_to_environment.values():
+            env.dispose()
+        self._machine_to_environment.clear()
 
-        model = grb.Model('GAP_Subproblem')
+    def _update_model(self,
+                      subproblem: Subproblem,
+                      machine_dual: float,
+                      task_duals: List[float],
+                      branching_rules: List[BranchingRule]):
+        """
+        Updates existing model of a subproblem with new duals and
+        bounds implied by branching rules using bulk attribute updates.
+        """
+        machine_id = subproblem.machine_id
+        task_ids = range(self._gap_instance.num_tasks)
+        variables = [subproblem.task_to_variable[task_id] for task_id in task_ids]
+        bounds = [self._lower_and_upper_bound(machine_id, task_id, branching_rules) for task_id in task_ids]
+
+        model = subproblem._model
+        model.setAttr(grb.GRB.Attr.Obj, variables, self._objective_coefficients(machine_id, task_duals))
+        model.setAttr(grb.GRB.Attr.LB, variables, [lb for lb, _ in bounds])
+        model.setAttr(grb.GRB.Attr.UB, variables, [ub for _, ub in bounds])
+        model.setAttr(grb.GRB.Attr.ObjCon, -machine_dual)
+        model.update()
+
+        subproblem.reset()
+
+    def _objective_coefficients(self, machine_id: int, task_duals: List[float]) -> List[float]:
+        return [
+            self._gap_instance.assignment_profit(task_id=task_id, machine_id=machine_id) - task_duals[task_id]
+            for task_id in range(self._gap_instance.num_tasks)
+        ]
+
+    def _build_model(self,
+                     machine_id: int,
+                     machine_dual: float,
+                     task_duals: List[float],
+                     branching_rules: List[BranchingRule]) -> Subproblem:
+
+        model = grb.Model(f'GAP_Subproblem_{machine_id}', env=self._environment(machine_id))
         model.setAttr(grb.GRB.Attr.ModelSense, grb.GRB.MAXIMIZE)
         model.setAttr(grb.GRB.Attr.ObjCon, -machine_dual)
         model.Params.LogToConsole = 0
+        if self._isolated_environments:
+            # each model is solved by a single pricing thread
+            model.Params.Threads = 1
+        if self._solution_pool_size is not None:
+            # systematic search for the best solutions (mode 2) makes pricing several times slower
+            model.Params.PoolSearchMode = 1
+            model.Params.PoolSolutions = self._solution_pool_size
 
         task_to_variable = self._build_columns(
             model,
@@ -40,10 +118,21 @@ class SubproblemBuilder:
         model.update()
 
         return Subproblem(
+            gap_instance=self._gap_instance,
             machine_id=machine_id,
             model=model,
             task_to_variable=bidict(task_to_variable))
 
+    def _environment(self, machine_id: int) -> Optional[grb.Env]:
+        if not self._isolated_environments:
+            return None
+
+        env = grb.Env(empty=True)
+        env.setParam(grb.GRB.Param.OutputFlag, 0)
+        env.start()
+        self._machine_to_environment[machine_id] = env
+        return env
+
     def _build_capacity_constraint(self,
                                    model: grb.Model,
                                    machine_id: int,
@@ -58,11 +147,12 @@ class SubproblemBuilder:
 
     def _build_columns(self, model, machine_id, task_duals, branching_rules) -> Dict[int, grb.Var]:
         task_to_variable: Dict[int, grb.Var] = dict()
+        objective_coefficients = self._objective_coefficients(machine_id, task_duals)
 
         for task_id in range(self._gap_instance.num_tasks):
             lb, ub = self._lower_and_upper_bound(machine_id, task_id, branching_rules)
             name = f'task_{task_id}_machine_{machine_id}'
-            obj = self._gap_instance.assignment_profit(task_id=task_id, machine_id=machine_id) - task_duals[task_id]
+            obj = objective_coefficients[task_id]
             var = model.addVar(
                 lb=lb,
                 ub=ub,
@@ -0,0 +1,94 @@
+import enum
+import json
+import math
+import time
+from typing import Optional, Iterator, Dict, Any, Iterable
+
+from branch_and_price.open_node import OpenNode
+
+
+class TreeEventType(enum.Enum):
+    NODE_CREATED = 'node_created'
+    # column generation at node finished
+    NODE_SOLVED = 'node_solved'
+    NODE_PRUNED = 'node_pruned'
+    NODE_BRANCHED = 'node_branched'
+    NEW_INCUMBENT = 'new_incumbent'
+
+
+class TreeEventLog:
+    """
+    Append-only log of events of Branch-And-Price tree, one JSON object per line.
+    Each event has type, wall clock timestamp and objective value of the best integer
+    solution at the time of the event, node events also have id and bound of the node.
+    Infinite and undefined bounds are written as null. Lines are flushed as they are written,
+    so the log of a killed run is complete up to the last event. Logging is disabled if path is None.
+    Tree is rendered from the log offline by `render_tree.py`, so the module does not depend on the solver
+    and events are given plain values.
+    """
+
+    def __init__(self, path: Optional[str] = None, append: bool = False):
+        """
+        :param append: events are appended to existing log, e.g. when search is resumed
+        """
+        self.path = path
+        # objective value of the best integer solution, it is updated by `new_incumbent`
+        self.primal_bound: Optional[float] = None
+        self._file = None if path is None else open(path, 'a' if append else 'w', buffering=1)
+
+    def is_enabled(self) -> bool:
+        return self._file is not None
+
+    def node_created(self, node: OpenNode, parent_id: Optional[int]):
+        # the last rule of child is the one it was created by
+        rule = None
+        if parent_id is not None:
+            branching_rule = node.branching_rules[-1]
+            rule = {'machine': branching_rule.machine, 'task': branching_rule.task, 'assigned': branching_rule.assigned}
+        self._write(TreeEventType.NODE_CREATED,
+                    node=node.id,
+                    parent=parent_id,
+                    depth=node.depth,
+                    bound=node.parent_bound,
+                    rule=rule)
+
+    def node_solved(self, node_id: int, bound: float, column_generation_iterations: int):
+        self._write(TreeEventType.NODE_SOLVED, node=node_id, bound=bound, iterations=column_generation_iterations)
+
+    def node_pruned(self, node_id: int, reason: str):
+        """:param reason: value of `PruneReason`"""
+        self._write(TreeEventType.NODE_PRUNED, node=node_id, reason=reason)
+
+    def node_branched(self, node_id: int, children: Iterable[OpenNode]):
+        self._write(TreeEventType.NODE_BRANCHED, node=node_id, children=[child.id for child in children])
+
+    def new_incumbent(self, node_id: int, objective_value: float):
+        """:param node_id: id of node the integer solution was found at"""
+        self.primal_bound = objective_value
+        self._write(TreeEventType.NEW_INCUMBENT, node=node_id)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, event_type: TreeEventType, **fields):
+        if self._file is None:
+            return
+
+        event = {'event': event_type.value, 'time': time.time(), 'primal_bound': self.primal_bound}
+        event.update(fields)
+        if 'bound' in event and not math.isfinite(event['bound']):
+            event['bound'] = None
+        self._file.write(json.dumps(event) + '\n')
+
+
+def read_tree_events(path: str) -> Iterator[Dict[str, Any]]:
+    """Yields events of log written by `TreeEventLog`, incomplete last line of a killed run is skipped."""
+    with open(path) as file:
+        for line in file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                if line.endswith('\n'):
+                    raise
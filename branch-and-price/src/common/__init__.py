@@ -1,15 +1,15 @@
-from typing import Tuple, List
+from typing import Tuple, List, Iterable
 from math import isclose
 
 import numpy as np
 import gurobipy.gurobipy as grb
 
+from common.machine_schedule import MachineSchedule
+
 # change to use dataclass?
 TAssignment = Tuple[int, int]  # machine -> task
-
-# change list to frozenset?
 TTask = int
-TMachineSchedule = Tuple[int, List[int]]  # machine -> tasks
+TMachineSchedule = MachineSchedule  # machine -> tasks
 TCompleteSchedule = List[TMachineSchedule]
 
 
@@ -17,6 +17,11 @@ def is_non_zero(var):
     return np.abs(var) > 0.0001
 
 
+def is_positive(val: float) -> bool:
+    """Return true if value is positive and differs from zero by more than tolerance of `is_non_zero`."""
+    return val > 0.0001
+
+
 def is_integer(bool_var_val: float):
     """Return true is variable that is supposed to represent binary variable
     is integer. More specifically if it differs from integer value by less than 1e-05."""
@@ -24,6 +29,28 @@ def is_integer(bool_var_val: float):
     return isclose(bool_var_val, 0.0, abs_tol=eps) or isclose(bool_var_val, 1.0, abs_tol=eps)
 
 
+def is_integer_array(bool_var_vals: np.ndarray) -> np.ndarray:
+    """Vectorized version of `is_integer`, returns mask of values that differ from 0 or 1 by less than 1e-05."""
+    eps = 1e-05
+    return (np.abs(bool_var_vals) <= eps) | (np.abs(bool_var_vals - 1.0) <= eps)
+
+
+def select_diverse_machine_schedules(machine_schedules: Iterable[TMachineSchedule],
+                                     max_count: int,
+                                     min_hamming_distance: int) -> List[TMachineSchedule]:
+    """
+    Greedily selects at most `max_count` machine schedules in given order such that
+    sets of tasks of any two selected schedules differ in at least `min_hamming_distance` tasks.
+    """
+    selected: List[TMachineSchedule] = []
+    for machine_schedule in machine_schedules:
+        if len(selected) >= max_count:
+            break
+        if all(machine_schedule.hamming_distance(other) >= min_hamming_distance for other in selected):
+            selected.append(machine_schedule)
+    return selected
+
+
 def has_solution(model_status) -> bool:
     """
     Uses model status to determine whether model has
@@ -0,0 +1,151 @@
+import dataclasses
+import enum
+import itertools
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import zipfile
+from typing import Optional, FrozenSet, Set
+
+import gurobipy.gurobipy as grb
+
+
+class ArtifactFormat(enum.Enum):
+    LP = 'lp'
+    MPS = 'mps'
+
+
+@dataclasses.dataclass(frozen=True)
+class DebugArtifactSettings:
+    # path of zip archive models are written to, recording is disabled if it is None
+    archive_path: Optional[str] = None
+    file_format: ArtifactFormat = ArtifactFormat.LP
+    # models solved in column generation are recorded only in every n-th iteration
+    every_nth_iteration: int = 1
+    # models solved in column generation are recorded only for these nodes, for all nodes if None
+    node_ids: Optional[FrozenSet[int]] = None
+
+
+class DebugArtifactRecorder:
+    """
+    Records models for debugging purposes into single zip archive.
+    Thread that calls `record` only copies model, as model might be modified right after.
+    Copy is written to a temporary file and compressed into archive by background writer thread,
+    so writing a model does not delay the solver. Copies are made in separate Gurobi environment
+    of the recorder, which is used by one thread at a time. Recording is disabled by default.
+    """
+
+    def __init__(self, settings: Optional[DebugArtifactSettings] = None):
+        if settings is None:
+            settings = DebugArtifactSettings()
+        if settings.every_nth_iteration < 1:
+            raise ValueError(f'every_nth_iteration must be at least 1, got {settings.every_nth_iteration}.')
+        self.settings = settings
+
+        # names of files in archive, models recorded under the same name get a sequence number
+        self._file_names: Set[str] = set()
+        self._file_names_lock = threading.Lock()
+
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._temporary_directory: Optional[str] = None
+        self._env: Optional[grb.Env] = None
+        # guards environment of the recorder, it is shared by threads that record and the writer thread
+        self._env_lock = threading.Lock()
+
+        if self.is_enabled():
+            self._env = grb.Env(empty=True)
+            self._env.setParam('OutputFlag', 0)
+            self._env.start()
+            self._temporary_directory = tempfile.mkdtemp(prefix='debug_artifacts_')
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._write_archive,
+                                            name='debug-artifact-writer',
+                                            daemon=True)
+            self._writer.start()
+
+    def is_enabled(self) -> bool:
+        return self.settings.archive_path is not None
+
+    def should_record(self, node_id: Optional[int] = None, itr_cnt: Optional[int] = None) -> bool:
+        """
+        Returns true if model of given node and column generation iteration is sampled.
+        Models which are not related to any node or iteration are always recorded if recording is enabled.
+        """
+        if not self.is_enabled():
+            return False
+
+        if node_id is not None and self.settings.node_ids is not None and node_id not in self.settings.node_ids:
+            return False
+
+        if itr_cnt is not None and itr_cnt % self.settings.every_nth_iteration != 0:
+            return False
+
+        return True
+
+    def record(self,
+               model: grb.Model,
+               name: str,
+               node_id: Optional[int] = None,
+               itr_cnt: Optional[int] = None):
+        """
+        :param model: model to record
+        :param name: name of file in archive, without extension
+        :param node_id: id of branch node model belongs to, if any
+        :param itr_cnt: column generation iteration, if any
+        """
+        if not self.should_record(node_id, itr_cnt):
+            return
+
+        file_name = self._unique_file_name(name)
+        # pending modifications are not copied
+        model.update()
+        with self._env_lock:
+            model_copy = model.copy(env=self._env)
+        self._queue.put((model_copy, file_name))
+
+    def close(self):
+        """Waits until all recorded models are written into archive."""
+        if self._writer is None:
+            return
+
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+        self._env.dispose()
+        self._env = None
+        shutil.rmtree(self._temporary_directory, ignore_errors=True)
+        logging.info("Debug artifacts written to %s", self.settings.archive_path)
+
+    def _unique_file_name(self, name: str) -> str:
+        """
+        Returns name of file in archive, e.g. models of strong branching probes or models written by
+        several solution methods share name, duplicates are numbered as `name.1`, `name.2`, ...
+        """
+        extension = self.settings.file_format.value
+        with self._file_names_lock:
+            file_name = f'{name}.{extension}'
+            sequence_number = itertools.count(start=1)
+            while file_name in self._file_names:
+                file_name = f'{name}.{next(sequence_number)}.{extension}'
+            self._file_names.add(file_name)
+        return file_name
+
+    def _write_archive(self):
+        with zipfile.ZipFile(self.settings.archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            while (item := self._queue.get()) is not None:
+                model, file_name = item
+                file_path = os.path.join(self._temporary_directory, file_name)
+                try:
+                    with self._env_lock:
+                        try:
+                            model.write(file_path)
+                        finally:
+                            model.dispose()
+                    archive.write(file_path, arcname=file_name)
+                    os.remove(file_path)
+                except (OSError, grb.GurobiError):
+                    logging.exception("Failed to write debug artifact %s", file_name)
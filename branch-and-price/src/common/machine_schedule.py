@@ -0,0 +1,77 @@
+from typing import Iterable, List
+
+
+class MachineSchedule:
+    """
+    Assignment of tasks to a machine (column of RMP). Tasks are stored as bitmask
+    (Python integer where bit `t` is set if task `t` is assigned), so membership test,
+    comparison and hashing are bit operations. Profit and weight of the schedule are cached.
+    Schedule is immutable (assigning attributes raises AttributeError), hence it is never copied.
+    """
+
+    __slots__ = ('machine_id', 'task_mask', 'profit', 'weight')
+
+    def __init__(self, machine_id: int, task_mask: int, profit: float, weight: float):
+        object.__setattr__(self, 'machine_id', machine_id)
+        object.__setattr__(self, 'task_mask', task_mask)
+        object.__setattr__(self, 'profit', profit)
+        object.__setattr__(self, 'weight', weight)
+
+    @classmethod
+    def task_mask_of(cls, tasks: Iterable[int]) -> int:
+        task_mask = 0
+        for task in tasks:
+            task_mask |= 1 << int(task)
+        return task_mask
+
+    @property
+    def tasks(self) -> List[int]:
+        """Returns assigned tasks in increasing order."""
+        tasks = []
+        task_mask = self.task_mask
+        while task_mask:
+            lowest_bit = task_mask & -task_mask
+            tasks.append(lowest_bit.bit_length() - 1)
+            task_mask ^= lowest_bit
+        return tasks
+
+    @property
+    def name(self) -> str:
+        return f"machine_{self.machine_id}_tasks_{'_'.join(str(task_id) for task_id in self.tasks)}"
+
+    def hamming_distance(self, other: 'MachineSchedule') -> int:
+        """Returns number of tasks assigned in exactly one of two machine schedules."""
+        return bin(self.task_mask ^ other.task_mask).count('1')
+
+    def __contains__(self, task: int) -> bool:
+        return (self.task_mask >> task) & 1 == 1
+
+    def __len__(self) -> int:
+        return bin(self.task_mask).count('1')
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MachineSchedule):
+            return NotImplemented
+        return self.machine_id == other.machine_id and self.task_mask == other.task_mask
+
+    def __hash__(self) -> int:
+        return hash((self.machine_id, self.task_mask))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'MachineSchedule is immutable, cannot assign {name}')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'MachineSchedule is immutable, cannot delete {name}')
+
+    def __reduce__(self):
+        # slots are restored by constructor, as assigning them is not allowed
+        return MachineSchedule, (self.machine_id, self.task_mask, self.profit, self.weight)
+
+    def __copy__(self) -> 'MachineSchedule':
+        return self
+
+    def __deepcopy__(self, memo) -> 'MachineSchedule':
+        return self
+
+    def __repr__(self) -> str:
+        return f'MachineSchedule(machine_id={self.machine_id}, tasks={self.tasks})'
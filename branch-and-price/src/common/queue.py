@@ -1,4 +1,5 @@
-from typing import Generic, List, TypeVar, Collection
+from collections import deque
+from typing import Generic, TypeVar, Collection, Deque, Iterator
 
 T = TypeVar("T")
 
@@ -6,7 +7,7 @@ T = TypeVar("T")
 class Queue(Generic[T]):
 
     def __init__(self, lst: Collection[T] = None):
-        self._queue: List[T] = list(lst) if lst else list()
+        self._queue: Deque[T] = deque(lst) if lst else deque()
 
     def push(self, el: T):
         """
@@ -16,7 +17,13 @@ class Queue(Generic[T]):
         self._queue.append(el)
 
     def pop(self) -> T:
-        return self._queue.pop(0)
+        return self._queue.popleft()
 
     def is_empty(self) -> bool:
         return not self._queue
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._queue)
+
+    def __len__(self) -> int:
+        return len(self._queue)
@@ -2,7 +2,9 @@ from dataclasses import dataclass
 
 import numpy as np
 
-from common import TMachineSchedule
+from typing import Iterable
+
+from common import TMachineSchedule, MachineSchedule
 
 
 @dataclass(frozen=True)
@@ -18,9 +20,15 @@ class GeneralAssignmentProblem:
         return self.profits[machine_id][task_id]
 
     def machine_schedule_profit(self, machine_schedule: TMachineSchedule) -> float:
-        machine_id = machine_schedule[0]
-        tasks = machine_schedule[1]
-        return self.profits[machine_id][tasks].sum()
+        return machine_schedule.profit
+
+    def machine_schedule(self, machine_id: int, tasks: Iterable[int]) -> TMachineSchedule:
+        """Creates machine schedule assigning `tasks` to machine with cached profit and weight."""
+        tasks = [int(task) for task in tasks]
+        return MachineSchedule(machine_id=machine_id,
+                               task_mask=MachineSchedule.task_mask_of(tasks),
+                               profit=float(self.profits[machine_id][tasks].sum()),
+                               weight=float(self.weights[machine_id][tasks].sum()))
 
     def weight(self, task_id: int, machine_id: int) -> float:
         return self.weights[machine_id][task_id]
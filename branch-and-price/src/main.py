@@ -4,7 +4,9 @@ import sys
 import gurobipy.gurobipy as grb
 
 import input_data
-from branch_and_price import GAPBranchAndPrice
+from branch_and_price import GAPBranchAndPrice, ColumnGenerationSettings, PricingMethod, MachineOrdering, \
+    DualStabilizationMethod, NodeDerivation, NodeSelection, BranchingSelection, Checkpoint
+from common.debug_artifact_recorder import DebugArtifactRecorder, DebugArtifactSettings, ArtifactFormat
 from standalone_model import \
     GAPStandaloneModelBuilder, \
     GAPStandaloneModelLpRelaxation, \
@@ -14,6 +16,7 @@ from standalone_model.dantzig_wolfe_formulation_gap_standalone_model_builder imp
 
 
 def main():
+    debug_artifact_recorder = None
     try:
         fm_with_date = '%(asctime)s %(levelname)s: %(message)s'
         fmt_basic = '%(message)s'
@@ -22,19 +25,202 @@ def main():
                             level=logging.INFO)
 
         parser = argparse.ArgumentParser(description="Solves machine assignment problem.")
-        parser.add_argument('data_set. See branch-and-price/src/input_data/general_assignment_problem.py '
-                            'for details of each data set.',
+        parser.add_argument('data_set',
                             choices=['example_applied_integer_programming',
                                      'exercise_applied_integer_programming',
                                      'small_example',
                                      'medium_example'],
-                            help='Name of data set.')
+                            help='Name of data set. See branch-and-price/src/input_data/'
+                                 'general_assignment_problem.py for details of each data set.')
 
         parser.add_argument('--method',
                             choices=['standalone', 'branch_and_price', 'both'],
                             default='both',
                             help='A method that should be used to solve a problem. default=both.')
+
+        parser.add_argument('--pricing',
+                            choices=[pricing_method.value for pricing_method in PricingMethod],
+                            default=PricingMethod.GUROBI.value,
+                            help='A method used to solve knapsack subproblems in Branch-And-Price. '
+                                 'default=gurobi.')
+
+        parser.add_argument('--pricing-threads',
+                            type=int,
+                            default=1,
+                            help='Number of threads solving knapsack subproblems of different machines '
+                                 'in parallel. default=1.')
+
+        parser.add_argument('--machine-ordering',
+                            choices=[machine_ordering.value for machine_ordering in MachineOrdering],
+                            default=MachineOrdering.NATURAL.value,
+                            help='Order in which machines are priced in column generation. default=natural.')
+
+        parser.add_argument('--max-improving-machines',
+                            type=int,
+                            default=None,
+                            help='Pricing round stops once this many machines returned columns with '
+                                 'positive reduced cost. By default all machines are priced.')
+
+        parser.add_argument('--heuristic-pricing',
+                            action='store_true',
+                            help='Look for columns with positive reduced cost using greedy heuristic '
+                                 'before solving knapsack subproblems exactly.')
+
+        parser.add_argument('--columns-per-machine',
+                            type=int,
+                            default=1,
+                            help='Maximal number of columns with positive reduced cost added for each machine '
+                                 'in a pricing round. default=1.')
+
+        parser.add_argument('--min-hamming-distance',
+                            type=int,
+                            default=1,
+                            help='Minimal number of tasks in which columns added for a machine '
+                                 'in a pricing round differ. default=1.')
+
+        parser.add_argument('--gap-tolerance',
+                            type=float,
+                            default=None,
+                            help='Column generation at a node stops once relative gap between RMP objective '
+                                 'value and Lagrangian bound is below this tolerance.')
+
+        parser.add_argument('--dual-stabilization',
+                            choices=[method.value for method in DualStabilizationMethod],
+                            default=DualStabilizationMethod.NONE.value,
+                            help='Method stabilizing duals in column generation: Wentges smoothing or '
+                                 'du Merle penalty. default=none.')
+
+        parser.add_argument('--node-derivation',
+                            choices=[node_derivation.value for node_derivation in NodeDerivation],
+                            default=NodeDerivation.REBUILD.value,
+                            help='Whether RMP of child node is derived from RMP of parent node or rebuilt '
+                                 'from scratch. default=rebuild.')
+
+        parser.add_argument('--node-selection',
+                            choices=[node_selection.value for node_selection in NodeSelection],
+                            default=NodeSelection.BREADTH_FIRST.value,
+                            help='Order in which open nodes of Branch-And-Price tree are processed. '
+                                 'default=breadth_first.')
+
+        parser.add_argument('--tree-search-workers',
+                            type=int,
+                            default=1,
+                            help='Number of processes solving nodes of Branch-And-Price tree in parallel. '
+                                 'default=1.')
+
+        parser.add_argument('--branching-selection',
+                            choices=[branching_selection.value for branching_selection in BranchingSelection],
+                            default=BranchingSelection.FIRST_FRACTIONAL.value,
+                            help='How assignment of task to machine which node is branched on is chosen. '
+                                 'default=first_fractional.')
+
+        parser.add_argument('--strong-branching-candidates',
+                            type=int,
+                            default=8,
+                            help='Number of candidates for branching evaluated by strong branching. default=8.')
+
+        parser.add_argument('--strong-branching-iterations',
+                            type=int,
+                            default=10,
+                            help='Number of column generation iterations performed in each child evaluated '
+                                 'by strong branching. default=10.')
+
+        parser.add_argument('--rmp-heuristic',
+                            action='store_true',
+                            help='Solve columns of RMP as binary MIP to find integer solutions.')
+
+        parser.add_argument('--rmp-heuristic-frequency',
+                            type=int,
+                            default=10,
+                            help='RMP heuristic runs at root node, at every n-th node with fractional solution '
+                                 'and at nodes where column generation tailed off. 0 disables periodic runs. '
+                                 'default=10.')
+
+        parser.add_argument('--no-rmp-heuristic-on-tail-off',
+                            action='store_true',
+                            help='Do not run RMP heuristic at nodes where column generation tailed off.')
+
+        parser.add_argument('--rmp-heuristic-time-limit',
+                            type=float,
+                            default=1.0,
+                            help='Time limit in seconds of a single run of RMP heuristic. default=1.')
+
+        parser.add_argument('--reduced-cost-fixing',
+                            action='store_true',
+                            help='Forbid assignments of tasks to machines which cannot be part of better integer '
+                                 'solution by Lagrangian bound.')
+
+        parser.add_argument('--checkpoint',
+                            default=None,
+                            metavar='PATH',
+                            help='Path of file state of Branch-And-Price search is periodically written to, '
+                                 'so that the search can be resumed. By default checkpoints are not written.')
+
+        parser.add_argument('--checkpoint-interval',
+                            type=float,
+                            default=300.0,
+                            help='Minimal number of seconds between two checkpoints. default=300.')
+
+        parser.add_argument('--resume',
+                            default=None,
+                            metavar='PATH',
+                            help='Path of checkpoint Branch-And-Price search is resumed from.')
+
+        parser.add_argument('--time-limit',
+                            type=float,
+                            default=None,
+                            help='Branch-And-Price search stops after this many seconds, nodes being solved '
+                                 'are finished first. By default there is no time limit.')
+
+        parser.add_argument('--node-limit',
+                            type=int,
+                            default=None,
+                            help='Branch-And-Price search stops once this many nodes were processed. '
+                                 'By default there is no node limit.')
+
+        parser.add_argument('--mip-gap-limit',
+                            type=float,
+                            default=None,
+                            help='Branch-And-Price search stops once relative gap between the best integer '
+                                 'solution and the best bound of open nodes is below this limit.')
+
+        parser.add_argument('--tree-event-log',
+                            default=None,
+                            metavar='PATH',
+                            help='Path of JSONL file events of Branch-And-Price tree are written to. '
+                                 'Tree can be rendered from it by render_tree.py. By default events are not written.')
+
+        parser.add_argument('--no-column-names',
+                            action='store_true',
+                            help='Variables of RMP are not named after machine schedules they represent, '
+                                 'which speeds up adding columns.')
+
+        parser.add_argument('--debug-artifacts',
+                            default=None,
+                            metavar='ARCHIVE',
+                            help='Path of zip archive solved models are written to for debugging. '
+                                 'By default models are not written.')
+
+        parser.add_argument('--debug-artifacts-format',
+                            choices=[file_format.value for file_format in ArtifactFormat],
+                            default=ArtifactFormat.LP.value,
+                            help='Format of models written to debug archive. default=lp.')
+
+        parser.add_argument('--debug-artifacts-every-nth-iteration',
+                            type=int,
+                            default=1,
+                            help='Models solved in column generation are written only in every n-th iteration. '
+                                 'default=1.')
+
+        parser.add_argument('--debug-artifacts-node-ids',
+                            type=int,
+                            nargs='+',
+                            default=None,
+                            help='Models solved in column generation are written only for these Branch-And-Price '
+                                 'nodes. By default models of all nodes are written.')
         args = parser.parse_args()
+        if args.debug_artifacts_every_nth_iteration < 1:
+            parser.error('--debug-artifacts-every-nth-iteration must be at least 1')
 
         # solving GAP problem
         data_set = getattr(input_data, args.data_set)
@@ -46,10 +232,18 @@ def main():
 
         gap = data_set()
 
+        debug_artifact_settings = DebugArtifactSettings(
+            archive_path=args.debug_artifacts,
+            file_format=ArtifactFormat(args.debug_artifacts_format),
+            every_nth_iteration=args.debug_artifacts_every_nth_iteration,
+            node_ids=frozenset(args.debug_artifacts_node_ids) if args.debug_artifacts_node_ids else None
+        )
+        debug_artifact_recorder = DebugArtifactRecorder(debug_artifact_settings)
+
         if use_standalone_model:
             logging.info("Solving using standalone model.")
             gap_model = GAPStandaloneModelBuilder(gap).build()
-            gap_model.write()
+            gap_model.write(debug_artifact_recorder)
             gap_model.solve()
             gap_model.report_results()
 
@@ -58,7 +252,7 @@ def main():
             lp_relaxation.report_results()
 
             dw_gap_model = DantzigWolfeFormulationGapStandaloneModelBuilder(gap_instance=gap).build()
-            dw_gap_model.write()
+            dw_gap_model.write(debug_artifact_recorder)
             dw_gap_model.solve()
             dw_gap_model.report_results()
 
@@ -69,11 +263,39 @@ def main():
         if use_branch_and_price:
             logging.info("Solving using Branch-And-Price.")
             gap_model = GAPStandaloneModelBuilder(gap).build()
-            gap_model.write()
+            gap_model.write(debug_artifact_recorder)
             gap_model.solve()
             gap_model.report_results()
 
-            GAPBranchAndPrice(gap).solve()
+            settings = ColumnGenerationSettings(pricing_method=PricingMethod(args.pricing),
+                                                pricing_threads=args.pricing_threads,
+                                                machine_ordering=MachineOrdering(args.machine_ordering),
+                                                max_improving_machines=args.max_improving_machines,
+                                                heuristic_pricing=args.heuristic_pricing,
+                                                columns_per_machine=args.columns_per_machine,
+                                                min_hamming_distance=args.min_hamming_distance,
+                                                gap_tolerance=args.gap_tolerance,
+                                                dual_stabilization=DualStabilizationMethod(args.dual_stabilization),
+                                                node_derivation=NodeDerivation(args.node_derivation),
+                                                column_names=not args.no_column_names,
+                                                node_selection=NodeSelection(args.node_selection),
+                                                tree_search_workers=args.tree_search_workers,
+                                                branching_selection=BranchingSelection(args.branching_selection),
+                                                strong_branching_candidates=args.strong_branching_candidates,
+                                                strong_branching_iterations=args.strong_branching_iterations,
+                                                rmp_heuristic=args.rmp_heuristic,
+                                                rmp_heuristic_frequency=args.rmp_heuristic_frequency,
+                                                rmp_heuristic_on_tail_off=not args.no_rmp_heuristic_on_tail_off,
+                                                rmp_heuristic_time_limit=args.rmp_heuristic_time_limit,
+                                                reduced_cost_fixing=args.reduced_cost_fixing,
+                                                checkpoint_path=args.checkpoint,
+                                                checkpoint_interval=args.checkpoint_interval,
+                                                time_limit=args.time_limit,
+                                                node_limit=args.node_limit,
+                                                mip_gap_limit=args.mip_gap_limit,
+                                                tree_event_log_path=args.tree_event_log)
+            checkpoint = None if args.resume is None else Checkpoint.read(args.resume, gap)
+            GAPBranchAndPrice(gap, settings, debug_artifact_recorder).solve(checkpoint)
 
     except argparse.ArgumentError:
         logging.exception('Exception raised during parsing arguments')
@@ -84,6 +306,9 @@ def main():
     except Exception:
         logging.exception("Exception occurred")
         sys.exit(1)
+    finally:
+        if debug_artifact_recorder is not None:
+            debug_artifact_recorder.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,80 @@
+import argparse
+import logging
+import sys
+
+import networkx as nx
+from matplotlib import pyplot
+
+from branch_and_price.tree_event_log import TreeEventType, read_tree_events
+
+# colors of nodes by the last event of node, nodes without any are open
+NODE_COLORS = {
+    TreeEventType.NODE_BRANCHED.value: 'lightblue',
+    'integer': 'lightgreen',
+    'infeasible': 'salmon',
+    TreeEventType.NODE_PRUNED.value: 'lightgray',
+}
+OPEN_NODE_COLOR = 'white'
+
+
+def build_tree(path: str) -> nx.DiGraph:
+    """
+    Builds Branch-And-Price tree from event log. Node attributes are the bound
+    of node and its state given by the last event of node.
+    Nodes solved again after search was resumed keep their last state.
+    """
+    tree = nx.DiGraph()
+    for event in read_tree_events(path):
+        event_type = TreeEventType(event['event'])
+        node_id = event['node']
+        if event_type == TreeEventType.NODE_CREATED:
+            tree.add_node(node_id, bound=event['bound'], state=None)
+            if event['parent'] is not None:
+                tree.add_edge(event['parent'], node_id)
+        elif event_type == TreeEventType.NODE_SOLVED:
+            tree.nodes[node_id]['bound'] = event['bound']
+        elif event_type == TreeEventType.NODE_PRUNED:
+            # integer and infeasible nodes are told apart from nodes pruned by bound
+            reason = event['reason']
+            tree.nodes[node_id]['state'] = reason if reason in NODE_COLORS else event_type.value
+        elif event_type == TreeEventType.NODE_BRANCHED:
+            tree.nodes[node_id]['state'] = event_type.value
+    return tree
+
+
+def main():
+    logging.basicConfig(format='%(message)s', level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Renders Branch-And-Price tree from event log.")
+    parser.add_argument('event_log',
+                        help='Path of JSONL event log written by Branch-And-Price with --tree-event-log.')
+    parser.add_argument('--output',
+                        default=None,
+                        metavar='IMAGE',
+                        help='Path of image the tree is saved to. By default the tree is shown in a window.')
+    args = parser.parse_args()
+
+    tree = build_tree(args.event_log)
+    logging.info("Tree has %d nodes.", tree.number_of_nodes())
+
+    from networkx.drawing.nx_agraph import graphviz_layout
+
+    pos = graphviz_layout(tree, prog='dot')
+    labels = {node_id: node_id if bound is None else f'{node_id}\n{bound:.1f}'
+              for node_id, bound in tree.nodes(data='bound')}
+    colors = [NODE_COLORS.get(state, OPEN_NODE_COLOR) for _, state in tree.nodes(data='state')]
+    nx.draw(tree, pos, labels=labels, node_color=colors, edgecolors='black', arrows=True)
+
+    if args.output is None:
+        pyplot.show()
+    else:
+        pyplot.savefig(args.output)
+        logging.info("Tree saved to %s", args.output)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception:
+        logging.exception("Exception occurred")
+        sys.exit(1)
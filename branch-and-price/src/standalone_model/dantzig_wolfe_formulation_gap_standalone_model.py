@@ -5,6 +5,7 @@ import gurobipy as grb
 from bidict import bidict
 
 from common import TMachineSchedule, is_non_zero
+from common.debug_artifact_recorder import DebugArtifactRecorder
 
 
 class DantzigWolfeFormulationGapStandaloneModel:
@@ -21,9 +22,9 @@ class DantzigWolfeFormulationGapStandaloneModel:
         self.dw_model.Params.LogToConsole = 0
         self.dw_model.optimize()
 
-    def write(self):
+    def write(self, recorder: DebugArtifactRecorder):
         model_name = self.dw_model.getAttr(grb.GRB.Attr.ModelName)
-        self.dw_model.write(f'{model_name}.lp')
+        recorder.record(self.dw_model, model_name)
 
     def report_results(self):
         obj_val = self.dw_model.getAttr(grb.GRB.Attr.ObjVal)
@@ -35,10 +36,7 @@ class DantzigWolfeFormulationGapStandaloneModel:
         for var in self.dw_model.getVars():
             if is_non_zero(var.x):
                 machine_schedule = self._get_machine_schedule(var)
-                machine_id = machine_schedule[0]
-                tasks = machine_schedule[1]
-
-                machine_to_tasks[machine_id] = set(tasks)
+                machine_to_tasks[machine_schedule.machine_id] = set(machine_schedule.tasks)
 
         logging.info("Machine -> Set of tasks")
         for machine in sorted(machine_to_tasks):
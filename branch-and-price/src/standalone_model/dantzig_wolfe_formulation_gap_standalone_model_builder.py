@@ -36,16 +36,12 @@ class DantzigWolfeFormulationGapStandaloneModelBuilder:
 
     def _build_columns(self):
         for idx, machine_schedule in enumerate(self.feasible_machine_schedules):
-            machine_id = machine_schedule[0]
-            tasks = machine_schedule[1]
-            profit = self._gap_instance.machine_schedule_profit(machine_schedule)
-            name = f"machine_{machine_id}_tasks_{'_'.join(str(task_id) for task_id in tasks)}"
             var = self.dw_model.addVar(
                 lb=0.0,
                 ub=1.0,
-                obj=profit,
+                obj=machine_schedule.profit,
                 vtype=grb.GRB.BINARY,
-                name=name,
+                name=machine_schedule.name,
             )
 
             self.machine_schedule_idx_to_variable[idx] = var
@@ -55,7 +51,7 @@ class DantzigWolfeFormulationGapStandaloneModelBuilder:
             lhs = grb.quicksum([
                 1 * self.machine_schedule_idx_to_variable[idx]
                 for idx, machine_schedule in enumerate(self.feasible_machine_schedules)
-                if machine_schedule[0] == machine_id
+                if machine_schedule.machine_id == machine_id
             ])
             rhs = 1
             name = f'convexity_{machine_id}'
@@ -66,7 +62,7 @@ class DantzigWolfeFormulationGapStandaloneModelBuilder:
             lhs = grb.quicksum([
                 1 * self.machine_schedule_idx_to_variable[idx]
                 for idx, machine_schedule in enumerate(self.feasible_machine_schedules)
-                if task_id in machine_schedule[1]
+                if task_id in machine_schedule
             ])
             rhs = 1
             name = f'task_assignment_{task_id}'
@@ -36,7 +36,7 @@ class FeasibleMachineSchedulesFinder:
             task_weights=self.gap_input.weights[machine_id]).find()
 
         return [
-            (machine_id, assignment)
+            self.gap_input.machine_schedule(machine_id, assignment)
             for assignment in assignments
         ]
 
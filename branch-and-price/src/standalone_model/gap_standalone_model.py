@@ -10,6 +10,7 @@ from typing import Tuple, Dict, Collection
 import gurobipy as grb
 
 from common import is_non_zero
+from common.debug_artifact_recorder import DebugArtifactRecorder
 from input_data import GeneralAssignmentProblem
 from bidict import bidict
 
@@ -26,9 +27,9 @@ class GAPStandaloneModel:
         self.mip_model.Params.LogToConsole = 0
         self.mip_model.optimize()
 
-    def write(self):
+    def write(self, recorder: DebugArtifactRecorder):
         model_name = self.mip_model.getAttr(grb.GRB.Attr.ModelName)
-        self.mip_model.write(f'{model_name}.lp')
+        recorder.record(self.mip_model, model_name)
 
     def report_results(self):
         obj_val = self.mip_model.getAttr(grb.GRB.Attr.ObjVal)
@@ -8,6 +8,7 @@ import logging
 import gurobipy as grb
 
 from common import is_non_zero
+from common.debug_artifact_recorder import DebugArtifactRecorder
 
 
 class GAPStandaloneModelLpRelaxation:
@@ -20,9 +21,9 @@ class GAPStandaloneModelLpRelaxation:
         self._lp_relaxation.Params.LogToConsole = 0
         self._lp_relaxation.optimize()
 
-    def write(self):
+    def write(self, recorder: DebugArtifactRecorder):
         model_name = self._lp_relaxation.getAttr(grb.GRB.Attr.ModelName)
-        self._lp_relaxation.write(f'{model_name}.lp')
+        recorder.record(self._lp_relaxation, model_name)
 
     def report_results(self):
         obj_val = self._lp_relaxation.getAttr(grb.GRB.Attr.ObjVal)
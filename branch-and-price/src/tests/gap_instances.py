@@ -0,0 +1,26 @@
+import numpy as np
+
+from input_data import GeneralAssignmentProblem
+from standalone_model import GAPStandaloneModelBuilder
+
+
+def random_instance(seed: int, num_machines: int, num_tasks: int) -> GeneralAssignmentProblem:
+    """Random GAP instance with integer weights and profits and capacities leaving some slack."""
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, 20, (num_machines, num_tasks))
+    profits = rng.integers(1, 30, (num_machines, num_tasks))
+    capacity = np.maximum(weights.sum(axis=1) // num_machines + rng.integers(0, 10, num_machines),
+                          weights.max(axis=1))
+    return GeneralAssignmentProblem(num_tasks=num_tasks,
+                                    num_machines=num_machines,
+                                    weights=weights,
+                                    profits=profits,
+                                    capacity=capacity)
+
+
+def optimal_objective_value(gap_instance: GeneralAssignmentProblem) -> float:
+    """Solves compact MIP of GAP, instance must be feasible."""
+    gap_model = GAPStandaloneModelBuilder(gap_instance).build()
+    gap_model.mip_model.Params.LogToConsole = 0
+    gap_model.solve()
+    return gap_model.mip_model.ObjVal
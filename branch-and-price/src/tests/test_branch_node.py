@@ -0,0 +1,98 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from branch_and_price import ColumnGenerationSettings
+from branch_and_price.branch_node import BranchNode
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.column_pool import ColumnPool
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from branch_and_price.pricing_result import PricingRound, PricingResult
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from input_data import GeneralAssignmentProblem
+
+# both tasks do not fit on machine 0, but they do on machine 1
+GAP_INSTANCE = GeneralAssignmentProblem(num_tasks=2,
+                                        num_machines=2,
+                                        weights=np.array([[3.0, 3.0], [3.0, 3.0]]),
+                                        profits=np.array([[5.0, 4.0], [2.0, 3.0]]),
+                                        capacity=np.array([5.0, 6.0]))
+
+
+class DuplicateColumnHeuristic:
+    """
+    Pricing heuristic which always claims that column of suboptimal initial solution has positive reduced cost,
+    column is in RMP, so its reduced cost with respect to duals of RMP is not positive.
+    """
+
+    def price(self, machine_duals, task_duals, branching_rules) -> PricingRound:
+        return PricingRound(results=[PricingResult(machine_id=0,
+                                                   objective_value=1.0,
+                                                   machine_schedules=[GAP_INSTANCE.machine_schedule(0, [1])])],
+                            complete=False)
+
+
+def solve_node(*branching_rules: BranchingRule,
+               initial_solution=((0, [0]), (1, [1])),
+               heuristic=None,
+               max_iterations=None) -> BranchNode:
+    """
+    Solves node with branching rules which inherits columns of initial solution,
+    by default the solution assigns task 0 to machine 0 and task 1 to machine 1.
+    """
+    settings = ColumnGenerationSettings()
+    column_pool = ColumnPool()
+    pricer = KnapsackPricer(GAP_INSTANCE, settings)
+    pricer.heuristic = heuristic
+    root = BranchNode.open_root([column_pool.add(GAP_INSTANCE.machine_schedule(machine_id, tasks))
+                                 for machine_id, tasks in initial_solution])
+    node = BranchNode(gap_instance=GAP_INSTANCE,
+                      open_node=dataclasses.replace(root, branching_rules=branching_rules),
+                      column_pool=column_pool,
+                      pricer=pricer,
+                      settings=settings,
+                      debug_artifact_recorder=DebugArtifactRecorder())
+    try:
+        node.solve(max_iterations=max_iterations)
+    finally:
+        pricer.close()
+    return node
+
+
+def test_node_is_solved_if_inherited_columns_do_not_satisfy_branching_rules():
+    # no inherited column of machine 0 is allowed
+    node = solve_node(BranchingRule(task=0, machine=0, assigned=False))
+    try:
+        assert node.is_feasible()
+        assert node.is_converged()
+        assert node.has_integer_solution()
+        assert node.objective_value() == pytest.approx(6.0)
+        assert sorted((ms.machine_id, ms.tasks) for ms in node.incumbent().machine_schedules) == [(0, [1]), (1, [0])]
+    finally:
+        node.dispose()
+
+
+def test_node_is_infeasible_if_no_solution_satisfies_branching_rules():
+    # both tasks are assigned to machine 0
+    node = solve_node(BranchingRule(task=0, machine=1, assigned=False), BranchingRule(task=1, machine=1, assigned=False))
+    try:
+        assert node.is_converged()
+        assert not node.is_feasible()
+        assert not node.has_integer_solution()
+    finally:
+        node.dispose()
+
+
+def test_subproblems_are_solved_exactly_if_heuristic_returns_no_new_column():
+    exact_node = solve_node()
+    expected_objective_value = exact_node.objective_value()
+    exact_node.dispose()
+
+    # objective value of initial solution is 6
+    node = solve_node(initial_solution=((0, [1]), (1, [0])), heuristic=DuplicateColumnHeuristic(), max_iterations=20)
+    try:
+        assert node.is_converged()
+        assert node.objective_value() == pytest.approx(expected_objective_value)
+    finally:
+        node.dispose()
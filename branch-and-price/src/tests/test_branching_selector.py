@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from branch_and_price import ColumnGenerationSettings, BranchingSelection
+from branch_and_price.branching_selector import create_branching_selector, BranchingCandidate
+
+
+class FractionalNode:
+    """Node whose RMP solution has given fractional assignments, ordered by machine and task."""
+
+    def __init__(self, assignments, values):
+        self._assignments = np.array(assignments)
+        self._values = np.array(values)
+
+    def fractional_assignments(self):
+        return self._assignments, self._values
+
+
+@pytest.mark.parametrize('branching_selection, expected_candidate', [
+    (BranchingSelection.FIRST_FRACTIONAL, BranchingCandidate(machine=0, task=2, value=0.9)),
+    (BranchingSelection.MOST_FRACTIONAL, BranchingCandidate(machine=1, task=0, value=0.4)),
+])
+def test_branching_candidate(branching_selection, expected_candidate):
+    selector = create_branching_selector(ColumnGenerationSettings(branching_selection=branching_selection),
+                                         node_factory=None)
+    node = FractionalNode(assignments=[[0, 2], [1, 0], [1, 3]], values=[0.9, 0.4, 0.1])
+
+    assert selector.select(node) == expected_candidate
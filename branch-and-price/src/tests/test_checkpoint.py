@@ -0,0 +1,39 @@
+import collections
+import dataclasses
+import os
+
+import pytest
+
+from branch_and_price import GAPBranchAndPrice, ColumnGenerationSettings, SolveStatus, Checkpoint, TreeEventType, \
+    read_tree_events
+from gap_instances import random_instance, optimal_objective_value
+
+
+def test_search_resumed_from_checkpoint_finds_optimum(tmp_path):
+    # tree of the instance has 7 nodes
+    gap_instance = random_instance(23, num_machines=5, num_tasks=15)
+    checkpoint_path = os.path.join(tmp_path, 'search.ckpt')
+    event_log_path = os.path.join(tmp_path, 'tree.jsonl')
+    settings = ColumnGenerationSettings(checkpoint_path=checkpoint_path,
+                                        checkpoint_interval=0.0,
+                                        tree_event_log_path=event_log_path)
+    uninterrupted_result = GAPBranchAndPrice(gap_instance).solve()
+
+    interrupted_result = GAPBranchAndPrice(gap_instance, dataclasses.replace(settings, node_limit=3)).solve()
+    checkpoint = Checkpoint.read(checkpoint_path, gap_instance)
+    result = GAPBranchAndPrice(gap_instance, settings).solve(checkpoint)
+
+    assert interrupted_result.status == SolveStatus.NODE_LIMIT
+    assert checkpoint.processed_nodes == interrupted_result.processed_nodes == 3
+    assert len(checkpoint.open_nodes) == interrupted_result.open_nodes > 0
+    assert result.status == SolveStatus.OPTIMAL
+    assert result.primal_bound == pytest.approx(optimal_objective_value(gap_instance))
+    assert result.processed_nodes == uninterrupted_result.processed_nodes
+
+    # each node is created and solved once in both runs together
+    events = list(read_tree_events(event_log_path))
+    for event_type in [TreeEventType.NODE_CREATED, TreeEventType.NODE_SOLVED]:
+        node_ids = collections.Counter(event['node'] for event in events if event['event'] == event_type.value)
+        assert set(node_ids.values()) == {1}
+    solved_node_ids = {event['node'] for event in events if event['event'] == TreeEventType.NODE_SOLVED.value}
+    assert len(solved_node_ids) == result.processed_nodes
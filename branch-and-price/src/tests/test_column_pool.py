@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.column_pool import ColumnPool
+from common import MachineSchedule
+
+
+def column(machine_id: int, tasks) -> MachineSchedule:
+    return MachineSchedule(machine_id=machine_id, task_mask=MachineSchedule.task_mask_of(tasks), profit=0.0, weight=0.0)
+
+
+def satisfies(machine_schedule: MachineSchedule, branching_rule: BranchingRule) -> bool:
+    has_task = branching_rule.task in machine_schedule.tasks
+    if branching_rule.assigned:
+        return has_task == (machine_schedule.machine_id == branching_rule.machine)
+    return not (has_task and machine_schedule.machine_id == branching_rule.machine)
+
+
+@pytest.fixture
+def column_pool() -> ColumnPool:
+    column_pool = ColumnPool()
+    for machine_id, tasks in [(0, [0, 1]), (0, [2]), (0, []), (1, [0]), (1, [1, 2])]:
+        column_pool.add(column(machine_id, tasks))
+    return column_pool
+
+
+def test_rule_forcing_assignment_excludes_columns_of_machine_without_task_and_other_machines_with_task(column_pool):
+    allowed_columns = column_pool.allowed_columns(ColumnPool.to_bitmap(range(5)),
+                                                  [BranchingRule(task=0, machine=0, assigned=True)])
+
+    assert list(ColumnPool.column_ids(allowed_columns)) == [0, 4]
+
+
+def test_rule_forbidding_assignment_excludes_columns_of_machine_with_task(column_pool):
+    allowed_columns = column_pool.allowed_columns(ColumnPool.to_bitmap(range(5)),
+                                                  [BranchingRule(task=1, machine=1, assigned=False)])
+
+    assert list(ColumnPool.column_ids(allowed_columns)) == [0, 1, 2, 3]
+
+
+def test_only_given_columns_are_returned(column_pool):
+    allowed_columns = column_pool.allowed_columns(ColumnPool.to_bitmap([1, 3]),
+                                                  [BranchingRule(task=2, machine=0, assigned=False)])
+
+    assert list(ColumnPool.column_ids(allowed_columns)) == [3]
+
+
+def test_columns_added_after_bitmap_was_created_are_indexed(column_pool):
+    inherited_columns = ColumnPool.to_bitmap(range(len(column_pool)))
+    new_column_id = column_pool.add(column(1, [0, 3]))
+    branching_rules = [BranchingRule(task=3, machine=1, assigned=True)]
+
+    allowed_columns = column_pool.allowed_columns(inherited_columns | (1 << new_column_id), branching_rules)
+
+    # columns of machine 1 without task 3 are excluded
+    assert list(ColumnPool.column_ids(allowed_columns)) == [0, 1, 2, new_column_id]
+    assert column_pool.add(column(1, [0, 3])) == new_column_id
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_allowed_columns_satisfy_all_rules(seed):
+    rng = np.random.default_rng(seed)
+    column_pool = ColumnPool()
+    columns = 0
+    for _ in range(40):
+        tasks = np.flatnonzero(rng.random(6) < 0.4)
+        columns |= 1 << column_pool.add(column(int(rng.integers(3)), tasks))
+    branching_rules = [BranchingRule(task=int(rng.integers(6)), machine=int(rng.integers(3)), assigned=bool(assigned))
+                       for assigned in rng.random(3) < 0.5]
+
+    allowed_columns = column_pool.allowed_columns(columns, branching_rules)
+
+    expected_column_ids = [column_id for column_id in ColumnPool.column_ids(columns)
+                           if all(satisfies(column_pool.column(column_id), rule) for rule in branching_rules)]
+    assert list(ColumnPool.column_ids(allowed_columns)) == expected_column_ids
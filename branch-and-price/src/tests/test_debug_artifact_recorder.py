@@ -0,0 +1,45 @@
+import os
+import zipfile
+
+import gurobipy.gurobipy as grb
+import pytest
+
+from common.debug_artifact_recorder import DebugArtifactRecorder, DebugArtifactSettings
+
+
+def test_models_with_same_name_are_numbered(tmp_path):
+    archive_path = os.path.join(tmp_path, 'models.zip')
+    recorder = DebugArtifactRecorder(DebugArtifactSettings(archive_path=archive_path))
+    model = grb.Model()
+    model.addVar(name='x')
+    model.update()
+    for _ in range(3):
+        recorder.record(model, 'GAP_RMP_-1_1', node_id=-1, itr_cnt=1)
+    recorder.close()
+    model.dispose()
+
+    with zipfile.ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == ['GAP_RMP_-1_1.1.lp', 'GAP_RMP_-1_1.2.lp', 'GAP_RMP_-1_1.lp']
+
+
+def test_every_nth_iteration_must_be_positive():
+    with pytest.raises(ValueError):
+        DebugArtifactRecorder(DebugArtifactSettings(archive_path='models.zip', every_nth_iteration=0))
+
+
+def test_model_is_recorded_as_it_was_when_recorded(tmp_path):
+    archive_path = os.path.join(tmp_path, 'models.zip')
+    recorder = DebugArtifactRecorder(DebugArtifactSettings(archive_path=archive_path))
+    model = grb.Model()
+    model.addVar(name='recorded')
+    recorder.record(model, 'model')
+    # modification made while the writer thread might still be writing the model
+    model.addVar(name='added_later')
+    model.update()
+    recorder.close()
+    model.dispose()
+
+    with zipfile.ZipFile(archive_path) as archive:
+        content = archive.read('model.lp').decode()
+    assert 'recorded' in content
+    assert 'added_later' not in content
@@ -0,0 +1,39 @@
+import pytest
+
+from branch_and_price import ColumnGenerationSettings, DualStabilizationMethod, InitialSolutionFinder
+from branch_and_price.branch_node import BranchNode
+from branch_and_price.column_pool import ColumnPool
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from gap_instances import random_instance
+
+
+def root_lp_value(seed: int, dual_stabilization: DualStabilizationMethod) -> float:
+    """Solves LP relaxation of root node by column generation, returns its objective value."""
+    gap_instance = random_instance(seed, num_machines=5, num_tasks=15)
+    settings = ColumnGenerationSettings(dual_stabilization=dual_stabilization)
+    column_pool = ColumnPool()
+    pricer = KnapsackPricer(gap_instance, settings)
+    initial_solution = InitialSolutionFinder(gap_instance).find()
+    root = BranchNode(gap_instance=gap_instance,
+                      open_node=BranchNode.open_root([column_pool.add(machine_schedule)
+                                                      for machine_schedule in initial_solution]),
+                      column_pool=column_pool,
+                      pricer=pricer,
+                      settings=settings,
+                      debug_artifact_recorder=DebugArtifactRecorder())
+    try:
+        root.solve()
+        assert root.is_converged()
+        # converged column generation closes gap to Lagrangian bound
+        assert root.dual_bound() == pytest.approx(root.objective_value())
+        return root.objective_value()
+    finally:
+        root.dispose()
+        pricer.close()
+
+
+@pytest.mark.parametrize('dual_stabilization', [DualStabilizationMethod.WENTGES, DualStabilizationMethod.PENALTY])
+@pytest.mark.parametrize('seed', range(4))
+def test_stabilized_column_generation_reaches_the_same_lp_value(seed, dual_stabilization):
+    assert root_lp_value(seed, dual_stabilization) == pytest.approx(root_lp_value(seed, DualStabilizationMethod.NONE))
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.dynamic_programming_subproblem_builder import DynamicProgrammingSubproblemBuilder
+from branch_and_price.subproblem_builder import SubproblemBuilder
+from gap_instances import random_instance
+
+
+def random_branching_rules(rng: np.random.Generator, num_machines: int, num_tasks: int):
+    """Rules forcing and forbidding random tasks, forced tasks might not fit into capacity of machine."""
+    rules = []
+    for task_id in rng.choice(num_tasks, size=rng.integers(0, num_tasks // 2), replace=False):
+        rules.append(BranchingRule(task=int(task_id),
+                                   machine=int(rng.integers(num_machines)),
+                                   assigned=bool(rng.random() < 0.3)))
+    return rules
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_dynamic_programming_finds_the_same_optimum_as_gurobi(seed):
+    rng = np.random.default_rng(seed)
+    gap_instance = random_instance(seed, num_machines=3, num_tasks=12)
+    gurobi_builder = SubproblemBuilder(gap_instance)
+    dynamic_programming_builder = DynamicProgrammingSubproblemBuilder(gap_instance)
+    try:
+        for _ in range(20):
+            task_duals = list(rng.uniform(-5.0, 25.0, gap_instance.num_tasks))
+            branching_rules = random_branching_rules(rng, gap_instance.num_machines, gap_instance.num_tasks)
+            for machine_id in range(gap_instance.num_machines):
+                machine_dual = float(rng.uniform(-10.0, 10.0))
+                subproblems = [builder.build(machine_id, machine_dual, task_duals, branching_rules)
+                               for builder in [gurobi_builder, dynamic_programming_builder]]
+                for subproblem in subproblems:
+                    subproblem.solve()
+                gurobi_subproblem, dynamic_programming_subproblem = subproblems
+
+                expected_objective_value = gurobi_subproblem.objective_value()
+                if expected_objective_value is None:
+                    assert dynamic_programming_subproblem.objective_value() is None
+                    continue
+                assert dynamic_programming_subproblem.objective_value() == pytest.approx(expected_objective_value,
+                                                                                         rel=1e-4, abs=1e-6)
+
+                # solution satisfies capacity and branching rules and its reduced cost is the objective value
+                machine_schedule = dynamic_programming_subproblem.solution()
+                tasks = set(machine_schedule.tasks)
+                assert machine_schedule.weight <= gap_instance.capacity[machine_id]
+                for rule in branching_rules:
+                    if rule.assigned:
+                        assert (rule.task in tasks) == (rule.machine == machine_id)
+                    elif rule.machine == machine_id:
+                        assert rule.task not in tasks
+                reduced_cost = machine_schedule.profit - sum(task_duals[task] for task in tasks) - machine_dual
+                assert reduced_cost == pytest.approx(dynamic_programming_subproblem.objective_value())
+    finally:
+        gurobi_builder.close()
+        dynamic_programming_builder.close()
+
+
+def test_forced_tasks_exceeding_capacity_have_no_solution():
+    gap_instance = random_instance(0, num_machines=3, num_tasks=12)
+    # all tasks do not fit on a single machine
+    branching_rules = [BranchingRule(task=task_id, machine=0, assigned=True) for task_id in range(gap_instance.num_tasks)]
+    task_duals = [0.0] * gap_instance.num_tasks
+    gurobi_builder = SubproblemBuilder(gap_instance)
+    try:
+        for builder in [gurobi_builder, DynamicProgrammingSubproblemBuilder(gap_instance)]:
+            subproblem = builder.build(0, 0.0, task_duals, branching_rules)
+            subproblem.solve()
+            assert subproblem.objective_value() is None
+    finally:
+        gurobi_builder.close()
@@ -0,0 +1,16 @@
+import pytest
+
+from branch_and_price import GAPBranchAndPrice, ColumnGenerationSettings, SolveStatus
+from gap_instances import random_instance, optimal_objective_value
+
+
+@pytest.mark.parametrize('gap_tolerance', [0.01, 1.0])
+@pytest.mark.parametrize('seed', [2, 6, 7, 8])
+def test_integer_rmp_before_convergence_does_not_prune_node(seed, gap_tolerance):
+    # with large tolerance column generation stops while RMP still contains only the integer initial solution
+    gap_instance = random_instance(seed, num_machines=4, num_tasks=12)
+
+    result = GAPBranchAndPrice(gap_instance, ColumnGenerationSettings(gap_tolerance=gap_tolerance)).solve()
+
+    assert result.status == SolveStatus.OPTIMAL
+    assert result.primal_bound == pytest.approx(optimal_objective_value(gap_instance))
@@ -0,0 +1,22 @@
+import numpy as np
+
+from branch_and_price.greedy_pricing_heuristic import GreedyPricingHeuristic
+from input_data import GeneralAssignmentProblem
+
+
+def test_task_which_does_not_fit_is_skipped():
+    # ratios of tasks are 2.0, 1.8 and 1.67, the second task does not fit after the first one
+    gap_instance = GeneralAssignmentProblem(num_tasks=3,
+                                            num_machines=1,
+                                            weights=np.array([[6.0, 5.0, 3.0]]),
+                                            profits=np.array([[12.0, 9.0, 5.0]]),
+                                            capacity=np.array([10.0]))
+
+    pricing_round = GreedyPricingHeuristic(gap_instance).price(machine_duals=[0.0],
+                                                               task_duals=[0.0, 0.0, 0.0],
+                                                               branching_rules=[])
+
+    result, = pricing_round.results
+    machine_schedule, = result.machine_schedules
+    assert machine_schedule.tasks == [0, 2]
+    assert result.objective_value == 17.0
@@ -0,0 +1,24 @@
+import gurobipy.gurobipy as grb
+import pytest
+
+from branch_and_price import ColumnGenerationSettings
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from gap_instances import random_instance
+
+
+def test_close_disposes_models_and_environments_of_subproblems():
+    gap_instance = random_instance(0, num_machines=3, num_tasks=8)
+    pricer = KnapsackPricer(gap_instance, ColumnGenerationSettings(pricing_threads=2))
+    pricer.price(node_id=0,
+                 itr_cnt=1,
+                 machine_duals=[0.0] * gap_instance.num_machines,
+                 task_duals=[0.0] * gap_instance.num_tasks,
+                 branching_rules=[])
+    models = [pricer.subproblem_builder.build(machine_id, 0.0, [0.0] * gap_instance.num_tasks, [])._model
+              for machine_id in range(gap_instance.num_machines)]
+
+    pricer.close()
+
+    for model in models:
+        with pytest.raises(grb.GurobiError):
+            model.optimize()
@@ -0,0 +1,27 @@
+import copy
+import pickle
+
+import pytest
+
+from common.machine_schedule import MachineSchedule
+
+
+def machine_schedule() -> MachineSchedule:
+    return MachineSchedule(machine_id=1, task_mask=MachineSchedule.task_mask_of([0, 3]), profit=5.0, weight=2.0)
+
+
+def test_attributes_cannot_be_reassigned():
+    schedule = machine_schedule()
+    with pytest.raises(AttributeError):
+        schedule.task_mask = 0
+    with pytest.raises(AttributeError):
+        del schedule.profit
+    assert schedule.tasks == [0, 3]
+
+
+def test_pickle_round_trip_and_copy():
+    schedule = machine_schedule()
+    restored = pickle.loads(pickle.dumps(schedule))
+    assert restored == schedule
+    assert (restored.profit, restored.weight) == (5.0, 2.0)
+    assert copy.deepcopy(schedule) is schedule
@@ -0,0 +1,59 @@
+import pytest
+
+from branch_and_price import GAPBranchAndPrice, ColumnGenerationSettings, NodeDerivation, SolveStatus, \
+    InitialSolutionFinder
+from branch_and_price.branch_node import BranchNode
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.column_pool import ColumnPool
+from branch_and_price.knapsack_pricer import KnapsackPricer
+from common.debug_artifact_recorder import DebugArtifactRecorder
+from gap_instances import random_instance, optimal_objective_value
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_derived_and_rebuilt_nodes_lead_to_the_same_optimum(seed):
+    gap_instance = random_instance(seed, num_machines=3, num_tasks=10)
+
+    results = [GAPBranchAndPrice(gap_instance, ColumnGenerationSettings(node_derivation=node_derivation)).solve()
+               for node_derivation in NodeDerivation]
+
+    for result in results:
+        assert result.status == SolveStatus.OPTIMAL
+        assert result.primal_bound == pytest.approx(optimal_objective_value(gap_instance))
+
+
+def child_bound(node_derivation: NodeDerivation, assigned: bool) -> float:
+    """Solves root and its child created by branching on the first fractional assignment, returns bound of child."""
+    # root of the instance has fractional solution
+    gap_instance = random_instance(3, num_machines=5, num_tasks=15)
+    settings = ColumnGenerationSettings(node_derivation=node_derivation)
+    column_pool = ColumnPool()
+    pricer = KnapsackPricer(gap_instance, settings)
+
+    def solve_node(open_node) -> BranchNode:
+        node = BranchNode(gap_instance=gap_instance,
+                          open_node=open_node,
+                          column_pool=column_pool,
+                          pricer=pricer,
+                          settings=settings,
+                          debug_artifact_recorder=DebugArtifactRecorder())
+        node.solve()
+        return node
+
+    root = solve_node(BranchNode.open_root([column_pool.add(machine_schedule)
+                                            for machine_schedule in InitialSolutionFinder(gap_instance).find()]))
+    assignments, _ = root.fractional_assignments()
+    machine, task = (int(index) for index in assignments[0])
+    child = solve_node(root.open_child(BranchingRule(task, machine, assigned=assigned)))
+    try:
+        assert child.is_converged()
+        return child.dual_bound()
+    finally:
+        root.dispose()
+        child.dispose()
+        pricer.close()
+
+
+@pytest.mark.parametrize('assigned', [False, True])
+def test_derived_and_rebuilt_children_have_the_same_bound(assigned):
+    assert child_bound(NodeDerivation.DERIVE, assigned) == pytest.approx(child_bound(NodeDerivation.REBUILD, assigned))
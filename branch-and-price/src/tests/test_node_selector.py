@@ -0,0 +1,34 @@
+import pytest
+
+from branch_and_price.node_selector import create_node_selector
+from branch_and_price.open_node import OpenNode
+from branch_and_price.settings import NodeSelection
+
+
+def open_node(node_id: int, parent_bound: float = 10.0) -> OpenNode:
+    return OpenNode(id=node_id, branching_rules=(), column_ids=0, parent_bound=parent_bound, depth=1)
+
+
+@pytest.mark.parametrize('node_selection', list(NodeSelection))
+def test_push_twice_before_pop_keeps_all_nodes(node_selection):
+    node_selector = create_node_selector(node_selection)
+    node_selector.push([open_node(1), open_node(2)])
+    node_selector.push([open_node(3), open_node(4)])
+
+    assert sorted(node.id for node in node_selector.open_nodes()) == [1, 2, 3, 4]
+    assert len(node_selector) == 4
+
+    popped = []
+    while (node := node_selector.pop(None)) is not None:
+        popped.append(node.id)
+    assert sorted(popped) == [1, 2, 3, 4]
+
+
+def test_hybrid_dives_from_last_pushed_node():
+    node_selector = create_node_selector(NodeSelection.HYBRID)
+    node_selector.push([open_node(1, parent_bound=20.0), open_node(2)])
+    node_selector.push([open_node(3), open_node(4)])
+
+    assert node_selector.pop(None).id == 3
+    # dive node replaced by the second push is kept with its bound
+    assert node_selector.pop(None).id == 1
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from branch_and_price import GAPBranchAndPrice, ColumnGenerationSettings, SolveStatus
+from branch_and_price.branching_rule import BranchingRule
+from branch_and_price.dual_stabilization import Duals
+from branch_and_price.reduced_cost_fixing import ReducedCostFixing
+from gap_instances import random_instance, optimal_objective_value
+from input_data import GeneralAssignmentProblem
+
+# each task fits on its own on each machine, task 0 is profitable on machine 0 and task 1 on machine 1
+GAP_INSTANCE = GeneralAssignmentProblem(num_tasks=2,
+                                        num_machines=2,
+                                        weights=np.array([[5.0, 5.0], [5.0, 5.0]]),
+                                        profits=np.array([[10.0, 1.0], [1.0, 10.0]]),
+                                        capacity=np.array([5.0, 5.0]))
+ZERO_DUALS = Duals(task_duals=np.zeros(2), machine_duals=np.zeros(2))
+
+
+def implied_rules(branching_rules, mip_lb):
+    # for zero duals bound of each subproblem is 10 and Lagrangian bound is 20,
+    # forcing unprofitable assignment decreases Lagrangian bound to 11
+    return ReducedCostFixing(GAP_INSTANCE).implied_rules(lagrangian_bound=20.0,
+                                                         duals=ZERO_DUALS,
+                                                         subproblem_bounds=np.array([10.0, 10.0]),
+                                                         branching_rules=branching_rules,
+                                                         mip_lb=mip_lb)
+
+
+def test_assignments_which_cannot_lead_to_better_solution_are_forbidden():
+    assert implied_rules([], mip_lb=15.0) == [BranchingRule(task=1, machine=0, assigned=False),
+                                              BranchingRule(task=0, machine=1, assigned=False)]
+
+
+def test_assignments_are_not_forbidden_if_they_might_lead_to_better_solution():
+    assert implied_rules([], mip_lb=10.0) == []
+
+
+def test_forced_and_forbidden_assignments_are_not_forbidden_again():
+    # assignment of task 0 to machine 1 is forbidden by forcing task 0 to machine 0
+    assert implied_rules([BranchingRule(task=0, machine=0, assigned=True)], mip_lb=15.0) \
+        == [BranchingRule(task=1, machine=0, assigned=False)]
+
+
+# assignments are fixed in trees of these instances
+@pytest.mark.parametrize('seed', [3, 23])
+def test_reduced_cost_fixing_does_not_change_optimum(seed):
+    gap_instance = random_instance(seed, num_machines=5, num_tasks=15)
+    expected_objective_value = optimal_objective_value(gap_instance)
+
+    for reduced_cost_fixing in [False, True]:
+        branch_and_price = GAPBranchAndPrice(gap_instance,
+                                             ColumnGenerationSettings(reduced_cost_fixing=reduced_cost_fixing))
+        result = branch_and_price.solve()
+
+        assert (branch_and_price.fixed_assignments > 0) == reduced_cost_fixing
+        assert result.status == SolveStatus.OPTIMAL
+        assert result.primal_bound == pytest.approx(expected_objective_value)
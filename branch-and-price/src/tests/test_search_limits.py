@@ -0,0 +1,97 @@
+import math
+from typing import List, Tuple
+
+import pytest
+
+from branch_and_price import GAPBranchAndPrice, ColumnGenerationSettings, SolveStatus, SearchCallback, SearchProgress
+from gap_instances import random_instance, optimal_objective_value
+
+# tree of the instance has 7 nodes, the optimal solution is found at the 4th one
+GAP_INSTANCE = random_instance(23, num_machines=5, num_tasks=15)
+OPTIMAL_OBJECTIVE_VALUE = 334.0
+
+
+class RecordingCallback(SearchCallback):
+
+    def __init__(self):
+        self.incumbents: List[Tuple[int, float]] = []
+        self.dual_bounds: List[Tuple[int, float]] = []
+
+    def on_incumbent(self, progress: SearchProgress):
+        self.incumbents.append((progress.processed_nodes, progress.primal_bound))
+
+    def on_dual_bound(self, progress: SearchProgress):
+        self.dual_bounds.append((progress.processed_nodes, progress.dual_bound))
+
+
+def solve(**settings):
+    return GAPBranchAndPrice(GAP_INSTANCE, ColumnGenerationSettings(**settings)).solve()
+
+
+def test_optimal_objective_value():
+    assert optimal_objective_value(GAP_INSTANCE) == pytest.approx(OPTIMAL_OBJECTIVE_VALUE)
+
+
+def test_search_without_limits_is_optimal():
+    result = solve()
+
+    assert result.status == SolveStatus.OPTIMAL
+    assert result.processed_nodes == 7
+    assert result.open_nodes == 0
+    assert result.primal_bound == pytest.approx(OPTIMAL_OBJECTIVE_VALUE)
+    assert result.dual_bound == pytest.approx(OPTIMAL_OBJECTIVE_VALUE)
+    assert result.relative_gap == pytest.approx(0.0)
+
+
+def test_node_limit():
+    result = solve(node_limit=3)
+
+    assert result.status == SolveStatus.NODE_LIMIT
+    assert result.processed_nodes == 3
+    assert result.open_nodes > 0
+    assert result.incumbent is None
+    assert result.dual_bound >= OPTIMAL_OBJECTIVE_VALUE
+    assert math.isinf(result.relative_gap)
+
+
+def test_time_limit():
+    result = solve(time_limit=0.0)
+
+    assert result.status == SolveStatus.TIME_LIMIT
+    assert result.processed_nodes == 0
+    assert result.open_nodes == 1
+    assert result.incumbent is None
+    assert math.isinf(result.dual_bound)
+
+
+def test_gap_limit():
+    result = solve(mip_gap_limit=0.01)
+
+    assert result.status == SolveStatus.GAP_LIMIT
+    assert result.processed_nodes < 7
+    assert result.primal_bound == pytest.approx(OPTIMAL_OBJECTIVE_VALUE)
+    assert OPTIMAL_OBJECTIVE_VALUE < result.dual_bound
+    assert result.relative_gap == pytest.approx((result.dual_bound - result.primal_bound) / result.primal_bound)
+    assert result.relative_gap <= 0.01
+
+
+def test_search_is_finished_if_gap_limit_is_not_reached():
+    result = solve(mip_gap_limit=1e-3)
+
+    assert result.status == SolveStatus.OPTIMAL
+    assert result.processed_nodes == 7
+
+
+def test_callbacks_are_notified_about_improvements():
+    callback = RecordingCallback()
+
+    result = GAPBranchAndPrice(GAP_INSTANCE, callbacks=[callback]).solve()
+
+    assert callback.incumbents == [(4, pytest.approx(OPTIMAL_OBJECTIVE_VALUE))]
+    # the first bound is reported once root is solved, the last one once all nodes are processed
+    nodes, dual_bounds = zip(*callback.dual_bounds)
+    assert nodes[0] == 1
+    assert nodes[-1] == result.processed_nodes
+    assert list(dual_bounds) == sorted(dual_bounds, reverse=True)
+    assert len(set(dual_bounds)) == len(dual_bounds)
+    assert min(dual_bounds) == pytest.approx(OPTIMAL_OBJECTIVE_VALUE)
@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+
+from branch_and_price import GAPBranchAndPrice, ColumnGenerationSettings
+from gap_instances import random_instance
+
+SOURCE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# builds tree from event log given as the first argument while import of gurobipy fails
+BUILD_TREE_WITHOUT_GUROBI = '''
+import json, sys
+sys.modules['gurobipy'] = None
+from render_tree import build_tree
+tree = build_tree(sys.argv[1])
+print(json.dumps({'nodes': tree.number_of_nodes(), 'gurobipy': 'gurobipy.gurobipy' in sys.modules}))
+'''
+
+
+def test_tree_is_built_from_event_log_without_gurobi(tmp_path):
+    path = os.path.join(tmp_path, 'tree.jsonl')
+    gap_instance = random_instance(3, num_machines=5, num_tasks=15)
+    result = GAPBranchAndPrice(gap_instance, ColumnGenerationSettings(tree_event_log_path=path)).solve()
+
+    output = subprocess.run([sys.executable, '-c', BUILD_TREE_WITHOUT_GUROBI, path],
+                            cwd=SOURCE_DIRECTORY,
+                            env=dict(os.environ, PYTHONPATH=SOURCE_DIRECTORY, MPLBACKEND='Agg'),
+                            capture_output=True,
+                            text=True,
+                            check=True).stdout
+
+    assert json.loads(output) == {'nodes': result.processed_nodes, 'gurobipy': False}